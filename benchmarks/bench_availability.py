@@ -0,0 +1,42 @@
+import random
+import time
+from datetime import date, timedelta
+
+from travel_agency.availability import RoomAvailability
+
+
+def run(hotels: int = 1000, horizon_days: int = 365, queries: int = 2000, seed: int = 0):
+    rng = random.Random(seed)
+    start = date.today()
+    availability = RoomAvailability(start, horizon_days)
+    names = [f"Отель {i}" for i in range(hotels)]
+    for name in names:
+        availability.add_hotel("Город", name, rng.randint(1, 20))
+
+    for _ in range(hotels * 5):
+        check_in = start + timedelta(days=rng.randrange(horizon_days - 14))
+        try:
+            availability.reserve([("Город", rng.choice(names), check_in,
+                                   check_in + timedelta(days=rng.randint(1, 14)), 1)])
+        except ValueError:
+            pass
+
+    single = time.perf_counter()
+    for _ in range(queries):
+        check_in = start + timedelta(days=rng.randrange(horizon_days - 14))
+        availability.is_available("Город", rng.choice(names), check_in,
+                                  check_in + timedelta(days=rng.randint(1, 14)), 2)
+    single = (time.perf_counter() - single) / queries
+
+    city = time.perf_counter()
+    for _ in range(queries // 100):
+        check_in = start + timedelta(days=rng.randrange(horizon_days - 14))
+        availability.filter_available("Город", names, check_in, check_in + timedelta(days=7), 2)
+    city = (time.perf_counter() - city) / (queries // 100)
+
+    print(f"горизонт {horizon_days} дней: один отель {single * 1e6:.1f} мкс, "
+          f"{hotels} отелей города {city * 1000:.3f} мс")
+
+
+if __name__ == "__main__":
+    run()
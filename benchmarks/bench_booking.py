@@ -0,0 +1,85 @@
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from travel_agency import TravelService, PaymentStrategy
+
+HOTELS = 5
+ROOMS = 20
+
+
+class CountingPayment(PaymentStrategy):
+    def __init__(self, key: str, approve: bool, charges: Counter, lock: threading.Lock):
+        self.key = key
+        self.approve = approve
+        self.charges = charges
+        self.lock = lock
+
+    def pay(self, amount: float) -> bool:
+        time.sleep(0.0005)
+        if self.approve:
+            with self.lock:
+                self.charges[self.key] += 1
+        return self.approve
+
+
+def run(bookings: int = 5000, threads: int = 32, seed: int = 0):
+    rng = random.Random(seed)
+    service = TravelService()
+    start = service.clock.today() + timedelta(days=30)
+    for i in range(HOTELS):
+        service.add_hotel("Город", {"name": f"Отель {i}", "type": "basic", "price": 1000, "rating": 4.0, "star": 3,
+                                    "rooms": ROOMS})
+
+    charges = Counter()
+    lock = threading.Lock()
+    jobs = []
+    for i in range(bookings):
+        builder = service.create_package_builder("basic")
+        check_in = start + timedelta(days=rng.randrange(90))
+        builder.add_hotel(f"Отель {rng.randrange(HOTELS)}", "Город", check_in,
+                          check_in + timedelta(days=rng.randint(1, 5)), 1000, 4.0, 3)
+        # Каждая пятая заявка повторяет предыдущий ключ, как повторная отправка формы.
+        key = f"key-{i - 1 if i % 5 == 4 else i}"
+        jobs.append((builder.get_package(), key, rng.random() > 0.1))
+
+    def book(job):
+        package, key, approve = job
+        try:
+            return service.booking_service.book(package, CountingPayment(key, approve, charges, lock), key)
+        except ValueError:
+            return None
+
+    elapsed = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(book, jobs))
+    elapsed = time.perf_counter() - elapsed
+
+    confirmed = {booking.idempotency_key: booking for booking in results
+                 if booking is not None and booking.status == "confirmed"}
+    assert all(count == 1 for count in charges.values()), "двойное списание"
+    assert set(charges) == set(confirmed)
+
+    occupied = Counter()
+    for booking in confirmed.values():
+        hotel = booking.package.hotels[0]
+        for night in range((hotel.check_out - hotel.check_in).days):
+            occupied[(hotel.name, hotel.check_in + timedelta(days=night))] += 1
+    for (name, night), count in occupied.items():
+        assert count <= ROOMS, "овербукинг"
+        assert service.availability.is_available("Город", name, night, night + timedelta(days=1), ROOMS - count)
+        assert not service.availability.is_available("Город", name, night, night + timedelta(days=1),
+                                                     ROOMS - count + 1)
+
+    rejected = sum(1 for booking in results if booking is None)
+    print(f"{bookings} бронирований в {threads} потоков за {elapsed:.2f} с: подтверждено {len(confirmed)}, "
+          f"отказов по наличию {rejected}, конфликтов версий {service.booking_service.conflicts}, "
+          f"двойных списаний нет")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
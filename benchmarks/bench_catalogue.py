@@ -0,0 +1,60 @@
+import csv
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from travel_agency import TravelService
+from travel_agency.catalogue import SnapshotInventory, load_inventory, write_snapshot
+from travel_agency.inventory import SEASONS
+
+
+def write_feeds(directory: Path, rows: int, cities: int = 100, seed: int = 0) -> tuple[Path, Path]:
+    rng = random.Random(seed)
+    hotels_path = directory / "hotels.csv"
+    tours_path = directory / "tours.jsonl"
+    with open(hotels_path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["city", "name", "type", "price", "rating", "star", "rooms"])
+        for i in range(rows):
+            writer.writerow([f"Город {i % cities}", f"Отель {i}", rng.choice(["basic", "premium"]),
+                             rng.randint(2000, 30000), round(rng.uniform(3.0, 5.0), 1), rng.randint(2, 5),
+                             rng.randint(1, 50)])
+    with open(tours_path, "w", encoding="utf-8") as file:
+        for i in range(rows):
+            file.write(json.dumps({"city": f"Город {i % cities}", "name": f"Тур {i}", "description": "Экскурсия",
+                                   "price": rng.randint(1000, 6000), "season": rng.choice(SEASONS + ["все"]),
+                                   "type": rng.choice(["basic", "premium"])}, ensure_ascii=False) + "\n")
+    return hotels_path, tours_path
+
+
+def run(rows: int):
+    with tempfile.TemporaryDirectory() as directory:
+        hotels_path, tours_path = write_feeds(Path(directory), rows)
+
+        elapsed = time.perf_counter()
+        inventory = load_inventory(hotels_path, tours_path)
+        print(f"потоковая загрузка {rows} отелей и {rows} туров: {time.perf_counter() - elapsed:.2f} с")
+
+        snapshot_path = Path(directory) / "catalogue.snapshot"
+        elapsed = time.perf_counter()
+        write_snapshot(inventory, snapshot_path)
+        print(f"запись снимка: {time.perf_counter() - elapsed:.2f} с, {snapshot_path.stat().st_size / 2 ** 20:.1f} МБ")
+        del inventory
+
+        elapsed = time.perf_counter()
+        snapshot = SnapshotInventory(snapshot_path)
+        service = TravelService(snapshot)
+        print(f"холодный старт из снимка: {(time.perf_counter() - elapsed) * 1000:.1f} мс")
+
+        elapsed = time.perf_counter()
+        tours = snapshot.get_tours("Город 7", "лето", "basic")
+        print(f"первый запрос: {len(tours)} туров за {(time.perf_counter() - elapsed) * 1000:.1f} мс")
+        del service, tours
+        snapshot.close()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
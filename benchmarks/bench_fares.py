@@ -0,0 +1,46 @@
+import random
+import sys
+import time
+from datetime import timedelta
+
+from travel_agency.service import TravelService
+
+
+def run(quotes: int = 1_000_000, seed: int = 0):
+    rng = random.Random(seed)
+    service = TravelService()
+    fares = service.fares
+    cities = service.cities + ["Ярославль"]
+    today = service.clock.today()
+    requests = [(rng.choice(cities), rng.choice(cities), today + timedelta(days=rng.randrange(400)),
+                 rng.choice(["basic", "premium"]), rng.randrange(5)) for _ in range(10000)]
+
+    elapsed = time.perf_counter()
+    for departure, destination, travel_date, package_type, _ in requests:
+        fares.quote(departure, destination, travel_date, package_type)
+    elapsed = time.perf_counter() - elapsed
+    print(f"Таблицы {len(fares.state[1])} маршрутов построены при первых котировках за {elapsed:.2f} с")
+
+    elapsed = time.perf_counter()
+    for i in range(quotes):
+        fares.quote(*requests[i % len(requests)])
+    elapsed = time.perf_counter() - elapsed
+    print(f"{quotes} котировок за {elapsed:.2f} с ({quotes / elapsed:.0f} в секунду)")
+
+    sales = 100000
+    elapsed = time.perf_counter()
+    for i in range(sales):
+        departure, destination, travel_date, package_type, _ = requests[i % len(requests)]
+        fares.record_sale(departure, destination, travel_date, package_type)
+    elapsed = time.perf_counter() - elapsed
+    print(f"{sales} продаж учтено в таблицах за {elapsed:.2f} с ({sales / elapsed:.0f} в секунду)")
+
+    departure, destination, travel_date, package_type, _ = max(
+        requests, key=lambda request: fares.load_factor(*request[:4]))
+    print(f"Самый загруженный рейс {departure} - {destination} {travel_date}: "
+          f"загрузка {fares.load_factor(departure, destination, travel_date, package_type):.0%}, "
+          f"множители {fares.factors(departure, destination, travel_date, package_type)}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,68 @@
+import random
+import sys
+import time
+
+from travel_agency.fulltext import SearchIndex
+from travel_agency.inventory import Inventory, SEASONS, PACKAGE_TYPES
+
+HOTEL_WORDS = ["Гранд", "Отель", "Волга", "Парк", "Инн", "Империал", "Усадьба", "Хостел", "Resort", "Palace",
+               "Центральная", "Северная", "Речная", "Старый", "Купеческий", "Двор", "Берег", "Ривьера"]
+TOUR_PHRASES = ["Обзорная экскурсия по городу", "Экскурсия в музей", "Музей деревянного зодчества",
+                "Прогулка на катере", "Резиденция Деда Мороза", "Мастер-класс по росписи", "Дегустация сыров",
+                "Пешеходный маршрут по набережной", "Монастыри и храмы", "Вечерняя программа в театре",
+                "Поездка в заповедник", "Исторический квартал", "Зимние забавы", "Морская прогулка"]
+QUERIES = ["музей", "экскурсия музей", "дед мороз", "катер набережная", "масква", "экскурсея", "гранд волга",
+           "монастыри", "заповедника", "купеческий двор"]
+PREFIXES = ["м", "эк", "муз", "резид", "гранд в", "деда мор"]
+
+
+def make_inventory(cities: int, hotels: int, tours: int, seed: int) -> Inventory:
+    rng = random.Random(seed)
+    names = [f"Город {c}" for c in range(cities - 2)] + ["Москва", "Великий Устюг"]
+    hotels_data = {city: [{"name": f"{' '.join(rng.sample(HOTEL_WORDS, 2))} {i}", "type": rng.choice(PACKAGE_TYPES),
+                           "price": rng.randint(2000, 30000), "rating": 4.0, "star": 3} for i in range(hotels)]
+                   for city in names}
+    tours_data = {city: [{"name": f"{rng.choice(TOUR_PHRASES)} {i}",
+                          "description": ". ".join(rng.sample(TOUR_PHRASES, 2)), "price": rng.randint(1000, 6000),
+                          "season": rng.choice(SEASONS + ["все"]), "type": rng.choice(PACKAGE_TYPES)}
+                         for i in range(tours)] for city in names}
+    return Inventory(hotels_data, tours_data)
+
+
+def measure(calls: list, repeat: int = 20) -> tuple[float, float]:
+    latencies = []
+    for _ in range(repeat):
+        for call in calls:
+            start = time.perf_counter()
+            call()
+            latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2] * 1000, latencies[int(len(latencies) * 0.99)] * 1000
+
+
+def run(documents: int = 1_000_000, seed: int = 0):
+    cities = max(2, documents // 1000)
+    inventory = make_inventory(cities, 500, 500, seed)
+
+    elapsed = time.perf_counter()
+    index = SearchIndex.from_inventory(inventory)
+    index.complete("а")
+    elapsed = time.perf_counter() - elapsed
+    print(f"Индекс на {len(index)} документов, {len(index.words)} слов, построен за {elapsed:.1f} с")
+
+    for query in QUERIES:
+        hits = index.search(query, 5)
+        print(f"  {query!r}: {', '.join(f'{hit.kind} {hit.name}' for hit in hits[:3]) or 'ничего'}")
+
+    searches = [lambda query=query: index.search(query) for query in QUERIES]
+    filtered = [lambda query=query: index.search(query, kinds=["tour"], city="Москва") for query in QUERIES]
+    prefixes = [lambda prefix=prefix: index.search(prefix, prefix=True) for prefix in PREFIXES]
+    completions = [lambda prefix=prefix: index.complete(prefix) for prefix in PREFIXES]
+    for name, calls in [("поиск", searches), ("поиск в городе", filtered), ("поиск по началу слова", prefixes),
+                        ("автодополнение", completions)]:
+        p50, p99 = measure(calls)
+        print(f"{name:<22} p50 {p50:6.2f} мс  p99 {p99:6.2f} мс")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
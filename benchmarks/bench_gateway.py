@@ -0,0 +1,48 @@
+import asyncio
+import sys
+import time
+
+from travel_agency.gateway import StubGateway, HttpConnectionPool, GatewayClient, GatewayPayment, GatewayError
+from travel_agency.payment import CreditCard, PayPal, BankTransfer
+
+STRATEGIES = [
+    CreditCard("1234567812345678", "Иван Иванов", "12/30", "123"),
+    PayPal("ivanov.travel"),
+    BankTransfer("40817810000000000001", "Банк"),
+]
+
+
+async def run(payments: int = 500, connections: int = 20, failure_rate: float = 0.1, seed: int = 0):
+    gateway = StubGateway(latency=0.01, failure_rate=failure_rate, limit=150000, seed=seed)
+    port = await gateway.start()
+    pool = HttpConnectionPool("127.0.0.1", port, connections)
+    client = GatewayClient(pool, retries=5, backoff=0.01, breaker_threshold=1000)
+
+    async def pay(i: int):
+        try:
+            return await GatewayPayment(STRATEGIES[i % len(STRATEGIES)], client, f"booking-{i}").pay(50000 + i * 200)
+        except GatewayError:
+            return None
+
+    elapsed = time.perf_counter()
+    results = await asyncio.gather(*(pay(i) for i in range(payments)))
+    elapsed = time.perf_counter() - elapsed
+    # Повторная оплата оплаченных броней идет с их ключами и не создает новых списаний.
+    charged = len(gateway.charges)
+    await asyncio.gather(*(pay(i) for i in range(0, payments, 10) if results[i]))
+    assert len(gateway.charges) == charged, "двойное списание при повторной оплате"
+    await pool.close()
+    await gateway.stop()
+
+    approved = sum(1 for result in results if result)
+    declined = sum(1 for result in results if result is False)
+    failed = sum(1 for result in results if result is None)
+    # Повторы идут с тем же ключом идемпотентности, поэтому списаний не больше, чем одобренных платежей.
+    assert len(gateway.charges) == approved, "двойное списание"
+    print(f"{payments} платежей за {elapsed:.2f} с ({payments / elapsed:.0f} в секунду): одобрено {approved}, "
+          f"отклонено {declined}, ошибок шлюза {failed}; запросов к шлюзу {gateway.requests}, "
+          f"открыто соединений {pool.opened}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
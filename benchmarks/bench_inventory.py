@@ -0,0 +1,57 @@
+import random
+import time
+
+from travel_agency.inventory import Inventory, SEASONS
+
+
+def make_catalogue(rows: int, cities: int = 10, seed: int = 0):
+    rng = random.Random(seed)
+    hotels_data = {}
+    tours_data = {}
+    for i in range(rows):
+        city = f"Город {i % cities}"
+        hotels_data.setdefault(city, []).append(
+            {"name": f"Отель {i}", "type": rng.choice(["basic", "premium"]), "price": rng.randint(2000, 30000),
+             "rating": round(rng.uniform(3.0, 5.0), 1), "star": rng.randint(2, 5)})
+        tours_data.setdefault(city, []).append(
+            {"name": f"Тур {i}", "description": "Экскурсия", "price": rng.randint(1000, 6000),
+             "season": rng.choice(SEASONS + ["все"]), "type": rng.choice(["basic", "premium"])})
+    return hotels_data, tours_data
+
+
+def scan_hotels(hotels_data, city, package_type):
+    return [hotel_data for hotel_data in hotels_data.get(city, []) if package_type == hotel_data["type"]]
+
+
+def scan_tours(tours_data, city, season, package_type):
+    return [tour_data for tour_data in tours_data.get(city, [])
+            if ((package_type == tour_data["type"]) or (package_type == "premium"))
+            and (tour_data["season"] == "все" or tour_data["season"] == season)]
+
+
+def measure(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def run(rows: int, repeat: int = 20):
+    hotels_data, tours_data = make_catalogue(rows)
+    inventory = Inventory(hotels_data, tours_data)
+    city, season, package_type = "Город 3", "лето", "basic"
+
+    assert inventory.get_hotels(city, package_type) == scan_hotels(hotels_data, city, package_type)
+    assert inventory.get_tours(city, season, package_type) == scan_tours(tours_data, city, season, package_type)
+
+    scan = measure(lambda: (scan_hotels(hotels_data, city, package_type),
+                            scan_tours(tours_data, city, season, package_type)), repeat)
+    indexed = measure(lambda: (inventory.get_hotels(city, package_type),
+                               inventory.get_tours(city, season, package_type)), repeat)
+    print(f"{rows:>7} строк: перебор {scan * 1000:8.3f} мс, индекс {indexed * 1000:8.5f} мс, "
+          f"ускорение x{scan / indexed:.0f}")
+
+
+if __name__ == "__main__":
+    for rows in (10_000, 100_000):
+        run(rows)
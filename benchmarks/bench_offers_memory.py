@@ -0,0 +1,101 @@
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+from travel_agency.models import BasicTicket, BasicHotel, BasicTour
+
+DATE_FORWARD = date(2026, 12, 1)
+DATE_BACKWARD = date(2026, 12, 8)
+
+
+# Копии моделей без __slots__, как они были до перехода: атрибуты лежат в __dict__ экземпляра.
+# Наследовать от моделей со слотами нельзя - атрибуты остались бы в слотах родителя.
+class DictTicket:
+    def __init__(self):
+        today = date.today()
+        self.departure: str = ""
+        self.destination: str = ""
+        self.date_forward: date = today
+        self.date_backward: date = today
+        self.price: float = 0.0
+        self.time_forward: str = ""
+        self.time_backward: str = ""
+
+
+class DictHotel:
+    def __init__(self):
+        today = date.today()
+        self.name: str = ""
+        self.city: str = ""
+        self.check_in: date = today
+        self.check_out: date = today
+        self.price: float = 0.0
+        self.rating: float = 0.0
+        self.star: int = 0
+        self.rooms: int = 1
+
+
+class DictTour:
+    def __init__(self):
+        self.name: str = ""
+        self.description: str = ""
+        self.price: float = 0.0
+        self.season: str = ""
+
+
+def fill_ticket(ticket):
+    ticket.departure = "Ярославль"
+    ticket.destination = "Москва"
+    ticket.date_forward = DATE_FORWARD
+    ticket.date_backward = DATE_BACKWARD
+    ticket.price = 40000
+    ticket.time_forward = "10:30"
+    ticket.time_backward = "18:45"
+
+
+def fill_hotel(hotel):
+    hotel.name = "Ибис"
+    hotel.city = "Москва"
+    hotel.check_in = DATE_FORWARD
+    hotel.check_out = DATE_BACKWARD
+    hotel.price = 5000
+    hotel.rating = 4.0
+    hotel.star = 3
+
+
+def fill_tour(tour):
+    tour.name = "Красная площадь"
+    tour.description = "Обзорная экскурсия"
+    tour.price = 2000
+    tour.season = "все"
+
+
+def measure(cls, fill, count: int) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    offers = []
+    for _ in range(count):
+        offer = cls()
+        fill(offer)
+        offers.append(offer)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    list_bytes = sys.getsizeof(offers)
+    del offers
+    return (current - list_bytes) / count, elapsed
+
+
+def run(count: int):
+    for name, slotted, legacy, fill in (("Ticket", BasicTicket, DictTicket, fill_ticket),
+                                        ("Hotel", BasicHotel, DictHotel, fill_hotel),
+                                        ("Tour", BasicTour, DictTour, fill_tour)):
+        slotted_bytes, slotted_time = measure(slotted, fill, count)
+        legacy_bytes, legacy_time = measure(legacy, fill, count)
+        print(f"{name:<6} {count} предложений: __slots__ {slotted_bytes:6.1f} байт ({slotted_time:.2f} с), "
+              f"__dict__ {legacy_bytes:6.1f} байт ({legacy_time:.2f} с)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,54 @@
+import random
+import time
+from datetime import timedelta
+
+from travel_agency import TravelService
+from travel_agency.optimizer import PackageOptimizer, stay_price
+
+
+def make_offers(service: TravelService, count: int, seed: int = 0):
+    rng = random.Random(seed)
+    start = service.clock.today() + timedelta(days=30)
+    end = start + timedelta(days=7)
+    factory = service.factories["basic"]
+    tickets, hotels = [], []
+    for i in range(count):
+        ticket = factory.create_ticket()
+        ticket.departure, ticket.destination, ticket.date_forward, ticket.date_backward = "A", "Москва", start, end
+        ticket.price = rng.randint(5000, 60000)
+        tickets.append(ticket)
+        hotel = factory.create_hotel()
+        hotel.name, hotel.city, hotel.check_in, hotel.check_out = f"Отель {i}", "Москва", start, end
+        hotel.price, hotel.rating, hotel.star = rng.randint(2000, 30000), round(rng.uniform(3, 5), 1), 3
+        hotels.append(hotel)
+    return tickets, hotels
+
+
+def brute_force(tickets, hotels, budget, k, objective):
+    pairs = [(ticket.price + stay_price(hotel), ticket, hotel) for ticket in tickets for hotel in hotels
+             if ticket.price + stay_price(hotel) <= budget]
+    if objective == "price":
+        pairs.sort(key=lambda pair: pair[0])
+    else:
+        pairs.sort(key=lambda pair: (-pair[2].rating, pair[0]))
+    return [pair[0] for pair in pairs[:k]]
+
+
+def run(count: int = 500, k: int = 10):
+    service = TravelService()
+    optimizer = PackageOptimizer(service)
+    tickets, hotels = make_offers(service, count)
+    budget = 100000
+    for objective in ("price", "rating"):
+        elapsed = time.perf_counter()
+        options = optimizer.optimize(tickets, hotels, budget=budget, k=k, objective=objective)
+        elapsed = time.perf_counter() - elapsed
+        brute = time.perf_counter()
+        expected = brute_force(tickets, hotels, budget, k, objective)
+        brute = time.perf_counter() - brute
+        print(f"{objective}: {count}x{count} предложений, top-{k} за {elapsed * 1000:.2f} мс "
+              f"(полный перебор {brute * 1000:.0f} мс), совпадает: {[o.price for o in options] == expected}")
+
+
+if __name__ == "__main__":
+    run()
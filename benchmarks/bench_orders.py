@@ -0,0 +1,69 @@
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+from travel_agency.models import SimCard
+from travel_agency.orders import OrderStore
+from travel_agency.service import TravelService
+
+CUSTOMERS = 10000
+
+
+def make_package(service: TravelService, rng: random.Random):
+    builder = service.create_package_builder("basic")
+    start = service.clock.today() + timedelta(days=30 + rng.randrange(90))
+    end = start + timedelta(days=rng.randint(1, 14))
+    builder.add_ticket("Ярославль", "Москва", start, end, rng.randint(20000, 60000), "10:15", "18:40")
+    builder.add_hotel(f"Отель {rng.randrange(100)}", "Москва", start, end, rng.randint(2000, 9000), 4.2, 4)
+    builder.add_tour("Обзорная экскурсия", "Красная площадь и Кремль", 2500, "зима")
+    builder.add_service(SimCard("Москва", "basic"))
+    return builder.get_package()
+
+
+def run(orders: int = 1_000_000, sync: bool = True, seed: int = 0):
+    rng = random.Random(seed)
+    service = TravelService()
+    packages = [make_package(service, rng) for _ in range(100)]
+    path = tempfile.mkdtemp()
+    try:
+        store = OrderStore(path, sync=sync, snapshot_every=orders // 2)
+        created = service.clock.now()
+        elapsed = time.perf_counter()
+        futures = [store.submit(rng.choice(packages), "basic", f"клиент {rng.randrange(CUSTOMERS)}",
+                                "confirmed", created + timedelta(seconds=i * 30)) for i in range(orders)]
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - elapsed
+        print(f"{orders} заказов записано за {elapsed:.2f} с ({orders / elapsed:.0f} в секунду), "
+              f"пачек с fsync: {store.batches}")
+        store.close()
+
+        elapsed = time.perf_counter()
+        store = OrderStore(path, sync=sync, snapshot_every=orders * 2)
+        elapsed = time.perf_counter() - elapsed
+        assert len(store.orders) == orders
+        print(f"Восстановление {orders} заказов (снимок + журнал {store.log_records} записей): {elapsed:.2f} с")
+
+        elapsed = time.perf_counter()
+        lookups = 1000
+        first_day = created.date()
+        for _ in range(lookups):
+            month = first_day + timedelta(days=31)
+            store.find(f"клиент {rng.randrange(CUSTOMERS)}", month, month + timedelta(days=28))
+            day = first_day + timedelta(days=rng.randrange(300))
+            store.find(start=day, end=day)
+        elapsed = time.perf_counter() - elapsed
+        print(f"Поиск по клиенту и по дате: {elapsed / lookups * 1e6:.0f} мкс на пару запросов")
+
+        order = store.get(futures[-1].result().order_id)
+        assert store.get_package(order).get_total_price() == order.amount
+        store.close()
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
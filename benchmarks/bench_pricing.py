@@ -0,0 +1,36 @@
+import time
+from datetime import timedelta
+
+from travel_agency import (TravelService, PricingEngine, SeasonSurcharge, PremiumMultiplier,
+                           ServiceBundleDiscount)
+
+
+def run(offers: int = 300):
+    service = TravelService()
+    start = service.clock.today() + timedelta(days=30)
+    end = start + timedelta(days=7)
+    tickets = service.generate_ticket_batch([("Ярославль", "Москва", start, end)] * offers, "premium",
+                                            seed=1).to_tickets()[:offers]
+    hotel = service.get_available_hotels("Москва", "premium", start, end)[0]
+    hotels = []
+    for i in range(offers):
+        copy = service.factories["premium"].create_hotel()
+        copy.name, copy.city, copy.check_in, copy.check_out = f"{hotel.name} {i}", hotel.city, start, end
+        copy.price, copy.rating, copy.star = hotel.price + i, hotel.rating, hotel.star
+        hotels.append(copy)
+    services = service.get_available_services("Москва", 7, "premium")
+
+    engine = PricingEngine([
+        SeasonSurcharge(service, {"зима": "12.5", "лето": "20"}),
+        PremiumMultiplier("1.15"),
+        ServiceBundleDiscount(3, "10"),
+    ])
+    elapsed = time.perf_counter()
+    best = engine.cheapest_combinations(tickets, hotels, "premium", start, services=services, k=5)
+    elapsed = time.perf_counter() - elapsed
+    print(f"{len(tickets) * len(hotels)} комбинаций за {elapsed:.3f} с "
+          f"({len(tickets) * len(hotels) / elapsed:,.0f} пакетов/с), самый дешевый: {best[0][0]} руб.")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,34 @@
+import os
+import sys
+import time
+from datetime import timedelta
+
+from travel_agency import TravelService
+from travel_agency.quoting import QuoteRequest, quote_batch
+
+
+def make_requests(count: int) -> list[QuoteRequest]:
+    service = TravelService()
+    cities = service.cities
+    start = service.clock.today() + timedelta(days=30)
+    return [QuoteRequest("Ярославль", cities[i % len(cities)], start + timedelta(days=i % 90),
+                         start + timedelta(days=i % 90 + 3 + i % 7), "premium" if i % 3 == 0 else "basic")
+            for i in range(count)]
+
+
+def run(count: int):
+    requests = make_requests(count)
+    reference = None
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        elapsed = time.perf_counter()
+        quotes = sorted(quote_batch(requests, workers=workers, chunk_size=256, seed=42), key=lambda q: q.index)
+        elapsed = time.perf_counter() - elapsed
+        prices = [q.package.get_total_price() for q in quotes]
+        if reference is None:
+            reference = prices
+        print(f"{workers} процесс(ов): {count / elapsed:,.0f} заявок/с, "
+              f"результат совпадает с 1 процессом: {prices == reference}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
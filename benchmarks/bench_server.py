@@ -0,0 +1,129 @@
+import argparse
+import asyncio
+import random
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+
+from travel_agency.gateway import HttpConnectionPool
+from travel_agency.service import CITIES
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_ready(pool: HttpConnectionPool, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            await pool.request("GET", "/health", {})
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def client(pool: HttpConnectionPool, rng: random.Random, deadline: float, latencies: dict[str, list[float]],
+                 errors: list[int], refusals: list[int]):
+    # Каждый клиент ищет варианты, а каждый пятый поиск доводит до сборки пакета и оплаты.
+    iteration = 0
+    while time.monotonic() < deadline:
+        start = date.today() + timedelta(days=30 + rng.randrange(60))
+        query = {"departure": "Ярославль", "destination": rng.choice(CITIES),
+                 "package_type": rng.choice(["basic", "premium"]), "start_date": start.isoformat(),
+                 "end_date": (start + timedelta(days=rng.randint(2, 10))).isoformat()}
+        status, found = await timed(pool, "/search", query, latencies)
+        iteration += 1
+        if status != 200:
+            errors.append(status)
+            continue
+        if iteration % 5 or not found["hotels"]:
+            continue
+        ticket, hotel = found["tickets"][0], found["hotels"][0]
+        package = {"tickets": [[ticket[field] for field in ("departure", "destination", "date_forward", "date_backward",
+                                                            "price", "time_forward", "time_backward")]],
+                   "hotels": [[hotel[field] for field in ("name", "city", "check_in", "check_out", "price", "rating",
+                                                          "star", "rooms")]],
+                   "tours": [], "services": [item["service"] for item in found["services"][:2]]}
+        status, built = await timed(pool, "/packages", {"package_type": query["package_type"], "package": package},
+                                    latencies)
+        if status != 200:
+            errors.append(status)
+            continue
+        payment = {"package_type": query["package_type"], "package": built["package"], "method": "card",
+                   "details": {"card_number": "1234567812345678", "card_holder": "Иван Иванов",
+                               "expiry_date": "12/30", "cvv": "123"},
+                   "idempotency_key": uuid.uuid4().hex}
+        status, paid = await timed(pool, "/payments", payment, latencies)
+        if status == 409:
+            # Тариф вырос из-за загрузки рейса: клиент соглашается с новой ценой.
+            status, paid = await timed(pool, "/payments", {**payment, "package": paid["package"]}, latencies)
+        # Отказ из-за занятых номеров - нормальный ответ, а не ошибка сервиса.
+        if status == 400 and "номер" in paid["error"]:
+            refusals.append(status)
+        elif status != 200:
+            errors.append(status)
+
+
+async def timed(pool: HttpConnectionPool, path: str, payload: dict, latencies: dict[str, list[float]]):
+    start = time.perf_counter()
+    status, response = await pool.request("POST", path, payload)
+    latencies.setdefault(path, []).append(time.perf_counter() - start)
+    return status, response
+
+
+async def load(host: str, port: int, connections: int, duration: float, seed: int):
+    pool = HttpConnectionPool(host, port, connections)
+    await wait_ready(pool)
+    latencies: dict[str, list[float]] = {}
+    errors: list[int] = []
+    refusals: list[int] = []
+    deadline = time.monotonic() + duration
+    started = time.perf_counter()
+    await asyncio.gather(*(client(pool, random.Random(f"{seed}:{i}"), deadline, latencies, errors, refusals)
+                           for i in range(connections)))
+    elapsed = time.perf_counter() - started
+    await pool.close()
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"{total} запросов за {elapsed:.1f} с: {total / elapsed:.0f} запр/с, соединений {pool.opened}, "
+          f"ошибок {len(errors)}, отказов в брони из-за занятых номеров {len(refusals)}")
+    for path, values in sorted(latencies.items()):
+        values.sort()
+        print(f"  {path:<10} {len(values):>7} запр.  p50 {values[len(values) // 2] * 1000:7.2f} мс  "
+              f"p99 {values[min(len(values) - 1, int(len(values) * 0.99))] * 1000:7.2f} мс")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Нагрузочный клиент для travel_agency.server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="порт запущенного сервиса; без него сервис запускается локально")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        server = subprocess.Popen([sys.executable, "-m", "travel_agency.server", "--port", str(port),
+                                   "--workers", str(args.workers)])
+    try:
+        asyncio.run(load(args.host, port, args.connections, args.duration, args.seed))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import sys
+import time
+from datetime import timedelta
+
+from travel_agency import TravelService
+
+
+def run(queries_count: int):
+    service = TravelService()
+    start = service.clock.today() + timedelta(days=30)
+    queries = [("Ярославль", service.cities[i % len(service.cities)], start + timedelta(days=i % 60),
+                start + timedelta(days=i % 60 + 7)) for i in range(queries_count)]
+
+    loop = time.perf_counter()
+    looped = sum(len(service.generate_tickets(*query, "basic")) for query in queries)
+    loop = time.perf_counter() - loop
+
+    batch = time.perf_counter()
+    tickets = service.generate_ticket_batch(queries, "basic", seed=1)
+    batch = time.perf_counter() - batch
+
+    print(f"{queries_count} запросов: generate_tickets {looped / loop:,.0f} билетов/с, "
+          f"generate_ticket_batch {len(tickets) / batch:,.0f} билетов/с")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,40 @@
+import time
+from datetime import timedelta
+
+from travel_agency import TravelService
+from travel_agency.tracing import tracer
+
+
+def measure(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def run(repeat: int = 20000):
+    service = TravelService(cache_size=0)
+    travel_date = service.clock.today() + timedelta(days=30)
+
+    def query():
+        service.get_available_tours("Москва", "premium", travel_date)
+
+    undecorated = TravelService.get_available_tours.__wrapped__
+    plain = measure(lambda: undecorated(service, "Москва", "premium", travel_date), repeat)
+    tracer.enabled = False
+    disabled = measure(query, repeat)
+    tracer.enabled = True
+    enabled = measure(query, repeat)
+    tracer.start_profiler()
+    profiled = measure(query, repeat)
+    tracer.shutdown()
+    tracer.enabled = False
+    hot = tracer.profiler.top(1)[0]
+    print(f"get_available_tours: без обертки {plain * 1e6:.2f} мкс, трассировка выключена {disabled * 1e6:.2f} мкс, "
+          f"включена {enabled * 1e6:.2f} мкс, с профилировщиком {profiled * 1e6:.2f} мкс")
+    print(f"Вызовов в гистограмме: {tracer.stats['service.get_available_tours'].count}, "
+          f"самая частая строка профиля: {hot[0]} ({hot[1]} срезов)")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,195 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+from travel_agency import TravelService
+from travel_agency.inventory import Inventory, SEASONS, PACKAGE_TYPES
+from travel_agency.randomness import SeededRandomSource, FixedClock
+
+# Время сервиса в прогонах фиксировано, чтобы сезоны и сроки до вылета совпадали с базовым прогоном.
+DEFAULT_NOW = datetime(2026, 1, 1, 12, 0)
+METRICS = ["p50_us", "peak_kb"]
+
+
+def make_inventory(cities: int, hotels: int, tours: int, seed: int) -> Inventory:
+    rng = random.Random(seed)
+    hotels_data = {}
+    tours_data = {}
+    for c in range(cities):
+        city = f"Город {c}"
+        hotels_data[city] = [{"name": f"Отель {c}-{i}", "type": rng.choice(PACKAGE_TYPES),
+                              "price": rng.randint(2000, 30000), "rating": round(rng.uniform(3.0, 5.0), 1),
+                              "star": rng.randint(2, 5), "rooms": rng.randint(1, 50)} for i in range(hotels)]
+        tours_data[city] = [{"name": f"Тур {c}-{i}", "description": "Экскурсия", "price": rng.randint(1000, 6000),
+                             "season": rng.choice(SEASONS + ["все"]), "type": rng.choice(PACKAGE_TYPES)}
+                            for i in range(tours)]
+    return Inventory(hotels_data, tours_data)
+
+
+def random_trip(service: TravelService, rng: random.Random) -> tuple[str, str, date, date]:
+    start = service.clock.today() + timedelta(days=rng.randrange(365))
+    return rng.choice(service.cities), rng.choice(PACKAGE_TYPES), start, start + timedelta(days=rng.randint(1, 14))
+
+
+def build_package(service: TravelService, rng: random.Random):
+    city, package_type, start, end = random_trip(service, rng)
+    builder = service.create_package_builder(package_type)
+    builder.add_ticket("Ярославль", city, start, end, rng.randint(20000, 200000), "10:15", "18:40")
+    builder.add_hotel(f"Отель {city}", city, start, end, rng.randint(2000, 30000), 4.5, 4)
+    for i in range(3):
+        builder.add_tour(f"Тур {i}", "Экскурсия", rng.randint(1000, 6000), service.get_season(start))
+    for service_item in service.get_available_services(city, (end - start).days, package_type):
+        builder.add_service(service_item)
+    return builder.get_package()
+
+
+def prepare_tickets(service: TravelService, rng: random.Random, n: int) -> list[Callable]:
+    calls = []
+    for _ in range(n):
+        city, package_type, start, end = random_trip(service, rng)
+        calls.append(partial(service.generate_tickets, "Ярославль", city, start, end, package_type))
+    return calls
+
+
+def prepare_hotels(service: TravelService, rng: random.Random, n: int) -> list[Callable]:
+    calls = []
+    for _ in range(n):
+        city, package_type, start, end = random_trip(service, rng)
+        calls.append(partial(service.get_available_hotels, city, package_type, start, end))
+    return calls
+
+
+def prepare_tours(service: TravelService, rng: random.Random, n: int) -> list[Callable]:
+    calls = []
+    for _ in range(n):
+        city, package_type, start, _ = random_trip(service, rng)
+        calls.append(partial(service.get_available_tours, city, package_type, start))
+    return calls
+
+
+def prepare_packages(service: TravelService, rng: random.Random, n: int) -> list[Callable]:
+    seeds = [rng.random() for _ in range(n)]
+    return [partial(build_package, service, random.Random(seed)) for seed in seeds]
+
+
+def prepare_descriptions(service: TravelService, rng: random.Random, n: int) -> list[Callable]:
+    # Описание кешируется в пакете, поэтому каждый вызов получает свой пакет.
+    return [build_package(service, rng).get_description for _ in range(n)]
+
+
+CASES = {
+    "generate_tickets": prepare_tickets,
+    "get_available_hotels": prepare_hotels,
+    "get_available_tours": prepare_tours,
+    "get_package": prepare_packages,
+    "get_description": prepare_descriptions,
+}
+
+
+def percentile(values: list[float], q: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def run_case(name: str, service: TravelService, seed: int, iterations: int) -> dict:
+    prepare = CASES[name]
+    for call in prepare(service, random.Random(seed), max(1, iterations // 10)):
+        call()
+
+    calls = prepare(service, random.Random(seed), iterations)
+    latencies = []
+    clock = time.perf_counter_ns
+    started = clock()
+    for call in calls:
+        start = clock()
+        call()
+        latencies.append(clock() - start)
+    total = (clock() - started) / 1e9
+    latencies.sort()
+
+    # Память меряется отдельным проходом: tracemalloc сильно замедляет вызовы.
+    calls = prepare(service, random.Random(seed), max(1, iterations // 10))
+    peak = 0
+    tracemalloc.start()
+    for call in calls:
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        call()
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+
+    return {"iterations": iterations, "total_s": round(total, 4), "throughput": round(iterations / total, 1),
+            "p50_us": round(percentile(latencies, 0.5) / 1000, 2),
+            "p90_us": round(percentile(latencies, 0.9) / 1000, 2),
+            "p99_us": round(percentile(latencies, 0.99) / 1000, 2), "max_us": round(latencies[-1] / 1000, 2),
+            "peak_kb": round(peak / 1024, 1)}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        for metric in METRICS:
+            if old[metric] and result[metric] > old[metric] * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {old[metric]} -> {result[metric]}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки поиска и сборки пакетов TravelService")
+    parser.add_argument("--cities", type=int, default=100)
+    parser.add_argument("--hotels", type=int, default=50, help="отелей в городе")
+    parser.add_argument("--tours", type=int, default=50, help="туров в городе")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--now", type=datetime.fromisoformat, default=DEFAULT_NOW,
+                        help="время сервиса в ISO 8601, от него отсчитываются даты поездок")
+    parser.add_argument("--cache-size", type=int, default=0, help="размер кеша поиска, 0 - без кеша")
+    parser.add_argument("--case", action="append", choices=list(CASES), help="запустить только эти сценарии")
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.json"))
+    parser.add_argument("--baseline", type=Path, help="файл с прошлыми результатами для сравнения")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="допустимое ухудшение, доля")
+    args = parser.parse_args(argv)
+
+    inventory = make_inventory(args.cities, args.hotels, args.tours, args.seed)
+    service = TravelService(inventory, cache_size=args.cache_size, random_source=SeededRandomSource(args.seed),
+                            clock=FixedClock(args.now))
+    results = {}
+    for name in args.case or CASES:
+        results[name] = result = run_case(name, service, args.seed, args.iterations)
+        print(f"{name:<22} {result['throughput']:>10.0f} оп/с  p50 {result['p50_us']:>9.1f} мкс  "
+              f"p99 {result['p99_us']:>9.1f} мкс  пик памяти {result['peak_kb']:>8.1f} КБ")
+
+    report = {
+        "meta": {"created": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+                 "platform": platform.platform(), "cities": args.cities, "hotels": args.hotels, "tours": args.tours,
+                 "iterations": args.iterations, "seed": args.seed, "cache_size": args.cache_size,
+                 "now": args.now.isoformat()},
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        for key in ("cities", "hotels", "tours", "cache_size", "now"):
+            if baseline["meta"].get(key) != report["meta"][key]:
+                print(f"Внимание: в базовом прогоне {key}={baseline['meta'][key]}, сейчас {report['meta'][key]}")
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"Регрессия: {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
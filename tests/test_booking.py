@@ -0,0 +1,131 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from travel_agency.payment import PaymentStrategy
+from travel_agency.randomness import FixedClock
+from travel_agency.service import TravelService
+
+TODAY = date(2026, 3, 1)
+CHECK_IN = TODAY + timedelta(days=30)
+CHECK_OUT = CHECK_IN + timedelta(days=3)
+
+
+class CountingPayment(PaymentStrategy):
+    def __init__(self, approve: bool = True, delay: float = 0.0):
+        self.approve = approve
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def pay(self, amount: float) -> bool:
+        with self.lock:
+            self.calls += 1
+        if self.delay:
+            threading.Event().wait(self.delay)
+        return self.approve
+
+
+class FailingPayment(PaymentStrategy):
+    def pay(self, amount: float) -> bool:
+        raise ConnectionError("шлюз недоступен")
+
+
+@pytest.fixture
+def service():
+    service = TravelService(clock=FixedClock(datetime.combine(TODAY, datetime.min.time())))
+    service.add_hotel("Ярославль", {"name": "Волга", "type": "basic", "price": 3000, "rating": 4.1, "star": 3,
+                                    "rooms": 5})
+    return service
+
+
+def make_package(service: TravelService, rooms: int = 1):
+    builder = service.create_package_builder("basic")
+    builder.add_hotel("Волга", "Ярославль", CHECK_IN, CHECK_OUT, 3000, 4.1, 3, rooms)
+    return builder.get_package()
+
+
+def free_rooms(service: TravelService) -> int:
+    return min(service.availability.free_rooms[("Ярославль", "Волга")][30:33])
+
+
+def test_same_key_charges_once(service):
+    payment = CountingPayment()
+    first = service.booking_service.book(make_package(service), payment, "key-1")
+    second = service.booking_service.book(make_package(service), payment, "key-1")
+    assert first is second
+    assert first.status == "confirmed"
+    assert payment.calls == 1
+    assert free_rooms(service) == 4
+
+
+def test_same_key_from_threads_charges_once(service):
+    payment = CountingPayment(delay=0.01)
+    with ThreadPoolExecutor(16) as executor:
+        bookings = list(executor.map(lambda _: service.booking_service.book(make_package(service), payment, "key-1"),
+                                     range(16)))
+    assert len({booking.booking_id for booking in bookings}) == 1
+    assert payment.calls == 1
+    assert free_rooms(service) == 4
+
+
+def test_no_overbooking_under_threads(service):
+    payment = CountingPayment()
+
+    def book(i: int) -> str:
+        try:
+            return service.booking_service.book(make_package(service), payment, f"key-{i}").status
+        except ValueError:
+            return "sold out"
+
+    with ThreadPoolExecutor(32) as executor:
+        statuses = list(executor.map(book, range(200)))
+    assert statuses.count("confirmed") == 5
+    assert statuses.count("sold out") == 195
+    assert payment.calls == 5
+    assert free_rooms(service) == 0
+
+
+def test_no_overbooking_with_several_rooms(service):
+    payment = CountingPayment()
+
+    def book(i: int) -> str:
+        try:
+            return service.booking_service.book(make_package(service, rooms=2), payment, f"key-{i}").status
+        except ValueError:
+            return "sold out"
+
+    with ThreadPoolExecutor(32) as executor:
+        statuses = list(executor.map(book, range(50)))
+    assert statuses.count("confirmed") == 2
+    assert free_rooms(service) == 1
+
+
+def test_declined_payment_releases_rooms(service):
+    booking = service.booking_service.book(make_package(service), CountingPayment(approve=False), "key-1")
+    assert booking.status == "failed"
+    assert free_rooms(service) == 5
+    # Неудачная попытка не запоминается, ключ можно использовать снова.
+    assert service.booking_service.book(make_package(service), CountingPayment(), "key-1").status == "confirmed"
+
+
+def test_payment_error_releases_rooms(service):
+    with pytest.raises(ConnectionError):
+        service.booking_service.book(make_package(service), FailingPayment(), "key-1")
+    assert free_rooms(service) == 5
+    assert "key-1" not in service.booking_service.in_progress
+
+
+def test_booking_invalidates_only_its_city_in_hotel_cache(service):
+    service.get_available_hotels("Ярославль", "basic", CHECK_IN, CHECK_OUT, rooms=5)
+    service.get_available_hotels("Москва", "basic", CHECK_IN, CHECK_OUT)
+    misses = service.search_cache.stats()["misses"]
+    service.booking_service.book(make_package(service), CountingPayment(), "key-1")
+    assert service.get_available_hotels("Москва", "basic", CHECK_IN, CHECK_OUT)
+    assert service.search_cache.stats()["misses"] == misses
+    # Бронь в Ярославле меняет ответ, поэтому его кеш устаревает.
+    hotels = service.get_available_hotels("Ярославль", "basic", CHECK_IN, CHECK_OUT, rooms=5)
+    assert "Волга" not in [hotel.name for hotel in hotels]
+    assert service.search_cache.stats()["misses"] == misses + 1
@@ -0,0 +1,60 @@
+from travel_agency.cache import SearchCache
+
+
+class ManualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entry_expires_after_ttl():
+    clock = ManualClock()
+    cache = SearchCache(ttl=10, clock=clock)
+    cache.put("key", 1)
+    clock.now = 9.9
+    assert cache.get("key") == 1
+    clock.now = 10
+    assert cache.get("key") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 0}
+
+
+def test_per_entry_ttl_overrides_default():
+    clock = ManualClock()
+    cache = SearchCache(ttl=10, clock=clock)
+    cache.put("short", 1, ttl=1)
+    cache.put("long", 2)
+    clock.now = 5
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SearchCache(max_size=2, clock=ManualClock())
+    cache.put("a", 1)
+    cache.put("b", 2)
+    # Чтение делает "a" свежее "b", поэтому вытесняется "b".
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 2
+
+
+def test_get_or_compute_computes_once_until_expiry():
+    clock = ManualClock()
+    cache = SearchCache(ttl=10, clock=clock)
+    calls = []
+
+    def compute():
+        calls.append(clock.now)
+        return len(calls)
+
+    assert cache.get_or_compute("key", compute) == 1
+    assert cache.get_or_compute("key", compute) == 1
+    clock.now = 10
+    assert cache.get_or_compute("key", compute) == 2
+    assert calls == [0.0, 10]
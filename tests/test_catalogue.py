@@ -0,0 +1,77 @@
+import csv
+import json
+
+from travel_agency.catalogue import SnapshotInventory, load_inventory, read_records, write_snapshot
+
+HOTELS = [
+    {"city": "Москва", "name": "Космос", "type": "basic", "price": 4500, "rating": 4.2, "star": 3, "rooms": 12},
+    {"city": "Москва", "name": "Метрополь", "type": "premium", "price": 18999.5, "rating": 4.9, "star": 5,
+     "rooms": 4},
+    {"city": "Казань", "name": "Волга", "type": "basic", "price": 3200, "rating": 3.8, "star": 2, "rooms": 20},
+]
+TOURS = [
+    {"city": "Москва", "name": "Кремль", "description": "Обзорная экскурсия", "price": 1500, "season": "все",
+     "type": "basic"},
+    {"city": "Казань", "name": "Свияжск", "description": "Остров-град", "price": 2750.25, "season": "лето",
+     "type": "premium"},
+]
+
+
+def write_csv(path, records):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=list(records[0]))
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def write_jsonl(path, records):
+    with open(path, "w", encoding="utf-8") as file:
+        for record in records:
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        file.write("\n")
+
+
+def catalogue(inventory):
+    return sorted(map(repr, inventory.iter_hotels())), sorted(map(repr, inventory.iter_tours()))
+
+
+def expected():
+    hotels = [(record["city"], {k: v for k, v in record.items() if k != "city"}) for record in HOTELS]
+    tours = [(record["city"], {k: v for k, v in record.items() if k != "city"}) for record in TOURS]
+    return sorted(map(repr, hotels)), sorted(map(repr, tours))
+
+
+def test_csv_and_jsonl_read_the_same_catalogue(tmp_path):
+    write_csv(tmp_path / "hotels.csv", HOTELS)
+    write_csv(tmp_path / "tours.csv", TOURS)
+    write_jsonl(tmp_path / "hotels.jsonl", HOTELS)
+    write_jsonl(tmp_path / "tours.jsonl", TOURS)
+    from_csv = load_inventory(tmp_path / "hotels.csv", tmp_path / "tours.csv")
+    from_jsonl = load_inventory(tmp_path / "hotels.jsonl", tmp_path / "tours.jsonl")
+    assert catalogue(from_csv) == catalogue(from_jsonl) == expected()
+
+
+def test_read_records_is_lazy(tmp_path):
+    path = tmp_path / "hotels.jsonl"
+    write_jsonl(path, HOTELS)
+    records = read_records(path)
+    assert next(records) == HOTELS[0]
+    # Запись, дописанная после начала чтения, тоже попадает в поток.
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(json.dumps(HOTELS[0], ensure_ascii=False) + "\n")
+    assert list(records) == HOTELS[1:] + HOTELS[:1]
+
+
+def test_snapshot_round_trip(tmp_path):
+    write_csv(tmp_path / "hotels.csv", HOTELS)
+    write_jsonl(tmp_path / "tours.jsonl", TOURS)
+    inventory = load_inventory(tmp_path / "hotels.csv", tmp_path / "tours.jsonl")
+    write_snapshot(inventory, tmp_path / "catalogue.bin")
+    snapshot = SnapshotInventory(tmp_path / "catalogue.bin")
+    try:
+        assert catalogue(snapshot) == expected()
+        assert snapshot.get_hotels("Москва", "premium") == inventory.get_hotels("Москва", "premium")
+        assert snapshot.get_tours("Москва", "зима", "basic") == inventory.get_tours("Москва", "зима", "basic")
+        assert snapshot.find_hotel("Казань", "Волга") == inventory.find_hotel("Казань", "Волга")
+    finally:
+        snapshot.close()
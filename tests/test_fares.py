@@ -0,0 +1,30 @@
+from datetime import date, datetime, timedelta
+
+from travel_agency.randomness import FixedClock
+from travel_agency.service import TravelService
+
+TODAY = date(2026, 3, 1)
+FLIGHT = ("Ярославль", "Анапа", TODAY + timedelta(days=20), "basic")
+
+
+def test_day_change_replaces_start_and_tables_together():
+    clock = FixedClock(datetime.combine(TODAY, datetime.min.time()))
+    fares = TravelService(clock=clock).fares
+    before = fares.quote(*FLIGHT)
+    old_start, old_tables = fares.state
+    clock.moment += timedelta(days=10)
+    # До вылета остается 10 дней вместо 20, цена пересчитывается в новой таблице от новой даты.
+    assert fares.quote(*FLIGHT) > before
+    start, tables = fares.state
+    assert (old_start, start) == (TODAY, TODAY + timedelta(days=10))
+    assert ("Ярославль", "Анапа", "basic") in old_tables and tables is not old_tables
+    assert fares.factors(*FLIGHT)["advance"] == 1.15
+
+
+def test_sale_updates_the_current_table():
+    clock = FixedClock(datetime.combine(TODAY, datetime.min.time()))
+    fares = TravelService(clock=clock).fares
+    fares.quote(*FLIGHT)
+    fares.record_sale(*FLIGHT, seats=fares.capacity["basic"])
+    assert fares.factors(*FLIGHT)["load"] == 2.00
+    assert fares.quote(*FLIGHT) == fares.quote(*FLIGHT, sold=fares.capacity["basic"])
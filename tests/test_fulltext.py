@@ -0,0 +1,68 @@
+from travel_agency.fulltext import SearchIndex, stem, trigrams
+from travel_agency.inventory import Inventory
+
+HOTELS = {
+    "Москва": [{"name": "Космос", "type": "basic", "price": 4500, "rating": 4.2, "star": 3},
+               {"name": "Москва Сити", "type": "premium", "price": 15000, "rating": 4.8, "star": 5}],
+    "Мостовское": [{"name": "Горный", "type": "basic", "price": 2500, "rating": 3.9, "star": 2}],
+}
+TOURS = {
+    "Москва": [{"name": "Музеи Кремля", "description": "Экскурсия по музеям", "price": 1500, "season": "все",
+                "type": "basic"}],
+    "Ярославль": [{"name": "Ночной Ярославль", "description": "Прогулка по набережной и музей", "price": 900,
+                   "season": "лето", "type": "basic"}],
+}
+
+
+def make_index() -> SearchIndex:
+    return SearchIndex.from_inventory(Inventory(HOTELS, TOURS))
+
+
+def test_word_forms_share_a_stem():
+    assert stem("музей") == stem("музея") == stem("музеев") == stem("музеям")
+    assert trigrams("дом") == {"  д", " до", "дом", "ом "}
+
+
+def test_search_matches_every_word_in_document_order():
+    index = make_index()
+    hits = index.search("музеи")
+    assert [(hit.kind, hit.name) for hit in hits] == [("tour", "Музеи Кремля"), ("tour", "Ночной Ярославль")]
+    assert [hit.name for hit in index.search("музей ярославль")] == ["Ночной Ярославль"]
+    assert index.search("музей космос") == []
+
+
+def test_kind_and_city_filters():
+    index = make_index()
+    assert [(hit.kind, hit.name) for hit in index.search("москва", kinds=["city"])] == [("city", "Москва")]
+    assert [hit.name for hit in index.search("москва", kinds=["hotel"])] == ["Космос", "Москва Сити"]
+    assert [hit.name for hit in index.search("музей", city="Ярославль")] == ["Ночной Ярославль"]
+    assert index.search("музей", city="Казань") == []
+
+
+def test_similar_ranks_closest_word_first():
+    index = make_index()
+    assert index.similar("масква")[0] == "москва"
+    assert index.similar("ярославл")[0] == "ярославль"
+    assert index.similar("абвгд") == []
+
+
+def test_fuzzy_search_only_replaces_unknown_words():
+    index = make_index()
+    assert [hit.name for hit in index.search("масква", kinds=["city"])] == ["Москва"]
+    assert index.search("масква", fuzzy=False) == []
+
+
+def test_completion_prefers_frequent_words():
+    index = make_index()
+    # "москва" встречается в четырех документах, "мостовское" в двух.
+    assert index.complete("мо") == ["москва", "мостовское"]
+    assert index.complete("мос", limit=1) == ["москва"]
+    assert [hit.name for hit in index.search("кос", prefix=True)] == ["Космос"]
+
+
+def test_added_words_are_searchable():
+    index = make_index()
+    index.add_hotel("Казань", {"name": "Казанская", "type": "basic", "price": 3000, "rating": 4.0, "star": 3})
+    assert sorted(index.complete("каз")) == ["казанская", "казань"]
+    assert [hit.name for hit in index.search("казанская")] == ["Казанская"]
+    assert len(index) == len(make_index()) + 2
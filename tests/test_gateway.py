@@ -0,0 +1,178 @@
+import asyncio
+
+import pytest
+
+from travel_agency.gateway import (StubGateway, HttpConnectionPool, GatewayClient, GatewayPayment, GatewayError,
+                                   GatewayUnavailable, CircuitBreaker)
+from travel_agency.payment import CreditCard
+
+CARD = CreditCard("1234567812345678", "Иван Иванов", "12/30", "123")
+
+
+async def with_gateway(check, failure_rate: float = 0.0, latency: float = 0.001, **client_options):
+    gateway = StubGateway(latency=latency, failure_rate=failure_rate, limit=100_000, seed=1)
+    port = await gateway.start()
+    pool = HttpConnectionPool("127.0.0.1", port, 4)
+    client = GatewayClient(pool, **{"backoff": 0.001, **client_options})
+    try:
+        return await check(gateway, client)
+    finally:
+        await pool.close()
+        await gateway.stop()
+
+
+def test_retries_after_server_errors():
+    async def check(gateway, client):
+        results = await asyncio.gather(*(GatewayPayment(CARD, client, f"booking-{i}").pay(1000) for i in range(50)))
+        assert all(results)
+        assert gateway.requests > 50
+        assert len(gateway.charges) == 50
+
+    asyncio.run(with_gateway(check, failure_rate=0.3, retries=10, breaker_threshold=1000))
+
+
+def test_declined_payment_is_not_retried():
+    async def check(gateway, client):
+        assert await GatewayPayment(CARD, client, "booking-1").pay(200_000) is False
+        assert gateway.requests == 1
+        assert gateway.charges == {}
+
+    asyncio.run(with_gateway(check))
+
+
+def test_repeated_payment_with_same_key_charges_once():
+    async def check(gateway, client):
+        payment = GatewayPayment(CARD, client, "booking-1")
+        assert await payment.pay(1000)
+        assert await payment.pay(1000)
+        assert await GatewayPayment(CARD, client, "booking-1").pay(1000)
+        assert gateway.requests == 3
+        assert gateway.charges == {"booking-1": 1000}
+
+    asyncio.run(with_gateway(check))
+
+
+def test_gives_up_after_retries():
+    async def check(gateway, client):
+        with pytest.raises(GatewayError):
+            await GatewayPayment(CARD, client, "booking-1").pay(1000)
+        assert gateway.requests == 3
+
+    asyncio.run(with_gateway(check, failure_rate=1.0, retries=2, breaker_threshold=1000))
+
+
+def test_open_breaker_rejects_without_requests():
+    async def check(gateway, client):
+        with pytest.raises(GatewayError):
+            await GatewayPayment(CARD, client, "booking-1").pay(1000)
+        requests = gateway.requests
+        with pytest.raises(GatewayUnavailable):
+            await GatewayPayment(CARD, client, "booking-2").pay(1000)
+        assert gateway.requests == requests
+
+    asyncio.run(with_gateway(check, failure_rate=1.0, retries=5, breaker_threshold=3, breaker_reset=60.0))
+
+
+def test_half_open_breaker_allows_single_probe():
+    async def check(gateway, client):
+        breaker = client.breakers["card"]
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        breaker.opened_at -= breaker.reset_timeout
+        gateway.failure_rate = 0.0
+        results = await asyncio.gather(*(GatewayPayment(CARD, client, f"booking-{i}").pay(1000) for i in range(5)),
+                                       return_exceptions=True)
+        assert results[0] is True
+        assert all(isinstance(result, GatewayUnavailable) for result in results[1:])
+        assert gateway.requests == 1
+        # Удачная проба закрывает выключатель.
+        assert await GatewayPayment(CARD, client, "booking-5").pay(1000)
+
+    asyncio.run(with_gateway(check, latency=0.05, retries=0, breaker_threshold=2, breaker_reset=60.0))
+
+
+def test_failed_probe_reopens_breaker():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.allow()
+    breaker.opened_at -= 60.0
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+    breaker.opened_at -= 60.0
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.allow() and breaker.allow()
+
+
+async def serve_first_with(gateway, client, response: bytes):
+    # Первое соединение получает response и закрывается, остальные обслуживает шлюз.
+    original = gateway.handle
+    broken = []
+
+    async def handle(reader, writer):
+        if not broken:
+            broken.append(writer)
+            await reader.readline()
+            writer.write(response)
+            await writer.drain()
+            writer.close()
+            return
+        await original(reader, writer)
+
+    gateway.handle = handle
+    gateway.server.close()
+    await gateway.server.wait_closed()
+    gateway.server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    client.pool.port = gateway.server.sockets[0].getsockname()[1]
+
+
+def test_connection_closed_mid_response_is_retried():
+    async def check(gateway, client):
+        await serve_first_with(gateway, client, b"HTTP/1.1 200 OK\r\nContent-Length: 100\r\n\r\n{\"appr")
+        assert await GatewayPayment(CARD, client, "booking-1").pay(1000)
+        assert gateway.charges == {"booking-1": 1000}
+
+    asyncio.run(with_gateway(check, retries=2))
+
+
+def test_non_json_error_body_is_gateway_failure():
+    async def check(gateway, client):
+        await serve_first_with(gateway, client,
+                               b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 13\r\n\r\n<html></html>")
+        with pytest.raises(GatewayError):
+            await GatewayPayment(CARD, client, "booking-1").pay(1000)
+        assert client.breakers["card"].failures == 1
+        assert await GatewayPayment(CARD, client, "booking-1").pay(1000)
+        assert gateway.charges == {"booking-1": 1000}
+
+    asyncio.run(with_gateway(check, retries=0))
+
+
+def test_non_json_error_body_is_retried():
+    async def check(gateway, client):
+        await serve_first_with(gateway, client,
+                               b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 13\r\n\r\n<html></html>")
+        assert await GatewayPayment(CARD, client, "booking-1").pay(1000)
+        assert gateway.charges == {"booking-1": 1000}
+
+    asyncio.run(with_gateway(check, retries=2))
+
+
+def test_stale_keep_alive_connection_is_not_a_failure():
+    async def check(gateway, client):
+        assert await GatewayPayment(CARD, client, "booking-1").pay(1000)
+        # Шлюз закрывает простаивающие соединения, клиент узнает об этом только при следующем запросе.
+        for writer in gateway.connections.values():
+            writer.close()
+        await asyncio.sleep(0.01)
+        assert await GatewayPayment(CARD, client, "booking-2").pay(1000)
+        assert client.pool.opened == 2
+        assert gateway.requests == 2
+        assert not client.breakers["card"].opened_at
+
+    asyncio.run(with_gateway(check, retries=0, breaker_threshold=1))
@@ -0,0 +1,50 @@
+import os
+import time
+
+import pytest
+
+# Миниатюры строятся через Pillow, без него ядро работает, а эти тесты пропускаются.
+Image = pytest.importorskip("PIL.Image")
+images_module = pytest.importorskip("travel_agency.images")
+CityImages = images_module.CityImages
+
+
+@pytest.fixture
+def images(tmp_path):
+    images_dir = tmp_path / "images"
+    images_dir.mkdir()
+    for city in ("Москва", "Санкт-Петербург"):
+        Image.new("RGB", (64, 48), color="white").save(images_dir / f"{city}.jpg")
+    return CityImages(images_dir, tmp_path / "cache")
+
+
+def test_prepare_builds_missing_thumbnails_once(images):
+    assert images.prepare(["Москва", "Санкт-Петербург", "Казань"]) == (2, 0)
+    assert images.prepare(["Москва", "Санкт-Петербург"]) == (0, 0)
+    assert images.thumbnail_path("Москва").exists()
+
+
+def test_prepare_removes_only_stale_versions_of_requested_cities(images):
+    images.prepare(["Москва", "Санкт-Петербург"])
+    stale = images.cache_dir / "Москва-1-1-470x600.jpg"
+    stale_other = images.cache_dir / "Санкт-Петербург-1-1-600x400.jpg"
+    foreign = images.cache_dir / "Казань-1-1-600x400.jpg"
+    for path in (stale, stale_other, foreign):
+        path.write_bytes(b"")
+    assert images.prepare(["Москва"]) == (0, 1)
+    assert not stale.exists()
+    # Другие города могут принадлежать другой копии приложения с тем же кешем.
+    assert stale_other.exists() and foreign.exists()
+    assert images.thumbnail_path("Москва").exists()
+
+
+def test_prepare_removes_abandoned_temporary_files(images):
+    images.cache_dir.mkdir()
+    fresh = images.cache_dir / ".Москва-1-1-470x600.jpg.100.200"
+    abandoned = images.cache_dir / ".Казань-1-1-600x400.jpg.100.300"
+    for path in (fresh, abandoned):
+        path.write_bytes(b"")
+    old = time.time() - images_module.TEMPORARY_MAX_AGE - 1
+    os.utime(abandoned, (old, old))
+    assert images.prepare([]) == (0, 1)
+    assert fresh.exists() and not abandoned.exists()
@@ -0,0 +1,69 @@
+import random
+
+from travel_agency.catalogue import SnapshotInventory, write_snapshot
+from travel_agency.inventory import Inventory, SEASONS, PACKAGE_TYPES
+
+
+def make_catalogue(rows: int = 500, cities: int = 7, seed: int = 0):
+    rng = random.Random(seed)
+    hotels_data, tours_data = {}, {}
+    for i in range(rows):
+        city = f"Город {i % cities}"
+        hotels_data.setdefault(city, []).append(
+            {"name": f"Отель {i}", "type": rng.choice(PACKAGE_TYPES), "price": rng.randint(2000, 30000),
+             "rating": round(rng.uniform(3.0, 5.0), 1), "star": rng.randint(2, 5), "rooms": rng.randint(1, 30)})
+        tours_data.setdefault(city, []).append(
+            {"name": f"Тур {i}", "description": "Экскурсия", "price": rng.randint(1000, 6000),
+             "season": rng.choice(SEASONS + ["все"]), "type": rng.choice(PACKAGE_TYPES)})
+    return hotels_data, tours_data
+
+
+# Отбор перебором, как в исходном TravelService до появления индексов.
+def scan_hotels(hotels_data: dict, city: str, package_type: str) -> list[dict]:
+    return [hotel_data for hotel_data in hotels_data.get(city, []) if package_type == hotel_data["type"]]
+
+
+def scan_tours(tours_data: dict, city: str, season: str, package_type: str) -> list[dict]:
+    return [tour_data for tour_data in tours_data.get(city, [])
+            if ((package_type == tour_data["type"]) or (package_type == "premium"))
+            and (tour_data["season"] == "все" or tour_data["season"] == season)]
+
+
+def queries(hotels_data: dict):
+    for city in [*hotels_data, "Нет такого"]:
+        for package_type in PACKAGE_TYPES:
+            for season in SEASONS:
+                yield city, season, package_type
+
+
+def test_index_matches_scan():
+    hotels_data, tours_data = make_catalogue()
+    inventory = Inventory(hotels_data, tours_data)
+    for city, season, package_type in queries(hotels_data):
+        assert inventory.get_hotels(city, package_type) == scan_hotels(hotels_data, city, package_type)
+        assert inventory.get_tours(city, season, package_type) == scan_tours(tours_data, city, season, package_type)
+
+
+def test_index_matches_scan_after_additions():
+    hotels_data, tours_data = make_catalogue(100)
+    inventory = Inventory(hotels_data, tours_data)
+    extra_hotels, extra_tours = make_catalogue(50, cities=9, seed=1)
+    for city, city_hotels in extra_hotels.items():
+        for hotel_data in city_hotels:
+            inventory.add_hotel(city, dict(hotel_data, name=f"Новый {hotel_data['name']}"))
+    for city, city_tours in extra_tours.items():
+        for tour_data in city_tours:
+            inventory.add_tour(city, tour_data)
+    for city, season, package_type in queries(hotels_data):
+        assert inventory.get_hotels(city, package_type) == scan_hotels(hotels_data, city, package_type)
+        assert inventory.get_tours(city, season, package_type) == scan_tours(tours_data, city, season, package_type)
+    assert inventory.find_hotel("Город 8", "Новый Отель 8")["price"] == extra_hotels["Город 8"][0]["price"]
+
+
+def test_snapshot_matches_scan(tmp_path):
+    hotels_data, tours_data = make_catalogue()
+    write_snapshot(Inventory(hotels_data, tours_data), tmp_path / "catalogue.snapshot")
+    snapshot = SnapshotInventory(tmp_path / "catalogue.snapshot")
+    for city, season, package_type in queries(hotels_data):
+        assert snapshot.get_hotels(city, package_type) == scan_hotels(hotels_data, city, package_type)
+        assert snapshot.get_tours(city, season, package_type) == scan_tours(tours_data, city, season, package_type)
@@ -0,0 +1,62 @@
+from datetime import date, datetime, timedelta
+from itertools import product
+
+import pytest
+
+from travel_agency.optimizer import PackageOptimizer, stay_price
+from travel_agency.randomness import FixedClock, SeededRandomSource
+from travel_agency.service import TravelService
+
+TODAY = date(2026, 3, 1)
+START = TODAY + timedelta(days=30)
+END = START + timedelta(days=5)
+
+
+@pytest.fixture
+def service():
+    return TravelService(random_source=SeededRandomSource(3),
+                         clock=FixedClock(datetime.combine(TODAY, datetime.min.time())))
+
+
+def offers(service):
+    tickets = service.generate_tickets("Ярославль", "Москва", START, END, "premium")
+    hotels = service.get_available_hotels("Москва", "premium", START, END)
+    return tickets, hotels
+
+
+def test_top_k_matches_full_enumeration(service):
+    tickets, hotels = offers(service)
+    prices = sorted(ticket.price + stay_price(hotel) for ticket, hotel in product(tickets, hotels))
+    options = PackageOptimizer(service).optimize(tickets, hotels, k=5)
+    assert [option.price for option in options] == prices[:5]
+
+
+def test_budget_limits_options(service):
+    tickets, hotels = offers(service)
+    prices = sorted(ticket.price + stay_price(hotel) for ticket, hotel in product(tickets, hotels))
+    budget = prices[len(prices) // 2]
+    options = PackageOptimizer(service).optimize(tickets, hotels, budget=budget, k=len(prices))
+    assert [option.price for option in options] == [price for price in prices if price <= budget]
+    assert PackageOptimizer(service).optimize(tickets, hotels, budget=prices[0] - 1) == []
+
+
+def test_build_package_matches_option(service):
+    tickets, hotels = offers(service)
+    tours = service.get_available_tours("Москва", "premium", START)[:2]
+    optimizer = PackageOptimizer(service)
+    option = optimizer.optimize(tickets, hotels, required_tours=tours, k=1)[0]
+    package = optimizer.build_package(option, "premium")
+    assert package.get_total_price() == pytest.approx(option.price)
+    ticket, = package.tickets
+    assert (ticket.departure, ticket.destination, ticket.price, ticket.time_forward) == (
+        option.ticket.departure, option.ticket.destination, option.ticket.price, option.ticket.time_forward)
+    hotel, = package.hotels
+    assert (hotel.name, hotel.check_in, hotel.check_out, hotel.rooms) == (
+        option.hotel.name, option.hotel.check_in, option.hotel.check_out, option.hotel.rooms)
+    assert [tour.name for tour in package.tours] == [tour.name for tour in tours]
+    assert option.hotel.name in package.get_description()
+
+
+def test_unknown_objective_is_rejected(service):
+    with pytest.raises(ValueError):
+        PackageOptimizer(service).optimize([], [], objective="distance")
@@ -0,0 +1,148 @@
+import shutil
+from datetime import date, datetime
+
+import pytest
+
+from travel_agency.factories import BasicTravel
+from travel_agency.models import SimCard
+from travel_agency.orders import OrderStore
+from travel_agency.package import TravelPackageBuilder
+
+CREATED = datetime(2026, 3, 1, 12, 0)
+
+
+def make_package(price: float = 3000):
+    builder = TravelPackageBuilder(BasicTravel())
+    builder.add_ticket("Ярославль", "Москва", date(2026, 4, 1), date(2026, 4, 5), 20000, "10:15", "18:40")
+    builder.add_hotel("Ибис", "Москва", date(2026, 4, 1), date(2026, 4, 5), price, 4.0, 3, 2)
+    builder.add_tour("Красная площадь", "Обзорная экскурсия", 2000, "весна")
+    builder.add_service(SimCard("Москва", "basic"))
+    return builder.get_package()
+
+
+def place_orders(store: OrderStore, count: int, start: int = 0):
+    for i in range(start, start + count):
+        store.place(make_package(3000 + i), "basic", f"client-{i % 3}", "paid", CREATED, f"order-{i}")
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return tmp_path / "orders"
+
+
+def test_recovery_drops_torn_tail(store_path):
+    store = OrderStore(store_path, sync=False)
+    place_orders(store, 10)
+    store.close()
+    log_path = store_path / "orders.log"
+    valid_size = log_path.stat().st_size
+    with open(log_path, "ab") as log:
+        log.write(b'{"seq": 11, "op": "put", "id": "order-torn", "cust')
+
+    store = OrderStore(store_path, sync=False)
+    assert len(store.orders) == 10
+    assert store.get("order-torn") is None
+    assert log_path.stat().st_size == valid_size
+    # После обрезки журнала новые записи дописываются к целым строкам.
+    place_orders(store, 1, start=10)
+    store.close()
+
+    store = OrderStore(store_path, sync=False)
+    assert len(store.orders) == 11
+    assert store.seq == 11
+    assert store.get_package(store.get("order-10")).get_total_price() == make_package(3010).get_total_price()
+    store.close()
+
+
+def test_recovery_stops_at_corrupt_line(store_path):
+    store = OrderStore(store_path, sync=False)
+    place_orders(store, 5)
+    store.close()
+    log_path = store_path / "orders.log"
+    with open(log_path, "ab") as log:
+        log.write(b"not a record\n")
+
+    store = OrderStore(store_path, sync=False)
+    assert len(store.orders) == 5
+    assert log_path.read_bytes().endswith(b"\n")
+    assert b"not a record" not in log_path.read_bytes()
+    store.close()
+
+
+def test_recovery_stops_at_status_of_missing_order(store_path):
+    store = OrderStore(store_path, sync=False)
+    place_orders(store, 5)
+    store.close()
+    log_path = store_path / "orders.log"
+    valid_size = log_path.stat().st_size
+    with open(log_path, "ab") as log:
+        log.write(b'{"seq": 6, "op": "status", "id": "order-missing", "status": "cancelled"}\t\n')
+
+    store = OrderStore(store_path, sync=False)
+    assert len(store.orders) == 5
+    assert store.seq == 5
+    assert log_path.stat().st_size == valid_size
+    store.close()
+
+
+def test_failed_apply_resolves_every_waiter(store_path, monkeypatch):
+    store = OrderStore(store_path, sync=False)
+    apply = store._apply
+
+    def failing_apply(line, source, offset, after_seq=-1):
+        if b"order-bad" in line:
+            raise RuntimeError("сбой применения")
+        return apply(line, source, offset, after_seq)
+
+    monkeypatch.setattr(store, "_apply", failing_apply)
+    # Пока блокировка занята, писатель не сбрасывает пачку, и обе записи обычно попадают в одну.
+    with store.lock:
+        bad = store.submit(make_package(), "basic", "client-0", "paid", CREATED, "order-bad")
+        good = store.submit(make_package(), "basic", "client-0", "paid", CREATED, "order-good")
+    with pytest.raises(RuntimeError):
+        bad.result(timeout=5)
+    assert good.result(timeout=5).order_id == "order-good"
+    assert store.place(make_package(), "basic", "client-1", "paid", CREATED, "order-next").order_id == "order-next"
+    store.close()
+
+
+def test_compaction_keeps_orders_and_statuses(store_path):
+    store = OrderStore(store_path, sync=False, snapshot_every=8)
+    place_orders(store, 20)
+    store.update_status("order-3", "cancelled")
+    store.compact()
+    assert store.log_records == 0
+    assert (store_path / "orders.log").stat().st_size == 0
+    place_orders(store, 2, start=20)
+    store.close()
+
+    store = OrderStore(store_path, sync=False)
+    assert len(store.orders) == 22
+    assert store.get("order-3").status == "cancelled"
+    assert [order.order_id for order in store.find(customer="client-0")][:3] == ["order-0", "order-3", "order-6"]
+    package = store.get_package(store.get("order-5"))
+    assert package.get_total_price() == make_package(3005).get_total_price()
+    assert [service.get_description() for service in package.services] == \
+           [service.get_description() for service in make_package().services]
+    store.close()
+
+
+def test_crash_between_snapshot_and_log_truncation(store_path):
+    store = OrderStore(store_path, sync=False)
+    place_orders(store, 6)
+    store.close()
+    log_path = store_path / "orders.log"
+    log_copy = store_path.parent / "orders.log.copy"
+    shutil.copy(log_path, log_copy)
+
+    store = OrderStore(store_path, sync=False)
+    store.compact()
+    store.close()
+    # Снимок уже подменен, а журнал не очищен: его записи не должны примениться второй раз.
+    shutil.copy(log_copy, log_path)
+
+    store = OrderStore(store_path, sync=False)
+    assert len(store.orders) == 6
+    assert len(store.find(customer="client-0")) == 2
+    assert len(store.find(start=CREATED.date(), end=CREATED.date())) == 6
+    store.close()
@@ -0,0 +1,97 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from travel_agency.pagination import PaginatedSearch, decode_cursor, encode_cursor, ticket_key
+from travel_agency.randomness import FixedClock, SeededRandomSource
+from travel_agency.service import TravelService
+
+TODAY = date(2026, 3, 1)
+START = TODAY + timedelta(days=30)
+END = START + timedelta(days=5)
+
+
+def all_pages(search: PaginatedSearch, page) -> list:
+    items = list(page.items)
+    while page.cursor:
+        page = search.next_page(page.cursor)
+        items.extend(page.items)
+    return items
+
+
+@pytest.mark.parametrize("random_source", [SeededRandomSource(7), None])
+def test_ticket_pages_continue_one_set(random_source):
+    service = TravelService(random_source=random_source,
+                            clock=FixedClock(datetime.combine(TODAY, datetime.min.time())))
+    search = PaginatedSearch(service, page_size=1)
+    first = search.search_tickets("Ярославль", "Москва", START, END, "basic")
+    tickets = all_pages(search, first)
+    keys = [ticket_key(ticket) for ticket in tickets]
+    assert keys == sorted(set(keys))
+    # Без воспроизводимого источника все страницы строятся от сида из курсора.
+    seed = decode_cursor(first.cursor)["query"][5] if first.cursor else None
+    assert keys == [ticket_key(ticket) for ticket in search.iter_tickets("Ярославль", "Москва", START, END, "basic",
+                                                                          seed)]
+    assert (seed is None) == (random_source is not None)
+
+
+def test_ticket_pages_match_generate_tickets():
+    service = TravelService(random_source=SeededRandomSource(7),
+                            clock=FixedClock(datetime.combine(TODAY, datetime.min.time())))
+    search = PaginatedSearch(service, page_size=2)
+    tickets = all_pages(search, search.search_tickets("Ярославль", "Москва", START, END, "premium"))
+    generated = service.generate_tickets("Ярославль", "Москва", START, END, "premium")
+    assert [ticket_key(ticket) for ticket in tickets] == sorted(ticket_key(ticket) for ticket in generated)
+    assert {type(ticket) for ticket in tickets} == {type(ticket) for ticket in generated}
+
+
+def hotel_service() -> TravelService:
+    service = TravelService(random_source=SeededRandomSource(7),
+                            clock=FixedClock(datetime.combine(TODAY, datetime.min.time())))
+    for i in range(7):
+        service.add_hotel("Ярославль", {"name": f"Отель {i}", "type": "basic", "price": 3000 + 500 * (i % 4),
+                                        "rating": 4.0, "star": 3})
+    return service
+
+
+def test_hotel_pages_follow_price_order_across_additions():
+    service = hotel_service()
+    search = PaginatedSearch(service, page_size=3)
+    first = search.search_hotels("Ярославль", "basic", START, END)
+    names = [hotel.name for hotel in first.items]
+    # Отели, добавленные между страницами, попадают в выдачу только после курсора.
+    service.add_hotel("Ярославль", {"name": "Дешевый", "type": "basic", "price": 100, "rating": 4.0, "star": 3})
+    service.add_hotel("Ярославль", {"name": "Дорогой", "type": "basic", "price": 9000, "rating": 4.0, "star": 3})
+    names += [hotel.name for hotel in all_pages(search, search.next_page(first.cursor))]
+    expected = [hotel.name for hotel in sorted(service.get_available_hotels("Ярославль", "basic", START, END),
+                                               key=lambda hotel: (hotel.price, hotel.name))]
+    expected.remove("Дешевый")
+    assert names == expected
+
+
+@pytest.mark.parametrize("field, value", [
+    ("package_type", "luxury"),
+    ("order", "distance"),
+    ("rooms", "два"),
+    ("after", ["дешевле", 1]),
+    ("limit", 0),
+    ("start_date", "вчера"),
+])
+def test_tampered_cursor_is_rejected(field, value):
+    search = PaginatedSearch(hotel_service(), page_size=2)
+    state = decode_cursor(search.search_hotels("Ярославль", "basic", START, END).cursor)
+    positions = {"package_type": 1, "start_date": 2, "order": 4, "rooms": 5}
+    if field in positions:
+        state["query"][positions[field]] = value
+    else:
+        state[field] = value
+    with pytest.raises(ValueError, match="Неверный курсор"):
+        search.next_page(encode_cursor(state))
+
+
+def test_tampered_ticket_cursor_is_rejected():
+    search = PaginatedSearch(TravelService(), page_size=1)
+    state = decode_cursor(search.search_tickets("Ярославль", "Москва", START, END, "basic").cursor)
+    state["query"][4] = "luxury"
+    with pytest.raises(ValueError, match="Неверный курсор"):
+        search.next_page(encode_cursor(state))
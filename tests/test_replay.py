@@ -0,0 +1,53 @@
+import hashlib
+import io
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from travel_agency.randomness import FixedClock, SeededRandomSource
+from travel_agency.replay import main, read_log, replay
+from travel_agency.server import SearchRecorder, TravelHandler, serve
+from travel_agency.service import TravelService
+
+STARTED = datetime(2026, 5, 31, 23, 58)
+
+
+def search_payload(destination: str, start: date) -> dict:
+    return {"departure": "Ярославль", "destination": destination, "package_type": "basic",
+            "start_date": start.isoformat(), "end_date": (start + timedelta(days=3)).isoformat()}
+
+
+def test_replay_matches_recording_across_midnight(tmp_path):
+    log_path = tmp_path / "search.log"
+    clock = FixedClock(STARTED)
+    service = TravelService(random_source=SeededRandomSource(42), clock=clock)
+    recorder = SearchRecorder(log_path, 42, clock.now())
+    handler = TravelHandler(service, recorder=recorder)
+    expected = hashlib.sha256()
+    for minutes, destination in [(0, "Москва"), (1, "Анапа"), (3, "Москва"), (5, "Анапа")]:
+        # Запросы до и после полуночи: меняется срок до вылета, а с ним и цены билетов.
+        clock.moment = STARTED + timedelta(minutes=minutes)
+        status, response = handler.dispatch("POST", "/search", json.dumps(
+            search_payload(destination, date(2026, 6, 3))).encode("utf-8"))
+        expected.update(json.dumps({"status": status, "response": response}, ensure_ascii=False, sort_keys=True,
+                                   default=str).encode("utf-8") + b"\n")
+    recorder.close()
+
+    assert replay(log_path, io.BytesIO()) == expected.hexdigest()
+    # Без --output ответы никуда не пишутся, но хеш тот же.
+    assert main([str(log_path), "--expect", expected.hexdigest()]) == 0
+
+
+@pytest.mark.parametrize("header", ['{"seed": 42}', '{"now": "2026-05-31T23:58:00"}', '[42]', 'не json', ''])
+def test_log_without_header_is_rejected(tmp_path, header):
+    log_path = tmp_path / "search.log"
+    log_path.write_text(header + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="нет заголовка"):
+        read_log(log_path)
+
+
+def test_recording_requires_several_workers(tmp_path):
+    with pytest.raises(ValueError):
+        serve(port=0, workers=1, record_path=str(tmp_path / "search.log"))
+    assert not (tmp_path / "search.log").exists()
@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+
+from travel_agency.availability import RoomAvailability
+from travel_agency.factories import BasicTravel
+from travel_agency.optimizer import stay_price
+from travel_agency.package import TravelPackageBuilder
+from travel_agency.pricing import PricingEngine
+
+TODAY = date(2026, 3, 1)
+CHECK_IN = TODAY + timedelta(days=10)
+CHECK_OUT = CHECK_IN + timedelta(days=3)
+
+
+def make_package(rooms: int):
+    builder = TravelPackageBuilder(BasicTravel())
+    builder.add_hotel("Волга", "Ярославль", CHECK_IN, CHECK_OUT, 3000, 4.1, 3, rooms)
+    return builder.get_package()
+
+
+def test_every_room_is_charged():
+    package = make_package(rooms=2)
+    hotel = package.hotels[0]
+    assert hotel.get_total_price() == 3000 * 3 * 2
+    assert package.get_total_price() == 18000
+    assert stay_price(hotel) == 18000
+    assert PricingEngine().item_price(hotel) == 18000 * 100
+    assert "× 2 номеров: 18000 руб." in hotel.get_description()
+
+
+def test_single_room_description_unchanged():
+    hotel = make_package(rooms=1).hotels[0]
+    assert hotel.get_total_price() == 9000
+    assert "номеров" not in hotel.get_description()
+
+
+def booked(rooms_total: int, booked_rooms: int) -> RoomAvailability:
+    availability = RoomAvailability(TODAY, 30)
+    availability.add_hotel("Ярославль", "Волга", rooms_total)
+    availability.reserve([("Ярославль", "Волга", CHECK_IN, CHECK_OUT, booked_rooms)])
+    return availability
+
+
+def test_re_adding_hotel_keeps_bookings():
+    availability = booked(5, 3)
+    availability.add_hotel("Ярославль", "Волга", 5)
+    assert availability.is_available("Ярославль", "Волга", CHECK_IN, CHECK_OUT, 2)
+    assert not availability.is_available("Ярославль", "Волга", CHECK_IN, CHECK_OUT, 3)
+
+
+def test_re_adding_hotel_with_more_rooms_adds_free_rooms():
+    availability = booked(5, 3)
+    availability.add_hotel("Ярославль", "Волга", 8)
+    assert availability.is_available("Ярославль", "Волга", CHECK_IN, CHECK_OUT, 5)
+    assert not availability.is_available("Ярославль", "Волга", CHECK_IN, CHECK_OUT, 6)
+    assert availability.is_available("Ярославль", "Волга", CHECK_OUT, CHECK_OUT + timedelta(days=1), 8)
+
+
+def test_re_adding_hotel_with_fewer_rooms_never_goes_negative():
+    availability = booked(5, 3)
+    versions = availability.check([("Ярославль", "Волга", CHECK_IN, CHECK_OUT, 1)])[1]
+    availability.add_hotel("Ярославль", "Волга", 2)
+    assert not availability.is_available("Ярославль", "Волга", CHECK_IN, CHECK_OUT, 1)
+    assert availability.is_available("Ярославль", "Волга", CHECK_OUT, CHECK_OUT + timedelta(days=1), 2)
+    assert availability.check([("Ярославль", "Волга", CHECK_IN, CHECK_OUT, 0)])[1] != versions
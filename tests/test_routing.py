@@ -0,0 +1,56 @@
+from datetime import date, datetime, timedelta
+from itertools import permutations
+
+import pytest
+
+from travel_agency.randomness import FixedClock, SeededRandomSource
+from travel_agency.routing import FlightGraph, ItineraryPlanner
+from travel_agency.service import TravelService
+
+TODAY = date(2026, 3, 1)
+START = TODAY + timedelta(days=30)
+
+
+@pytest.fixture
+def service():
+    return TravelService(random_source=SeededRandomSource(5),
+                         clock=FixedClock(datetime.combine(TODAY, datetime.min.time())))
+
+
+def path_cost(graph: FlightGraph, path: list[str]) -> float:
+    return sum(graph.edge_weight(city, next_city, "basic", "price") for city, next_city in zip(path, path[1:]))
+
+
+def test_shortest_path_is_cheapest_simple_path(service):
+    graph = FlightGraph.from_cities(service.cities + ["Ярославль"], service.fares)
+    path, cost = graph.shortest_path("Анапа", "Архангельск")
+    assert cost == pytest.approx(path_cost(graph, path))
+    # Перебор всех путей с не более чем двумя пересадками.
+    others = [city for city in graph.routes if city not in ("Анапа", "Архангельск")]
+    for n in range(3):
+        for middle in permutations(others, n):
+            candidate = ["Анапа", *middle, "Архангельск"]
+            if all(b in graph.routes[a] for a, b in zip(candidate, candidate[1:])):
+                assert path_cost(graph, candidate) >= cost - 1e-6
+
+
+def test_legs_are_priced_with_service_tickets(service):
+    planner = ItineraryPlanner(service, departure_cities=["Ярославль"])
+    itinerary = planner.plan(["Ярославль", "Анапа", "Ярославль"], START, [4, 0])
+    first, back = itinerary.legs
+    return_date = START + timedelta(days=4)
+    for leg in itinerary.legs:
+        assert [ticket.departure for ticket in leg.tickets] == leg.path[:-1]
+        assert [ticket.destination for ticket in leg.tickets] == leg.path[1:]
+        for ticket in leg.tickets:
+            offers = service.generate_tickets(ticket.departure, ticket.destination, leg.travel_date, return_date,
+                                              "basic")
+            assert ticket.price == min(offer.price for offer in offers)
+        assert leg.price == sum(ticket.price for ticket in leg.tickets)
+    assert back.travel_date == return_date
+    assert itinerary.get_total_price() == first.price + back.price + first.hotel.get_total_price()
+
+
+def test_departure_city_must_be_given(service):
+    with pytest.raises(ValueError, match="Ярославль"):
+        ItineraryPlanner(service).plan(["Ярославль", "Москва"], START, [2])
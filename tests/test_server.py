@@ -0,0 +1,189 @@
+import asyncio
+import json
+import subprocess
+import sys
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from travel_agency.gateway import GatewayClient, HttpConnectionPool, StubGateway
+from travel_agency.randomness import FixedClock, SeededRandomSource
+from travel_agency.server import TravelHandler
+from travel_agency.service import TravelService
+
+TODAY = date(2026, 3, 1)
+START = TODAY + timedelta(days=30)
+END = START + timedelta(days=4)
+# Мест в рейсах одного дня класса premium: 3 рейса по 150.
+PREMIUM_SEATS = 450
+CARD = {"card_number": "1234567812345678", "card_holder": "Иван Иванов", "expiry_date": "12/30", "cvv": "123"}
+
+
+@pytest.fixture
+def handler():
+    service = TravelService(random_source=SeededRandomSource(1),
+                            clock=FixedClock(datetime.combine(TODAY, datetime.min.time())))
+    return TravelHandler(service)
+
+
+def call(handler: TravelHandler, path: str, payload: dict) -> tuple[int, dict]:
+    # Ответ проходит через JSON, как и по HTTP: даты становятся строками.
+    status, response = handler.dispatch("POST", path, json.dumps(payload).encode("utf-8"))
+    return status, json.loads(json.dumps(response, default=str))
+
+
+def found_package(handler: TravelHandler) -> dict:
+    status, found = call(handler, "/search", {"departure": "Ярославль", "destination": "Москва",
+                                              "package_type": "premium", "start_date": START.isoformat(),
+                                              "end_date": END.isoformat()})
+    assert status == 200
+    ticket, hotel, tour = found["tickets"][0], found["hotels"][0], found["tours"][0]
+    return {"tickets": [[ticket[field] for field in ("departure", "destination", "date_forward", "date_backward",
+                                                     "price", "time_forward", "time_backward")]],
+            "hotels": [[hotel[field] for field in ("name", "city", "check_in", "check_out", "price", "rating",
+                                                   "star", "rooms")]],
+            "tours": [[tour[field] for field in ("name", "description", "price", "season")]],
+            "services": [item["service"] for item in found["services"]]}
+
+
+def build(handler: TravelHandler, package: dict) -> tuple[int, dict]:
+    return call(handler, "/packages", {"package_type": "premium", "package": package})
+
+
+def test_searched_package_is_accepted(handler):
+    package = found_package(handler)
+    status, built = build(handler, package)
+    assert status == 200
+    assert built["package"]["hotels"] == package["hotels"]
+    # Описание тура сервер берет из каталога, остальные поля совпадают.
+    assert [tour[::2] for tour in built["package"]["tours"]] == [tour[::2] for tour in package["tours"]]
+
+
+def test_client_prices_are_replaced(handler):
+    package = found_package(handler)
+    expected = build(handler, package)[1]["total_price"]
+    package["hotels"][0][4] = 1
+    package["hotels"][0][5] = 5.0
+    package["tours"][0][2] = 1
+    status, built = build(handler, package)
+    assert status == 200
+    assert built["total_price"] == expected
+
+
+def test_rooms_multiply_catalogue_price(handler):
+    package = found_package(handler)
+    single = build(handler, package)[1]["total_price"]
+    package["hotels"][0][7] = 3
+    nightly = package["hotels"][0][4]
+    assert build(handler, package)[1]["total_price"] == single + 2 * 4 * nightly
+
+
+@pytest.mark.parametrize("field, index, value", [
+    ("tickets", 4, 1),
+    ("hotels", 0, "Несуществующий"),
+    ("hotels", 7, 0),
+    ("hotels", 7, -2),
+    ("tours", 0, "Несуществующий тур"),
+])
+def test_unknown_or_invalid_offers_are_rejected(handler, field, index, value):
+    package = found_package(handler)
+    package[field][0][index] = value
+    status, response = build(handler, package)
+    assert status == 400
+    assert response["error"]
+
+
+def test_unavailable_service_is_rejected(handler):
+    package = found_package(handler)
+    package["services"].append(["guide", "Москва", "китайский"])
+    assert build(handler, package)[0] == 400
+    package["services"][-1] = ["sim", "Анапа", "basic"]
+    assert build(handler, package)[0] == 400
+
+
+def test_payment_charges_repriced_amount(handler):
+    package = found_package(handler)
+    expected = build(handler, package)[1]["total_price"]
+    package["hotels"][0][4] = 1
+    status, paid = call(handler, "/payments", {"package_type": "premium", "package": package, "method": "card",
+                                               "details": CARD, "idempotency_key": "booking-1"})
+    assert status == 200
+    assert paid["status"] == "confirmed"
+    assert paid["amount"] == expected
+
+
+def test_payment_is_charged_through_gateway(handler):
+    package = found_package(handler)
+    expected = build(handler, package)[1]["total_price"]
+    payload = {"package_type": "premium", "package": package, "method": "card", "details": CARD,
+               "idempotency_key": "booking-1"}
+
+    async def pay():
+        gateway = StubGateway(latency=0.001, limit=expected)
+        handler.gateway = GatewayClient(HttpConnectionPool("127.0.0.1", await gateway.start()))
+        server = await asyncio.start_server(handler.handle, "127.0.0.1", 0)
+        pool = HttpConnectionPool("127.0.0.1", server.sockets[0].getsockname()[1])
+        try:
+            paid = await pool.request("POST", "/payments", payload)
+            # Сумма выше лимита шлюза: он отклоняет списание, бронь не подтверждается.
+            package["hotels"][0][7] = 2
+            declined = await pool.request("POST", "/payments", {**payload, "idempotency_key": "booking-2"})
+            return paid, declined, gateway.charges
+        finally:
+            await pool.close()
+            server.close()
+            await handler.close()
+            await server.wait_closed()
+            await gateway.stop()
+
+    (status, paid), (_, declined), charges = asyncio.run(pay())
+    assert status == 200
+    assert paid["status"] == "confirmed"
+    assert declined["status"] == "failed"
+    assert charges == {"booking-1": expected}
+
+
+def test_load_surcharge_reaches_clients_of_other_workers():
+    # Воркеры котируют без учета продаж, продажи видит только процесс бронирования.
+    # Рейсы одного дня продаются до порога загрузки, дальше оплата по цене воркера
+    # получает 409 с текущим тарифом, и оплата по нему проходит.
+    server = subprocess.Popen([sys.executable, "-m", "travel_agency.server", "--port", "0", "--workers", "2",
+                               "--seed", "1"], stdout=subprocess.PIPE, text=True)
+    try:
+        port = int(server.stdout.readline().split("http://", 1)[1].split()[0].rsplit(":", 1)[1].rstrip(","))
+        start = date.today() + timedelta(days=40)
+
+        async def sell():
+            pool = HttpConnectionPool("127.0.0.1", port, 1)
+            try:
+                _, found = await pool.request("POST", "/search", {
+                    "departure": "Ярославль", "destination": "Москва", "package_type": "premium",
+                    "start_date": start.isoformat(), "end_date": (start + timedelta(days=4)).isoformat()})
+                ticket = found["tickets"][0]
+                package = {"tickets": [[ticket[field] for field in ("departure", "destination", "date_forward",
+                                                                    "date_backward", "price", "time_forward",
+                                                                    "time_backward")]],
+                           "hotels": [], "tours": [], "services": []}
+                statuses = []
+                for i in range(PREMIUM_SEATS // 2 + 1):
+                    payment = {"package_type": "premium", "package": package, "method": "card", "details": CARD,
+                               "idempotency_key": f"booking-{i}"}
+                    status, paid = await pool.request("POST", "/payments", payment)
+                    statuses.append(status)
+                    if status == 409:
+                        accepted = await pool.request("POST", "/payments", {**payment, "package": paid["package"]})
+                        return ticket["price"], statuses, paid, accepted
+                return ticket["price"], statuses, None, None
+            finally:
+                await pool.close()
+
+        price, statuses, changed, accepted = asyncio.run(sell())
+    finally:
+        server.terminate()
+        server.wait(10)
+    assert statuses == [200] * (PREMIUM_SEATS // 2) + [409]
+    assert changed["package"]["tickets"][0][4] > price
+    status, accepted = accepted
+    assert status == 200
+    assert accepted["status"] == "confirmed"
+    assert accepted["amount"] == changed["total_price"]
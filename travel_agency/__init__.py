@@ -0,0 +1,51 @@
+import importlib
+
+_exports = {
+    "TravelFactory": "factories",
+    "BasicTravel": "factories",
+    "PremiumTravel": "factories",
+    "Ticket": "models",
+    "BasicTicket": "models",
+    "PremiumTicket": "models",
+    "Hotel": "models",
+    "BasicHotel": "models",
+    "PremiumHotel": "models",
+    "Tour": "models",
+    "BasicTour": "models",
+    "PremiumTour": "models",
+    "AdditionalServices": "models",
+    "SimCard": "models",
+    "BusPass": "models",
+    "GuideBook": "models",
+    "PaymentStrategy": "payment",
+    "CreditCard": "payment",
+    "PayPal": "payment",
+    "BankTransfer": "payment",
+    "Context": "payment",
+    "TravelPackage": "package",
+    "TravelPackageBuilder": "package",
+    "TravelService": "service",
+    "PackageCandidate": "pricing",
+    "PricingRule": "pricing",
+    "SeasonSurcharge": "pricing",
+    "PremiumMultiplier": "pricing",
+    "ServiceBundleDiscount": "pricing",
+    "PricingEngine": "pricing",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str):
+    # Подмодули загружаются только при первом обращении к имени, чтобы
+    # импорт пакета не тянул за собой tkinter и Pillow.
+    module_name = _exports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
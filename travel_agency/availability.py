@@ -0,0 +1,144 @@
+import threading
+from array import array
+from datetime import date
+from typing import Callable
+
+DEFAULT_ROOMS = 10
+
+
+class BookingConflict(Exception):
+    pass
+
+
+class RoomAvailability:
+    def __init__(self, horizon_start: date | None = None, horizon_days: int = 365,
+                 capacity_of: Callable[[str, str], int | None] | None = None):
+        self.horizon_start = (horizon_start or date.today()).toordinal()
+        self.horizon_days = horizon_days
+        self.capacity_of = capacity_of
+        self.capacity: dict[tuple[str, str], int] = {}
+        # Массив ночей заводится только при первой брони отеля,
+        # до этого все номера считаются свободными.
+        self.free_rooms: dict[tuple[str, str], array] = {}
+        self.row_versions: dict[tuple[str, str], int] = {}
+        # Версия города меняется вместе с версией любого его отеля: по ней кешируется поиск.
+        self.city_versions: dict[str, int] = {}
+        self.version = 0
+        self.lock = threading.Lock()
+
+    def add_hotel(self, city: str, name: str, rooms: int = DEFAULT_ROOMS):
+        # У уже известного отеля меняется только число номеров, сделанные брони сохраняются.
+        key = (city, name)
+        with self.lock:
+            previous = self.capacity.get(key)
+            self.capacity[key] = rooms
+            nights = self.free_rooms.get(key)
+            if nights is not None and previous is not None and previous != rooms:
+                for night, free in enumerate(nights):
+                    nights[night] = max(0, free + rooms - previous)
+            self._touch(key)
+            self.version += 1
+
+    def _touch(self, key: tuple[str, str]):
+        self.row_versions[key] = self.row_versions.get(key, 0) + 1
+        self.city_versions[key[0]] = self.city_versions.get(key[0], 0) + 1
+
+    def city_version(self, city: str) -> int:
+        return self.city_versions.get(city, 0)
+
+    def _capacity(self, key: tuple[str, str]) -> int | None:
+        rooms = self.capacity.get(key)
+        if rooms is None and self.capacity_of is not None:
+            rooms = self.capacity_of(*key)
+            if rooms is not None:
+                self.capacity[key] = rooms
+        return rooms
+
+    def _nights(self, key: tuple[str, str]) -> array:
+        nights = self.free_rooms.get(key)
+        if nights is None:
+            nights = self.free_rooms[key] = array("H", [self.capacity[key]]) * self.horizon_days
+        return nights
+
+    def _extend(self, first: int, last: int):
+        # Горизонт расширяется в обе стороны, новые ночи полностью свободны.
+        before = max(0, self.horizon_start - first)
+        after = max(0, last - (self.horizon_start + self.horizon_days))
+        if not before and not after:
+            return
+        for key, nights in self.free_rooms.items():
+            rooms = self.capacity[key]
+            self.free_rooms[key] = array("H", [rooms]) * before + nights + array("H", [rooms]) * after
+        self.horizon_start -= before
+        self.horizon_days += before + after
+
+    def _slice(self, check_in: date, check_out: date) -> tuple[int, int]:
+        first, last = check_in.toordinal(), check_out.toordinal()
+        if last <= first:
+            raise ValueError("Дата выезда должна быть позже даты заезда")
+        self._extend(first, last)
+        return first - self.horizon_start, last - self.horizon_start
+
+    def _has_rooms(self, key: tuple[str, str], start: int, end: int, rooms: int) -> bool:
+        nights = self.free_rooms.get(key)
+        if nights is None:
+            capacity = self._capacity(key)
+            return capacity is not None and capacity >= rooms
+        return min(nights[start:end]) >= rooms
+
+    def is_available(self, city: str, name: str, check_in: date, check_out: date, rooms: int = 1) -> bool:
+        with self.lock:
+            start, end = self._slice(check_in, check_out)
+            return self._has_rooms((city, name), start, end, rooms)
+
+    def filter_available(self, city: str, names: list[str], check_in: date, check_out: date,
+                         rooms: int = 1) -> list[str]:
+        with self.lock:
+            start, end = self._slice(check_in, check_out)
+            return [name for name in names if self._has_rooms((city, name), start, end, rooms)]
+
+    def check(self, bookings: list[tuple[str, str, date, date, int]]) -> tuple[bool, dict[tuple[str, str], int]]:
+        with self.lock:
+            versions = {(city, name): self.row_versions.get((city, name), 0) for city, name, *_ in bookings}
+            for city, name, check_in, check_out, rooms in bookings:
+                start, end = self._slice(check_in, check_out)
+                if not self._has_rooms((city, name), start, end, rooms):
+                    return False, versions
+            return True, versions
+
+    def reserve(self, bookings: list[tuple[str, str, date, date, int]],
+                expected_versions: dict[tuple[str, str], int] | None = None):
+        # Все брони пакета проверяются и списываются под одной блокировкой:
+        # либо проходят все, либо ни одна. Если переданы версии строк,
+        # прочитанные в check, бронь отклоняется при любом изменении между ними.
+        with self.lock:
+            if expected_versions is not None:
+                for key, version in expected_versions.items():
+                    if self.row_versions.get(key, 0) != version:
+                        raise BookingConflict(f"Данные отеля {key[1]} изменились, повторите бронирование")
+            applied = []
+            for city, name, check_in, check_out, rooms in bookings:
+                start, end = self._slice(check_in, check_out)
+                if not self._has_rooms((city, name), start, end, rooms):
+                    for key, done_start, done_end, done_rooms in applied:
+                        self._add_rooms(key, done_start, done_end, done_rooms)
+                    raise ValueError(f"Нет свободных номеров в отеле {name} на выбранные даты")
+                self._add_rooms((city, name), start, end, -rooms)
+                applied.append(((city, name), start, end, rooms))
+            for key, *_ in applied:
+                self._touch(key)
+            self.version += 1
+
+    def _add_rooms(self, key: tuple[str, str], start: int, end: int, rooms: int):
+        nights = self._nights(key)
+        capacity = self.capacity[key]
+        for night in range(start, end):
+            nights[night] = min(capacity, nights[night] + rooms)
+
+    def release(self, bookings: list[tuple[str, str, date, date, int]]):
+        with self.lock:
+            for city, name, check_in, check_out, rooms in bookings:
+                start, end = self._slice(check_in, check_out)
+                self._add_rooms((city, name), start, end, rooms)
+                self._touch((city, name))
+            self.version += 1
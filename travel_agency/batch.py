@@ -0,0 +1,90 @@
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+from .factories import TravelFactory
+from .fares import FareEngine
+from .models import Ticket
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def format_time(minutes: int) -> str:
+    return f"{minutes // 60}:{minutes % 60:02d}"
+
+
+class TicketBatch:
+    def __init__(self, factory: TravelFactory, queries: list[tuple[str, str, date, date]], query_index, prices,
+                 times_forward, times_backward):
+        self.factory = factory
+        self.queries = queries
+        self.query_index = query_index
+        self.prices = prices
+        self.times_forward = times_forward
+        self.times_backward = times_backward
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.get_ticket(i)
+
+    def get_ticket(self, i: int) -> Ticket:
+        departure, destination, date_forward, date_backward = self.queries[int(self.query_index[i])]
+        ticket = self.factory.create_ticket()
+        ticket.departure = departure
+        ticket.destination = destination
+        ticket.date_forward = date_forward
+        ticket.date_backward = date_backward
+        ticket.price = int(self.prices[i])
+        ticket.time_forward = format_time(int(self.times_forward[i]))
+        ticket.time_backward = format_time(int(self.times_backward[i]))
+        return ticket
+
+    def get_tickets(self, query: int) -> list[Ticket]:
+        # Билеты в батче упорядочены по номеру запроса.
+        start = bisect_left(self.query_index, query)
+        end = bisect_right(self.query_index, query)
+        return [self.get_ticket(i) for i in range(start, end)]
+
+    def to_tickets(self) -> list[Ticket]:
+        return list(self)
+
+
+def generate_ticket_batch(factory: TravelFactory, queries: list[tuple[str, str, date, date]],
+                          seed: int | None = None, fares: FareEngine | None = None,
+                          package_type: str = "basic") -> TicketBatch:
+    flights_low, flights_high = factory.flights_range
+    price_low, price_high = factory.create_ticket().price_range
+
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        counts = rng.integers(flights_low, flights_high + 1, size=len(queries))
+        total = int(counts.sum())
+        query_index = np.repeat(np.arange(len(queries)), counts)
+        if fares is None:
+            prices = 2 * rng.integers(price_low, price_high + 1, size=total)
+        times_forward = rng.integers(0, MINUTES_PER_DAY, size=total)
+        times_backward = rng.integers(0, MINUTES_PER_DAY, size=total)
+    else:
+        rng = random.Random(seed)
+        query_index = array("l")
+        for query in range(len(queries)):
+            query_index.extend([query] * rng.randint(flights_low, flights_high))
+        total = len(query_index)
+        if fares is None:
+            prices = array("l", [2 * rng.randint(price_low, price_high) for _ in range(total)])
+        times_forward = array("l", [rng.randrange(MINUTES_PER_DAY) for _ in range(total)])
+        times_backward = array("l", [rng.randrange(MINUTES_PER_DAY) for _ in range(total)])
+
+    # Цены по тарифам считаются вместо случайных, а не поверх них.
+    if fares is not None:
+        prices = array("l", fares.quote_batch(queries, query_index, package_type))
+    return TicketBatch(factory, queries, query_index, prices, times_forward, times_backward)
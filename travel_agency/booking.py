@@ -0,0 +1,87 @@
+import threading
+import uuid
+from typing import Callable
+
+from .availability import BookingConflict, RoomAvailability
+from .package import TravelPackage
+from .payment import PaymentStrategy, Context
+
+MAX_RETRIES = 10
+
+
+class Booking:
+    __slots__ = ("booking_id", "idempotency_key", "package", "amount", "status")
+
+    def __init__(self, idempotency_key: str, package: TravelPackage):
+        self.booking_id = uuid.uuid4().hex
+        self.idempotency_key = idempotency_key
+        self.package = package
+        self.amount = package.get_total_price()
+        self.status = "pending"
+
+
+class BookingService:
+    def __init__(self, availability: RoomAvailability, max_retries: int = MAX_RETRIES,
+                 on_confirmed: Callable[[TravelPackage], None] | None = None):
+        self.availability = availability
+        self.max_retries = max_retries
+        # Вызывается после подтверждения брони, например чтобы учесть проданные места в тарифах.
+        self.on_confirmed = on_confirmed
+        self.bookings: dict[str, Booking] = {}
+        self.in_progress: dict[str, threading.Event] = {}
+        self.charges = 0
+        self.conflicts = 0
+        self.lock = threading.Lock()
+
+    def book(self, package: TravelPackage, payment: PaymentStrategy | Context, idempotency_key: str) -> Booking:
+        # Подтвержденная бронь запоминается по ключу идемпотентности:
+        # повторный запрос с тем же ключом возвращает ее без нового списания.
+        while True:
+            with self.lock:
+                booking = self.bookings.get(idempotency_key)
+                if booking is not None:
+                    return booking
+                event = self.in_progress.get(idempotency_key)
+                if event is None:
+                    self.in_progress[idempotency_key] = threading.Event()
+                    break
+            event.wait()
+
+        try:
+            booking = Booking(idempotency_key, package)
+            rooms = [(hotel.city, hotel.name, hotel.check_in, hotel.check_out, hotel.rooms) for hotel in package.hotels]
+            self._reserve(rooms)
+            try:
+                with self.lock:
+                    self.charges += 1
+                paid = payment.pay(booking.amount)
+            except Exception:
+                self.availability.release(rooms)
+                raise
+            if not paid:
+                self.availability.release(rooms)
+                booking.status = "failed"
+                return booking
+
+            booking.status = "confirmed"
+            with self.lock:
+                self.bookings[idempotency_key] = booking
+            if self.on_confirmed is not None:
+                self.on_confirmed(package)
+            return booking
+        finally:
+            with self.lock:
+                self.in_progress.pop(idempotency_key).set()
+
+    def _reserve(self, rooms: list[tuple]):
+        for _ in range(self.max_retries):
+            available, versions = self.availability.check(rooms)
+            if not available:
+                raise ValueError("Нет свободных номеров на выбранные даты")
+            try:
+                self.availability.reserve(rooms, versions)
+                return
+            except BookingConflict:
+                with self.lock:
+                    self.conflicts += 1
+        raise ValueError("Не удалось забронировать номера, попробуйте еще раз")
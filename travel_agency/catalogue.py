@@ -0,0 +1,268 @@
+import argparse
+import csv
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterator
+
+from .availability import DEFAULT_ROOMS
+from .inventory import Inventory, tour_keys
+
+MAGIC = b"TACAT\x00\x00\x01"
+HEADER = struct.Struct("<8s7Q")
+HOTEL = struct.Struct("<IIIqHHHxx")
+TOUR = struct.Struct("<IIIIIxxxxq")
+HOTEL_KEY = struct.Struct("<IIII")
+TOUR_KEY = struct.Struct("<IIIII")
+
+
+def _number(value: str) -> int | float:
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+HOTEL_FIELDS = {"price": _number, "rating": float, "star": int, "rooms": int}
+TOUR_FIELDS = {"price": _number}
+
+
+def read_records(path: str | Path, fields: dict | None = None) -> Iterator[dict]:
+    # Файл читается построчно, в памяти держится только текущая запись.
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8") as file:
+        if path.suffix == ".csv":
+            for row in csv.DictReader(file):
+                record = {}
+                for key, value in row.items():
+                    if value == "" and key in (fields or {}):
+                        continue
+                    record[key] = fields[key](value) if fields and key in fields else value
+                yield record
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def load_inventory(hotels_path: str | Path, tours_path: str | Path) -> Inventory:
+    hotels_data: dict[str, list[dict]] = {}
+    for record in read_records(hotels_path, HOTEL_FIELDS):
+        hotels_data.setdefault(record.pop("city"), []).append(record)
+    tours_data: dict[str, list[dict]] = {}
+    for record in read_records(tours_path, TOUR_FIELDS):
+        tours_data.setdefault(record.pop("city"), []).append(record)
+    return Inventory(hotels_data, tours_data)
+
+
+def _align(file, size: int = 8):
+    padding = -file.tell() % size
+    if padding:
+        file.write(b"\0" * padding)
+
+
+def write_snapshot(inventory: Inventory, path: str | Path):
+    strings: dict[str, int] = {}
+
+    def string_id(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    hotel_groups: dict[tuple[str, str], list[dict]] = {}
+    for city, hotel_data in inventory.iter_hotels():
+        hotel_groups.setdefault((city, hotel_data["type"]), []).append(hotel_data)
+
+    hotel_records = bytearray()
+    hotel_keys = bytearray()
+    start = 0
+    for (city, package_type), group in hotel_groups.items():
+        for hotel_data in group:
+            hotel_records += HOTEL.pack(string_id(city), string_id(hotel_data["name"]), string_id(package_type),
+                                        round(hotel_data["price"] * 100), round(hotel_data["rating"] * 100),
+                                        hotel_data["star"], hotel_data.get("rooms", DEFAULT_ROOMS))
+        hotel_keys += HOTEL_KEY.pack(string_id(city), string_id(package_type), start, len(group))
+        start += len(group)
+
+    tour_records = bytearray()
+    tour_postings: dict[tuple[str, str, str], list[int]] = {}
+    tours_count = 0
+    for city, tour_data in inventory.iter_tours():
+        tour_records += TOUR.pack(string_id(city), string_id(tour_data["name"]),
+                                  string_id(tour_data["description"]), string_id(tour_data["season"]),
+                                  string_id(tour_data["type"]), round(tour_data["price"] * 100))
+        for key in tour_keys(city, tour_data):
+            tour_postings.setdefault(key, []).append(tours_count)
+        tours_count += 1
+
+    tour_keys_table = bytearray()
+    postings = bytearray()
+    start = 0
+    for (city, season, package_type), tour_ids in tour_postings.items():
+        tour_keys_table += TOUR_KEY.pack(string_id(city), string_id(season), string_id(package_type), start,
+                                         len(tour_ids))
+        postings += struct.pack(f"<{len(tour_ids)}I", *tour_ids)
+        start += len(tour_ids)
+
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+
+    # Снимок может быть открыт через mmap, в том числе тем же inventory, поэтому он
+    # записывается во временный файл и подменяется целиком.
+    temporary = Path(f"{path}.tmp")
+    with open(temporary, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(encoded), len(hotel_records) // HOTEL.size, tours_count,
+                               len(hotel_keys) // HOTEL_KEY.size, len(tour_keys_table) // TOUR_KEY.size,
+                               len(postings) // 4, offsets[-1]))
+        file.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        file.write(b"".join(encoded))
+        for section in (hotel_records, tour_records, hotel_keys, tour_keys_table, postings):
+            _align(file)
+            file.write(section)
+    os.replace(temporary, path)
+
+
+class SnapshotInventory(Inventory):
+    # Снимок каталога отображается в память только для чтения, поэтому
+    # несколько рабочих процессов разделяют одну копию страниц.
+    # Записи распаковываются только при запросе, добавления хранятся в памяти.
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, strings_count, self.hotels_count, self.tours_count, hotel_keys_count, tour_keys_count,
+         postings_count, strings_size) = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} не является снимком каталога")
+
+        offset = HEADER.size
+        self.string_offsets = offset
+        offset += (strings_count + 1) * 8
+        self.strings_start = offset
+        offset += strings_size
+        offset += -offset % 8
+        self.hotels_start = offset
+        offset += self.hotels_count * HOTEL.size
+        offset += -offset % 8
+        self.tours_start = offset
+        offset += self.tours_count * TOUR.size
+        offset += -offset % 8
+        hotel_keys_start = offset
+        offset += hotel_keys_count * HOTEL_KEY.size
+        offset += -offset % 8
+        tour_keys_start = offset
+        offset += tour_keys_count * TOUR_KEY.size
+        offset += -offset % 8
+        self.postings = memoryview(self.buffer)[offset:offset + postings_count * 4].cast("I")
+
+        self._strings: dict[int, str] = {}
+        self.hotel_ranges: dict[tuple[str, str], tuple[int, int]] = {}
+        for city, package_type, start, count in HOTEL_KEY.iter_unpack(
+                self.buffer[hotel_keys_start:hotel_keys_start + hotel_keys_count * HOTEL_KEY.size]):
+            self.hotel_ranges[(self._string(city), self._string(package_type))] = (start, count)
+        self.tour_ranges: dict[tuple[str, str, str], tuple[int, int]] = {}
+        for city, season, package_type, start, count in TOUR_KEY.iter_unpack(
+                self.buffer[tour_keys_start:tour_keys_start + tour_keys_count * TOUR_KEY.size]):
+            key = (self._string(city), self._string(season), self._string(package_type))
+            self.tour_ranges[key] = (start, count)
+
+        self._hotel_names: dict[str, dict[str, int]] = {}
+        self.overlay = Inventory({}, {})
+
+    @property
+    def version(self) -> int:
+        return self.overlay.version
+
+    def close(self):
+        self.postings.release()
+        self.buffer.close()
+
+    def _string(self, index: int) -> str:
+        value = self._strings.get(index)
+        if value is None:
+            start, end = struct.unpack_from("<2Q", self.buffer, self.string_offsets + index * 8)
+            value = self.buffer[self.strings_start + start:self.strings_start + end].decode("utf-8")
+            self._strings[index] = value
+        return value
+
+    def _price(self, kopecks: int) -> int | float:
+        return kopecks // 100 if kopecks % 100 == 0 else kopecks / 100
+
+    def _hotel(self, index: int) -> dict:
+        city, name, package_type, price, rating, star, rooms = HOTEL.unpack_from(
+            self.buffer, self.hotels_start + index * HOTEL.size)
+        return {"name": self._string(name), "type": self._string(package_type), "price": self._price(price),
+                "rating": rating / 100, "star": star, "rooms": rooms}
+
+    def _tour(self, index: int) -> dict:
+        city, name, description, season, package_type, price = TOUR.unpack_from(
+            self.buffer, self.tours_start + index * TOUR.size)
+        return {"name": self._string(name), "description": self._string(description), "price": self._price(price),
+                "season": self._string(season), "type": self._string(package_type)}
+
+    def rebuild(self):
+        self.overlay.rebuild()
+
+    def add_hotel(self, city: str, hotel_data: dict):
+        self.overlay.add_hotel(city, hotel_data)
+
+    def add_tour(self, city: str, tour_data: dict):
+        self.overlay.add_tour(city, tour_data)
+
+    def get_hotels(self, city: str, package_type: str) -> list[dict]:
+        start, count = self.hotel_ranges.get((city, package_type), (0, 0))
+        hotels = [self._hotel(i) for i in range(start, start + count)]
+        return hotels + self.overlay.get_hotels(city, package_type)
+
+    def get_tours(self, city: str, season: str, package_type: str) -> list[dict]:
+        start, count = self.tour_ranges.get((city, season, package_type), (0, 0))
+        tours = [self._tour(self.postings[i]) for i in range(start, start + count)]
+        return tours + self.overlay.get_tours(city, season, package_type)
+
+    def get_cities(self) -> list[str]:
+        cities = [city for city, _ in self.hotel_ranges] + [city for city, _, _ in self.tour_ranges]
+        return list(dict.fromkeys(cities + self.overlay.get_cities()))
+
+    def find_hotel(self, city: str, name: str) -> dict | None:
+        # Индекс имен города строится при первом обращении к нему.
+        names = self._hotel_names.get(city)
+        if names is None:
+            names = self._hotel_names[city] = {}
+            for (hotel_city, _), (start, count) in self.hotel_ranges.items():
+                if hotel_city != city:
+                    continue
+                for i in range(start, start + count):
+                    name_id = HOTEL.unpack_from(self.buffer, self.hotels_start + i * HOTEL.size)[1]
+                    names.setdefault(self._string(name_id), i)
+        index = names.get(name)
+        if index is not None:
+            return self._hotel(index)
+        return self.overlay.find_hotel(city, name)
+
+    def iter_hotels(self) -> Iterator[tuple[str, dict]]:
+        for i in range(self.hotels_count):
+            city = HOTEL.unpack_from(self.buffer, self.hotels_start + i * HOTEL.size)[0]
+            yield self._string(city), self._hotel(i)
+        yield from self.overlay.iter_hotels()
+
+    def iter_tours(self) -> Iterator[tuple[str, dict]]:
+        for i in range(self.tours_count):
+            city = TOUR.unpack_from(self.buffer, self.tours_start + i * TOUR.size)[0]
+            yield self._string(city), self._tour(i)
+        yield from self.overlay.iter_tours()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сборка бинарного снимка каталога из CSV/JSON Lines")
+    parser.add_argument("hotels", help="файл отелей (.csv или .jsonl)")
+    parser.add_argument("tours", help="файл туров (.csv или .jsonl)")
+    parser.add_argument("snapshot", help="путь к создаваемому снимку")
+    args = parser.parse_args()
+    write_snapshot(load_inventory(args.hotels, args.tours), args.snapshot)
+
+
+if __name__ == "__main__":
+    main()
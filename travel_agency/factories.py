@@ -0,0 +1,54 @@
+import random
+from abc import ABC, abstractmethod
+
+from .models import BasicTicket, PremiumTicket, BasicHotel, PremiumHotel, BasicTour, PremiumTour
+
+
+class TravelFactory(ABC):
+    @abstractmethod
+    def create_ticket(self):
+        pass
+
+    @abstractmethod
+    def create_hotel(self):
+        pass
+
+    @abstractmethod
+    def create_tour(self):
+        pass
+
+    @abstractmethod
+    def get_number_of_flights(self, rng: random.Random) -> int:
+        pass
+
+
+class BasicTravel(TravelFactory):
+    flights_range = (2, 5)
+
+    def create_ticket(self):
+        return BasicTicket()
+
+    def create_hotel(self):
+        return BasicHotel()
+
+    def create_tour(self):
+        return BasicTour()
+
+    def get_number_of_flights(self, rng: random.Random) -> int:
+        return rng.randint(*self.flights_range)
+
+
+class PremiumTravel(TravelFactory):
+    flights_range = (1, 3)
+
+    def create_ticket(self):
+        return PremiumTicket()
+
+    def create_hotel(self):
+        return PremiumHotel()
+
+    def create_tour(self):
+        return PremiumTour()
+
+    def get_number_of_flights(self, rng: random.Random) -> int:
+        return rng.randint(*self.flights_range)
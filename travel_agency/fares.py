@@ -0,0 +1,154 @@
+import threading
+import zlib
+from array import array
+from datetime import date, timedelta
+from typing import Callable
+
+from .geo import CITY_COORDINATES, distance_km
+
+FAR_KM = 2500
+HORIZON_DAYS = 365
+SEATS_PER_FLIGHT = 150
+SEASON_FACTORS = {"зима": 1.10, "весна": 0.95, "лето": 1.25, "осень": 0.90}
+# (не меньше стольких дней до вылета, коэффициент): ближе к вылету дороже.
+ADVANCE_FACTORS = [(60, 0.85), (30, 0.90), (14, 1.00), (7, 1.15), (3, 1.30), (0, 1.50)]
+# (загрузка от, коэффициент): последние места продаются дороже.
+LOAD_FACTORS = [(0.95, 2.00), (0.85, 1.50), (0.70, 1.25), (0.50, 1.10), (0.0, 1.00)]
+# Рейсы одного дня отличаются временем вылета и цена у них немного разная, в процентах.
+FLIGHT_FACTORS = (100, 108, 95, 115, 90)
+
+
+def _step(steps: list[tuple[float, float]], value: float) -> float:
+    for threshold, factor in steps:
+        if value >= threshold:
+            return factor
+    return steps[-1][1]
+
+
+class FareEngine:
+    # Цена билета туда-обратно = базовый тариф маршрута × сезон × срок до вылета × загрузка.
+    # Для каждого маршрута и класса держится таблица цен по дням вылета на horizon_days вперед,
+    # котировка - чтение из нее. Бронь пересчитывает только ячейку своего дня, смена даты
+    # сбрасывает таблицы, потому что у всех дней сдвигается срок до вылета. Дата отсчета и таблицы
+    # от нее лежат в одном кортеже state и заменяются вместе, котировка берет его один раз.
+    def __init__(self, factories: dict, get_season: Callable[[date], str],
+                 seats_per_flight: int = SEATS_PER_FLIGHT, horizon_days: int = HORIZON_DAYS,
+                 today: Callable[[], date] = date.today):
+        self.get_season = get_season
+        self.horizon_days = horizon_days
+        self.today = today
+        self.price_ranges = {package_type: factory.create_ticket().price_range
+                             for package_type, factory in factories.items()}
+        self.capacity = {package_type: factory.flights_range[1] * seats_per_flight
+                         for package_type, factory in factories.items()}
+        self.ticket_types = {type(factory.create_ticket()): package_type
+                             for package_type, factory in factories.items()}
+        self.state: tuple[date, dict[tuple[str, str, str], array]] = (today(), {})
+        self.sold: dict[tuple[str, str, str, date], int] = {}
+        self.bases: dict[tuple[str, str, str], float] = {}
+        self.lock = threading.Lock()
+
+    def base_fare(self, departure: str, destination: str, package_type: str) -> float:
+        # Базовый тариф растет с расстоянием от нижней границы класса к верхней.
+        # Для городов без координат доля берется из стабильного хеша названия маршрута.
+        key = (departure, destination, package_type)
+        base = self.bases.get(key)
+        if base is None:
+            low, high = self.price_ranges[package_type]
+            if departure in CITY_COORDINATES and destination in CITY_COORDINATES:
+                km = distance_km(CITY_COORDINATES[departure], CITY_COORDINATES[destination])
+                share = min(km, FAR_KM) / FAR_KM
+            else:
+                share = zlib.crc32(f"{departure}-{destination}".encode("utf-8")) / 0xFFFFFFFF
+            base = self.bases[key] = low + (high - low) * share
+        return base
+
+    def factors(self, departure: str, destination: str, travel_date: date, package_type: str,
+                sold: int | None = None) -> dict[str, float]:
+        # sold задает число проданных мест вместо учтенного, например 0 - цена без надбавки за загрузку.
+        return self._factors(self.state[0], departure, destination, travel_date, package_type, sold)
+
+    def _factors(self, start: date, departure: str, destination: str, travel_date: date, package_type: str,
+                 sold: int | None) -> dict[str, float]:
+        days = max(0, (travel_date - start).days)
+        if sold is None:
+            sold = self.sold.get((departure, destination, package_type, travel_date), 0)
+        return {
+            "base": self.base_fare(departure, destination, package_type),
+            "season": SEASON_FACTORS[self.get_season(travel_date)],
+            "advance": _step(ADVANCE_FACTORS, days),
+            "load": _step(LOAD_FACTORS, sold / self.capacity[package_type]),
+        }
+
+    def _fare(self, start: date, departure: str, destination: str, travel_date: date, package_type: str,
+              sold: int | None = None) -> int:
+        fare = 2.0
+        for factor in self._factors(start, departure, destination, travel_date, package_type, sold).values():
+            fare *= factor
+        return round(fare)
+
+    def _table(self, state: tuple[date, dict], departure: str, destination: str, package_type: str) -> array:
+        start, tables = state
+        key = (departure, destination, package_type)
+        table = tables.get(key)
+        if table is None:
+            with self.lock:
+                table = tables.get(key)
+                if table is None:
+                    table = tables[key] = array("l", [
+                        self._fare(start, departure, destination, start + timedelta(days=day), package_type)
+                        for day in range(self.horizon_days)])
+        return table
+
+    def _roll(self) -> tuple[date, dict]:
+        today = self.today()
+        state = self.state
+        if today != state[0]:
+            with self.lock:
+                state = self.state
+                if today != state[0]:
+                    state = self.state = (today, {})
+                    self.sold = {key: seats for key, seats in self.sold.items() if key[3] >= today}
+        return state
+
+    def quote(self, departure: str, destination: str, travel_date: date, package_type: str, flight: int = 0,
+              sold: int | None = None) -> int:
+        state = self._roll()
+        day = (travel_date - state[0]).days
+        if sold is None and 0 <= day < self.horizon_days:
+            fare = self._table(state, departure, destination, package_type)[day]
+        else:
+            fare = self._fare(state[0], departure, destination, travel_date, package_type, sold)
+        return fare * FLIGHT_FACTORS[flight % len(FLIGHT_FACTORS)] // 100
+
+    def quote_batch(self, queries: list[tuple[str, str, date, date]], query_index, package_type: str) -> list[int]:
+        # Билеты батча упорядочены по запросу, номер рейса - позиция билета внутри запроса.
+        prices = []
+        previous = flight = -1
+        for query in query_index:
+            query = int(query)
+            flight = flight + 1 if query == previous else 0
+            previous = query
+            departure, destination, date_forward, _ = queries[query]
+            prices.append(self.quote(departure, destination, date_forward, package_type, flight))
+        return prices
+
+    def record_sale(self, departure: str, destination: str, travel_date: date, package_type: str, seats: int = 1):
+        self._roll()
+        with self.lock:
+            start, tables = self.state
+            key = (departure, destination, package_type, travel_date)
+            self.sold[key] = self.sold.get(key, 0) + seats
+            table = tables.get(key[:3])
+            day = (travel_date - start).days
+            if table is not None and 0 <= day < self.horizon_days:
+                table[day] = self._fare(start, departure, destination, travel_date, package_type)
+
+    def record_package(self, package):
+        for ticket in package.tickets:
+            package_type = self.ticket_types.get(type(ticket))
+            if package_type is not None:
+                self.record_sale(ticket.departure, ticket.destination, ticket.date_forward, package_type)
+
+    def load_factor(self, departure: str, destination: str, travel_date: date, package_type: str) -> float:
+        return self.sold.get((departure, destination, package_type, travel_date), 0) / self.capacity[package_type]
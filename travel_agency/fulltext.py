@@ -0,0 +1,225 @@
+import bisect
+import heapq
+import re
+from array import array
+from collections import Counter
+from typing import Iterator
+
+from .inventory import Inventory
+
+KINDS = ["city", "hotel", "tour"]
+TOKEN = re.compile(r"[0-9a-zа-я]+")
+# Окончания отсекаются от длинных к коротким, основа остается не короче MIN_STEM букв.
+ENDINGS = sorted(["ами", "ями", "ого", "его", "ому", "ему", "ыми", "ими", "ов", "ев", "ам", "ям", "ах", "ях",
+                  "ом", "ем", "ых", "их", "ым", "им", "ой", "ей"], key=len, reverse=True)
+SOFT_ENDINGS = set("аеиоуыэюяйь")
+MIN_STEM = 3
+FUZZY_SIMILARITY = 0.45
+FUZZY_TERMS = 3
+PREFIX_TERMS = 50
+PREFIX_CACHE_LENGTH = 2
+
+
+def normalize(text: str) -> str:
+    return text.lower().replace("ё", "е")
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN.findall(normalize(text))
+
+
+def stem(word: str) -> str:
+    # Облегченный стеммер: "музей", "музея" и "музеев" сводятся к одной основе "муз".
+    if len(word) <= MIN_STEM or not word.isalpha():
+        return word
+    if word[0] <= "z":
+        return word[:-1] if word.endswith("s") else word
+    for ending in ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= MIN_STEM:
+            word = word[:-len(ending)]
+            break
+    while len(word) > MIN_STEM and word[-1] in SOFT_ENDINGS:
+        word = word[:-1]
+    return word
+
+
+def trigrams(word: str) -> set[str]:
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchHit:
+    __slots__ = ("kind", "city", "name", "record")
+
+    def __init__(self, kind: str, city: str, name: str, record: dict | None):
+        self.kind = kind
+        self.city = city
+        self.name = name
+        self.record = record
+
+
+class SearchIndex:
+    # Документы нумеруются по порядку добавления, поэтому списки вхождений всегда отсортированы
+    # и пересекаются бинарным поиском. Списки ведутся отдельно по видам документов, чтобы фильтр
+    # по виду не просматривал чужие вхождения. Словарь для нечеткого поиска и автодополнения
+    # перестраивается лениво, после первого запроса с новыми словами.
+    def __init__(self):
+        self.kinds = array("B")
+        self.cities: list[str] = []
+        self.names: list[str] = []
+        self.records: list[dict | None] = []
+        self.postings: dict[tuple[int, str], array] = {}
+        self.city_postings: dict[str, array] = {}
+        self.words: dict[str, list] = {}
+        self.city_docs: set[str] = set()
+        self.sorted_words: list[str] = []
+        self.word_trigrams: dict[str, list[str]] = {}
+        self.prefix_top: dict[str, list[str]] = {}
+        self.dirty = False
+
+    @classmethod
+    def from_inventory(cls, inventory: Inventory) -> "SearchIndex":
+        index = cls()
+        for city in inventory.get_cities():
+            index.add_city(city)
+        for city, hotel_data in inventory.iter_hotels():
+            index.add_hotel(city, hotel_data)
+        for city, tour_data in inventory.iter_tours():
+            index.add_tour(city, tour_data)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def add_city(self, city: str):
+        if city not in self.city_docs:
+            self.city_docs.add(city)
+            self.add("city", city, city, None, city)
+
+    def add_hotel(self, city: str, hotel_data: dict):
+        self.add_city(city)
+        self.add("hotel", city, hotel_data["name"], hotel_data, f"{hotel_data['name']} {city}")
+
+    def add_tour(self, city: str, tour_data: dict):
+        self.add_city(city)
+        self.add("tour", city, tour_data["name"], tour_data,
+                 f"{tour_data['name']} {tour_data['description']} {city}")
+
+    def add(self, kind: str, city: str, name: str, record: dict | None, text: str):
+        doc = len(self.records)
+        code = KINDS.index(kind)
+        self.kinds.append(code)
+        self.cities.append(city)
+        self.names.append(name)
+        self.records.append(record)
+        self.city_postings.setdefault(city, array("I")).append(doc)
+        seen = set()
+        for word in tokenize(text):
+            # Запись словаря: основа, число документов со словом, последний такой документ.
+            entry = self.words.get(word)
+            if entry is None:
+                entry = self.words[word] = [stem(word), 0, doc]
+                self.dirty = True
+            elif entry[2] != doc:
+                entry[2] = doc
+            else:
+                continue
+            entry[1] += 1
+            key = (code, entry[0])
+            if key not in seen:
+                seen.add(key)
+                postings = self.postings.get(key)
+                if postings is None:
+                    postings = self.postings[key] = array("I")
+                postings.append(doc)
+
+    def _prepare(self):
+        if not self.dirty:
+            return
+        self.sorted_words = sorted(self.words)
+        self.word_trigrams = {}
+        groups: dict[str, list[str]] = {}
+        for word in self.sorted_words:
+            if not word.isdigit():
+                for gram in trigrams(word):
+                    self.word_trigrams.setdefault(gram, []).append(word)
+            for length in range(1, min(PREFIX_CACHE_LENGTH, len(word)) + 1):
+                groups.setdefault(word[:length], []).append(word)
+        self.prefix_top = {prefix: heapq.nlargest(PREFIX_TERMS, words, key=self._frequency)
+                           for prefix, words in groups.items()}
+        self.dirty = False
+
+    def _frequency(self, word: str) -> int:
+        return self.words[word][1]
+
+    def complete(self, prefix: str, limit: int = 10) -> list[str]:
+        # Слова словаря с данным началом, самые частые первыми.
+        prefix = normalize(prefix).strip()
+        if not prefix:
+            return []
+        self._prepare()
+        if len(prefix) <= PREFIX_CACHE_LENGTH:
+            return self.prefix_top.get(prefix, [])[:limit]
+        lo = bisect.bisect_left(self.sorted_words, prefix)
+        hi = bisect.bisect_left(self.sorted_words, prefix + "\uffff", lo)
+        return heapq.nlargest(limit, self.sorted_words[lo:hi], key=self._frequency)
+
+    def similar(self, word: str, limit: int = FUZZY_TERMS) -> list[str]:
+        # Похожие слова по коэффициенту Дайса на триграммах: "масква" -> "москва".
+        self._prepare()
+        grams = trigrams(word)
+        counts = Counter()
+        for gram in grams:
+            counts.update(self.word_trigrams.get(gram, ()))
+        scored = []
+        for candidate, common in counts.items():
+            similarity = 2 * common / (len(grams) + len(candidate) + 1)
+            if similarity >= FUZZY_SIMILARITY:
+                scored.append((similarity, self._frequency(candidate), candidate))
+        return [candidate for _, _, candidate in heapq.nlargest(limit, scored)]
+
+    def _term(self, word: str, codes: list[int], prefix: bool, fuzzy: bool) -> list[array]:
+        stems = {stem(word)}
+        if prefix:
+            stems.update(self.words[candidate][0] for candidate in self.complete(word, PREFIX_TERMS))
+        elif fuzzy and not any((code, stem(word)) in self.postings for code in codes):
+            stems.update(self.words[candidate][0] for candidate in self.similar(word))
+        return [self.postings[key] for key in ((code, term) for code in codes for term in stems)
+                if key in self.postings]
+
+    def iter_search(self, query: str, kinds: list[str] | None = None, city: str | None = None,
+                    prefix: bool = False, fuzzy: bool = True) -> Iterator[SearchHit]:
+        # Все слова запроса должны встретиться в документе. Последнее слово при prefix=True
+        # считается недописанным, неизвестные слова заменяются похожими при fuzzy=True.
+        words = tokenize(query)
+        if not words:
+            return
+        codes = [KINDS.index(kind) for kind in kinds] if kinds else list(range(len(KINDS)))
+        terms = [self._term(word, codes, prefix and i == len(words) - 1, fuzzy) for i, word in enumerate(words)]
+        if city is not None:
+            terms.append([self.city_postings[city]] if city in self.city_postings else [])
+        if not all(terms):
+            return
+        terms.sort(key=lambda lists: sum(map(len, lists)))
+        first, rest = terms[0], terms[1:]
+        last = -1
+        for doc in first[0] if len(first) == 1 else heapq.merge(*first):
+            if doc == last:
+                continue
+            last = doc
+            if all(any(_contains(postings, doc) for postings in lists) for lists in rest):
+                yield SearchHit(KINDS[self.kinds[doc]], self.cities[doc], self.names[doc], self.records[doc])
+
+    def search(self, query: str, limit: int = 20, kinds: list[str] | None = None, city: str | None = None,
+               prefix: bool = False, fuzzy: bool = True) -> list[SearchHit]:
+        hits = []
+        for hit in self.iter_search(query, kinds, city, prefix, fuzzy):
+            hits.append(hit)
+            if len(hits) >= limit:
+                break
+        return hits
+
+
+def _contains(postings: array, doc: int) -> bool:
+    i = bisect.bisect_left(postings, doc)
+    return i < len(postings) and postings[i] == doc
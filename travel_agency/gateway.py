@@ -0,0 +1,273 @@
+import asyncio
+import json
+import random
+import time
+import uuid
+from abc import ABC, abstractmethod
+
+from .payment import PaymentStrategy, CreditCard, PayPal, BankTransfer
+
+PROVIDERS = {CreditCard: "card", PayPal: "paypal", BankTransfer: "bank"}
+PROVIDER_TIMEOUTS = {"card": 2.0, "paypal": 5.0, "bank": 10.0}
+
+
+class GatewayError(Exception):
+    pass
+
+
+class GatewayUnavailable(GatewayError):
+    pass
+
+
+class GatewayResponseError(GatewayError):
+    pass
+
+
+class AsyncPaymentStrategy(ABC):
+    @abstractmethod
+    async def pay(self, amount: float) -> bool:
+        pass
+
+
+class HttpConnectionPool:
+    # Соединения HTTP/1.1 с keep-alive переиспользуются между запросами,
+    # число одновременно открытых ограничено семафором.
+    def __init__(self, host: str, port: int, max_connections: int = 20):
+        self.host = host
+        self.port = port
+        self.idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self.semaphore = asyncio.Semaphore(max_connections)
+        self.opened = 0
+
+    async def _connect(self, fresh: bool = False) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        # Третий элемент - взято ли соединение из простаивающих.
+        if self.idle and not fresh:
+            return *self.idle.pop(), True
+        self.opened += 1
+        return *await asyncio.open_connection(self.host, self.port), False
+
+    async def request(self, method: str, path: str, payload: dict, headers: dict | None = None) -> tuple[int, dict]:
+        body = json.dumps(payload).encode("utf-8")
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}",
+                 "Content-Type: application/json", f"Content-Length: {len(body)}", "Connection: keep-alive"]
+        lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        message = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+        async with self.semaphore:
+            fresh = False
+            while True:
+                reader, writer, reused = await self._connect(fresh)
+                try:
+                    writer.write(message)
+                    await writer.drain()
+                    status, response_headers, response_body = await read_message(reader)
+                    code = int(status.split()[1])
+                    response = json.loads(response_body) if response_body else {}
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    # Сервер мог закрыть простаивавшее соединение keep-alive: это не сбой,
+                    # запрос один раз повторяется на новом соединении.
+                    if reused:
+                        fresh = True
+                        continue
+                    raise
+                except (ValueError, IndexError) as e:
+                    writer.close()
+                    raise GatewayResponseError(f"Некорректный ответ: {e}") from e
+                except BaseException:
+                    writer.close()
+                    raise
+                break
+            if response_headers.get("connection", "").lower() == "close":
+                writer.close()
+            else:
+                self.idle.append((reader, writer))
+            return code, response if isinstance(response, dict) else {}
+
+    async def close(self):
+        while self.idle:
+            _, writer = self.idle.pop()
+            writer.close()
+
+
+async def read_message(reader: asyncio.StreamReader,
+                       max_body: int | None = None) -> tuple[str, dict[str, str], bytes]:
+    start_line = await reader.readline()
+    if not start_line:
+        raise ConnectionError("Соединение закрыто")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    if length < 0 or (max_body is not None and length > max_body):
+        raise ValueError(f"Недопустимая длина тела: {length}")
+    body = await reader.readexactly(length)
+    return start_line.decode("latin-1").strip(), headers, body
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.probing = False
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        # После паузы пропускаем один пробный запрос (полуоткрытое состояние),
+        # остальные получают отказ, пока проба не завершится.
+        if self.probing or time.monotonic() - self.opened_at < self.reset_timeout:
+            return False
+        self.probing = True
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.probing = False
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+    def release(self):
+        # Запрос прерван без ответа шлюза (например, отменен): проба не засчитывается.
+        self.probing = False
+
+
+class GatewayClient:
+    def __init__(self, pool: HttpConnectionPool, timeouts: dict[str, float] | None = None, retries: int = 3,
+                 backoff: float = 0.05, breaker_threshold: int = 5, breaker_reset: float = 30.0):
+        self.pool = pool
+        self.timeouts = timeouts or PROVIDER_TIMEOUTS
+        self.retries = retries
+        self.backoff = backoff
+        self.breakers = {provider: CircuitBreaker(breaker_threshold, breaker_reset) for provider in self.timeouts}
+
+    async def charge(self, provider: str, amount: float, idempotency_key: str) -> bool:
+        breaker = self.breakers[provider]
+        for attempt in range(self.retries + 1):
+            if not breaker.allow():
+                raise GatewayUnavailable(f"Платежный шлюз {provider} временно недоступен")
+            try:
+                status, response = await asyncio.wait_for(
+                    self.pool.request("POST", f"/charge/{provider}", {"amount": amount},
+                                      {"Idempotency-Key": idempotency_key}),
+                    self.timeouts[provider])
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, OSError,
+                    GatewayResponseError):
+                status, response = None, {}
+            except BaseException:
+                breaker.release()
+                raise
+            if status is not None and status < 500:
+                breaker.record_success()
+                return status == 200 and bool(response.get("approved"))
+            breaker.record_failure()
+            if attempt < self.retries:
+                await asyncio.sleep(self.backoff * 2 ** attempt * (1 + random.random()))
+        raise GatewayError(f"Платежный шлюз {provider} не ответил")
+
+
+class GatewayPayment(AsyncPaymentStrategy):
+    # Поля проверяются синхронной стратегией, списание идет через шлюз.
+    # Ключ идемпотентности задает вызывающий, обычно это ключ брони: с ним совпадают
+    # и повторы внутри клиента, и повторная оплата той же брони после ошибки.
+    def __init__(self, strategy: PaymentStrategy, client: GatewayClient, idempotency_key: str):
+        self.strategy = strategy
+        self.client = client
+        self.idempotency_key = idempotency_key
+        self.provider = PROVIDERS[type(strategy)]
+
+    async def pay(self, amount: float) -> bool:
+        if not self.strategy.pay(amount):
+            return False
+        return await self.client.charge(self.provider, amount, self.idempotency_key)
+
+
+class BlockingPayment(PaymentStrategy):
+    # Синхронная стратегия для BookingService, который ждет оплату в своем потоке:
+    # списание выполняется в цикле событий, которому принадлежат соединения шлюза.
+    def __init__(self, payment: AsyncPaymentStrategy, loop: asyncio.AbstractEventLoop):
+        self.payment = payment
+        self.loop = loop
+
+    def pay(self, amount: float) -> bool:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            raise RuntimeError("Оплата через шлюз ждет цикл событий и не вызывается из него самого")
+        return asyncio.run_coroutine_threadsafe(self.payment.pay(amount), self.loop).result()
+
+
+class AsyncContext:
+    def __init__(self, payment_strategy: AsyncPaymentStrategy):
+        self.payment_strategy = payment_strategy
+
+    async def pay(self, amount):
+        return await self.payment_strategy.pay(amount)
+
+
+class StubGateway:
+    # Локальный шлюз для тестов: задержка, доля сбоев 5xx и лимит суммы настраиваются.
+    def __init__(self, latency: float = 0.01, failure_rate: float = 0.0, limit: float = 1_000_000,
+                 seed: int | None = None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.limit = limit
+        self.rng = random.Random(seed)
+        self.charges: dict[str, float] = {}
+        self.requests = 0
+        self.connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self.server: asyncio.AbstractServer | None = None
+        self.port = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        self.server = await asyncio.start_server(self.handle, host, port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self):
+        self.server.close()
+        for writer in self.connections.values():
+            writer.close()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+        await self.server.wait_closed()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self.connections[task] = writer
+        try:
+            while True:
+                try:
+                    _, headers, body = await read_message(reader)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    break
+                self.requests += 1
+                await asyncio.sleep(self.latency)
+                if self.rng.random() < self.failure_rate:
+                    status, response = 503, {"error": "unavailable"}
+                else:
+                    amount = json.loads(body)["amount"]
+                    key = headers.get("idempotency-key", uuid.uuid4().hex)
+                    approved = amount <= self.limit
+                    if approved:
+                        self.charges.setdefault(key, amount)
+                    status, response = 200, {"approved": approved}
+                payload = json.dumps(response).encode("utf-8")
+                writer.write((f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                              f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n"
+                              f"Connection: keep-alive\r\n\r\n").encode("latin-1") + payload)
+                await writer.drain()
+        finally:
+            del self.connections[task]
+            writer.close()
@@ -0,0 +1,20 @@
+import math
+
+CITY_COORDINATES = {
+    "Нижний Новгород": (56.33, 44.00),
+    "Санкт-Петербург": (59.94, 30.31),
+    "Москва": (55.76, 37.62),
+    "Анапа": (44.89, 37.32),
+    "Кострома": (57.77, 40.93),
+    "Владимир": (56.13, 40.41),
+    "Великий Устюг": (60.76, 46.30),
+    "Вологда": (59.22, 39.89),
+    "Архангельск": (64.54, 40.54),
+    "Ярославль": (57.63, 39.87),
+}
+
+
+def distance_km(origin: tuple[float, float], target: tuple[float, float]) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (*origin, *target))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6371 * math.asin(math.sqrt(a))
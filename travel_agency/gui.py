@@ -0,0 +1,441 @@
+import time
+import tkinter as tk
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk, messagebox
+from datetime import datetime, date, timedelta
+
+from .images import CityImages
+from .orders import OrderStore
+from .payment import CreditCard, PayPal, BankTransfer, Context
+from .search import SearchPipeline
+from .service import TravelService
+from .tracing import tracer, traced, configure_from_env
+from .widgets import OfferList
+
+SEARCH_POLL_MS = 50
+DESTINATION_SUGGESTIONS = 10
+
+
+class TravelApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Сервис путешествий")
+        self.root.geometry("1200x700+0+10")
+
+        self.travel_service = TravelService()
+        self.search_pipeline = SearchPipeline(self.travel_service)
+        self.search_id = 0
+        self.search_started = 0.0
+        self.order_store = OrderStore()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.notebook = ttk.Notebook(root)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
+
+        self.setup_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.setup_tab, text="Выбор параметров")
+
+        self.results_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.results_tab, text="Результаты")
+
+        self.payment_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.payment_tab, text="Оплата")
+
+        self.city_images = CityImages()
+        self.current_city_image = None
+        # Миниатюры городов готовятся в отдельном потоке, чтобы не занимать потоки поиска.
+        self.image_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="images")
+        self.image_executor.submit(self.city_images.prepare, list(self.travel_service.cities))
+
+        self.setup_parameters_tab()
+        self.setup_results_tab()
+        self.setup_payment_tab()
+
+        self.available_tickets = []
+        self.available_hotels = []
+        self.available_tours = []
+        self.available_services = []
+        self.selected_ticket = None
+        self.selected_hotel = None
+        self.selected_tours = []
+        self.selected_services = []
+        self.travel_package = None
+        self.package_type = None
+        self.booking_key = None
+
+    def setup_parameters_tab(self):
+        parameters_frame = ttk.Frame(self.setup_tab)
+        parameters_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        self.image_frame = ttk.Label(self.setup_tab)
+        self.image_frame.pack(fill=tk.BOTH, padx=5, pady=50, anchor=tk.NE)
+
+        ttk.Label(parameters_frame, text="Город отправления:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
+        self.departure_entry = ttk.Entry(parameters_frame)
+        self.departure_entry.grid(row=0, column=0, padx=200, pady=5, sticky=tk.EW)
+        self.departure_entry.insert(0, "Ярославль")
+
+        ttk.Label(parameters_frame, text="Город назначения:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
+        # Поле назначения принимает не только город: "музей" или "дед мороз" подскажут города
+        # с такими отелями и экскурсиями, опечатки исправляет нечеткий поиск.
+        self.destination_combo = ttk.Combobox(parameters_frame, values=self.travel_service.cities)
+        self.destination_combo.grid(row=1, column=0, padx=200, pady=5, sticky=tk.EW)
+        self.destination_combo.current(0)
+        self.destination_combo.bind("<<ComboboxSelected>>", self.update_image)
+        self.destination_combo.bind("<KeyRelease>", self.suggest_destinations)
+
+        self.update_image(self)
+
+        ttk.Label(parameters_frame, text="Дата начала (ГГГГ-ММ-ДД):").grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
+        self.start_date_entry = ttk.Entry(parameters_frame)
+        self.start_date_entry.grid(row=2, column=0, padx=200, pady=5, sticky=tk.EW)
+        self.start_date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+
+        ttk.Label(parameters_frame, text="Дата окончания (ГГГГ-ММ-ДД):").grid(row=3, column=0, padx=5, pady=5,
+                                                                              sticky=tk.W)
+        self.end_date_entry = ttk.Entry(parameters_frame)
+        self.end_date_entry.grid(row=3, column=0, padx=200, pady=5, sticky=tk.EW)
+        self.end_date_entry.insert(0, (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d"))
+
+        ttk.Label(parameters_frame, text="Тип путешествия:").grid(row=4, column=0, padx=5, pady=5, sticky=tk.W)
+        self.travel_type_var = tk.StringVar(value="basic")
+        (ttk.Radiobutton(parameters_frame, text="Базовый", variable=self.travel_type_var, value="basic").grid
+         (row=4, column=0, padx=200, pady=5, sticky=tk.W))
+        (ttk.Radiobutton(parameters_frame, text="Премиум", variable=self.travel_type_var, value="premium").grid
+         (row=5, column=0, padx=200, pady=5, sticky=tk.W))
+
+        self.search_options_button = ttk.Button(parameters_frame, text="Поиск вариантов", command=self.search_options)
+        self.search_options_button.grid(row=6, column=0, columnspan=2, pady=10)
+
+        self.tickets_frame = ttk.LabelFrame(parameters_frame, text="Билеты")
+        self.tickets_frame.grid(row=7, column=0, columnspan=2, padx=5, pady=5, sticky=tk.EW)
+
+        self.hotels_frame = ttk.LabelFrame(parameters_frame, text="Отели")
+        self.hotels_frame.grid(row=8, column=0, columnspan=2, padx=5, pady=5, sticky=tk.EW)
+
+        self.tours_frame = ttk.LabelFrame(parameters_frame, text="Экскурсии")
+        self.tours_frame.grid(row=9, column=0, columnspan=2, padx=5, pady=5, sticky=tk.EW)
+
+        self.services_frame = ttk.LabelFrame(parameters_frame, text="Полезные услуги")
+        self.services_frame.grid(row=10, column=0, columnspan=2, padx=5, pady=5, sticky=tk.EW)
+
+        self.tickets_list = OfferList(self.tickets_frame, lambda ticket: ticket.get_description(),
+                                      sort_keys={"по цене": (lambda ticket: ticket.price, False)})
+        self.tickets_list.pack(fill=tk.X)
+
+        self.hotels_list = OfferList(self.hotels_frame, lambda hotel: hotel.get_description(),
+                                     sort_keys={"по цене": (lambda hotel: hotel.price, False),
+                                                "по рейтингу": (lambda hotel: hotel.rating, True),
+                                                "по звездам": (lambda hotel: hotel.star, True)},
+                                     filters={"все": None,
+                                              "от 4*": lambda hotel: hotel.star >= 4,
+                                              "рейтинг от 4.5": lambda hotel: hotel.rating >= 4.5})
+        self.hotels_list.pack(fill=tk.X)
+
+        self.tours_list = OfferList(self.tours_frame, lambda tour: tour.get_description(), multiple=True,
+                                    sort_keys={"по цене": (lambda tour: tour.price, False)})
+        self.tours_list.pack(fill=tk.X)
+
+        self.services_list = OfferList(
+            self.services_frame,
+            lambda service: f"{service.get_description()} (цена: {service.get_price()} руб.)",
+            multiple=True
+        )
+        self.services_list.pack(fill=tk.X)
+
+        self.create_package_button = ttk.Button(parameters_frame, text="Создать пакет", command=self.create_package,
+                                                state=tk.DISABLED)
+        self.create_package_button.grid(row=11, column=0, columnspan=2, pady=10)
+
+    def close(self):
+        self.search_pipeline.shutdown()
+        self.image_executor.shutdown(wait=False, cancel_futures=True)
+        self.order_store.close()
+        tracer.shutdown()
+        self.root.destroy()
+
+    def cancel_search(self):
+        self.search_id += 1
+        self.search_pipeline.cancel()
+
+    @traced("gui.update_image")
+    def update_image(self, event):
+        if self.search_pipeline.futures:
+            self.cancel_search()
+        city = self.destination_combo.get()
+        self.current_city_image = self.city_images.get(city)
+        self.image_frame.config(image=self.current_city_image)
+
+    @traced("gui.suggest_destinations")
+    def suggest_destinations(self, event):
+        query = self.destination_combo.get()
+        if not query.strip():
+            self.destination_combo.config(values=self.travel_service.cities)
+            return
+        hits = self.travel_service.search_catalogue(query, limit=DESTINATION_SUGGESTIONS * 20, prefix=True)
+        cities = list(dict.fromkeys(hit.city for hit in hits))[:DESTINATION_SUGGESTIONS]
+        self.destination_combo.config(values=cities)
+
+    def search_options(self):
+        try:
+            departure = self.departure_entry.get().strip()
+            destination = self.destination_combo.get()
+            start_date = date.fromisoformat(self.start_date_entry.get().strip())
+            end_date = date.fromisoformat(self.end_date_entry.get().strip())
+            package_type = self.travel_type_var.get()
+
+            if not departure:
+                raise ValueError("Введите город отправления")
+            if destination not in self.travel_service.cities:
+                raise ValueError("Выберите город назначения из списка")
+            if end_date <= start_date:
+                raise ValueError("Дата окончания должна быть позже даты начала")
+            if start_date < self.travel_service.clock.today():
+                raise ValueError("Ваш рейс улетел")
+
+            self.create_package_button.config(state=tk.DISABLED)
+            self.search_id += 1
+            self.search_started = time.perf_counter()
+            futures = self.search_pipeline.submit(departure, destination, start_date, end_date, package_type)
+            self.root.after(SEARCH_POLL_MS, self.poll_search, self.search_id, dict(futures))
+
+        except ValueError as e:
+            messagebox.showerror("Ошибка", str(e))
+
+    def poll_search(self, search_id, futures):
+        if search_id != self.search_id:
+            return
+
+        results = {
+            "tickets": ("available_tickets", self.show_tickets),
+            "hotels": ("available_hotels", self.show_hotels),
+            "tours": ("available_tours", self.show_tours),
+            "services": ("available_services", self.show_services),
+        }
+        for name, future in list(futures.items()):
+            if not future.done():
+                continue
+            del futures[name]
+            if future.cancelled():
+                continue
+            if future.exception() is not None:
+                self.cancel_search()
+                messagebox.showerror("Ошибка", f"Ошибка при поиске: {future.exception()}")
+                return
+            attribute, show = results[name]
+            setattr(self, attribute, future.result())
+            show()
+
+        if futures:
+            self.root.after(SEARCH_POLL_MS, self.poll_search, search_id, futures)
+        else:
+            self.search_pipeline.futures = {}
+            self.create_package_button.config(state=tk.NORMAL)
+            # От нажатия "Поиск вариантов" до отрисовки всех результатов.
+            tracer.record("gui.search", time.perf_counter() - self.search_started)
+
+    @traced("gui.show_tickets")
+    def show_tickets(self):
+        self.tickets_list.set_items(self.available_tickets)
+
+    @traced("gui.show_hotels")
+    def show_hotels(self):
+        self.hotels_list.set_items(self.available_hotels)
+
+    @traced("gui.show_tours")
+    def show_tours(self):
+        self.tours_list.set_items(self.available_tours)
+
+    @traced("gui.show_services")
+    def show_services(self):
+        self.services_list.set_items(self.available_services)
+
+    @traced("gui.create_package")
+    def create_package(self):
+        try:
+            ticket_idx = self.tickets_list.get_selected()
+            hotel_idx = self.hotels_list.get_selected()
+
+            if ticket_idx == -1:
+                raise ValueError("Выберите билет")
+            if hotel_idx == -1:
+                raise ValueError("Выберите отель")
+
+            self.selected_ticket = self.available_tickets[ticket_idx]
+            self.selected_hotel = self.available_hotels[hotel_idx]
+            self.selected_tours = self.tours_list.get_selected_items()
+            self.selected_services = self.services_list.get_selected_items()
+
+            # Номера бронируются при оплате, а не при каждой сборке пакета.
+            builder = self.travel_service.create_package_builder(self.travel_type_var.get())
+
+            builder.add_ticket(
+                departure=self.selected_ticket.departure,
+                destination=self.selected_ticket.destination,
+                date_forward=self.selected_ticket.date_forward,
+                date_backward=self.selected_ticket.date_backward,
+                price=self.selected_ticket.price,
+                time_forward=self.selected_ticket.time_forward,
+                time_backward=self.selected_ticket.date_backward
+            )
+
+            builder.add_hotel(
+                name=self.selected_hotel.name,
+                city=self.selected_hotel.city,
+                check_in=self.selected_hotel.check_in,
+                check_out=self.selected_hotel.check_out,
+                price_per_night=self.selected_hotel.price,
+                rating=self.selected_hotel.rating,
+                star=self.selected_hotel.star
+            )
+
+            for tour in self.selected_tours:
+                builder.add_tour(
+                    name=tour.name,
+                    description=tour.description,
+                    price=tour.price,
+                    season=tour.season
+                )
+
+            for service in self.selected_services:
+                builder.add_service(service)
+
+            self.travel_package = builder.get_package()
+            self.package_type = self.travel_type_var.get()
+            self.booking_key = uuid.uuid4().hex
+
+            self.show_results(self.travel_package)
+
+            self.notebook.select(self.results_tab)
+
+        except ValueError as e:
+            messagebox.showerror("Ошибка", str(e))
+
+    def setup_results_tab(self):
+        self.results_text = tk.Text(self.results_tab, wrap=tk.WORD, font='Times 14')
+        self.results_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.results_text.insert(tk.END, "Здесь будет отображаться ваше путешествие после создания.")
+        self.results_text.config(state=tk.DISABLED)
+        self.pay_button = ttk.Button(self.results_tab, text="Перейти к оплате", command=self.correct_pay_button)
+        self.pay_button.pack(pady=10)
+
+    def correct_pay_button(self):
+        try:
+            amount = self.travel_package.get_total_price()
+            self.notebook.select(self.payment_tab)
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Пакет не создан")
+
+    @traced("gui.show_results")
+    def show_results(self, package):
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, package.get_description())
+        self.results_text.config(state=tk.DISABLED)
+
+    def setup_payment_tab(self):
+        self.payment_frame = ttk.Frame(self.payment_tab)
+        self.payment_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        ttk.Label(self.payment_frame, text="Способ оплаты:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
+        self.payment_method = ttk.Combobox(self.payment_frame,
+                                           values=["Кредитная карта", "PayPal", "Банковский перевод"], state='readonly')
+        self.payment_method.grid(row=0, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.payment_method.current(0)
+        self.payment_method.bind("<<ComboboxSelected>>", self.update_payment_fields)
+
+        self.payment_fields_frame = ttk.Frame(self.payment_frame)
+        self.payment_fields_frame.grid(row=1, column=0, columnspan=2, padx=5, pady=5, sticky=tk.EW)
+
+        self.pay_button = ttk.Button(self.payment_frame, text="Оплатить", command=self.process_payment)
+        self.pay_button.grid(row=2, column=0, columnspan=2, pady=10)
+
+        self.setup_credit_card_fields()
+
+    def update_payment_fields(self, event):
+        for widget in self.payment_fields_frame.winfo_children():
+            widget.destroy()
+
+        method = self.payment_method.get()
+        if method == "Кредитная карта":
+            self.setup_credit_card_fields()
+        elif method == "PayPal":
+            self.setup_paypal_fields()
+        elif method == "Банковский перевод":
+            self.setup_bank_transfer_fields()
+
+    def setup_credit_card_fields(self):
+        ttk.Label(self.payment_fields_frame, text="Номер карты:").grid(row=0, column=0, padx=5, pady=2, sticky=tk.W)
+        self.card_number = ttk.Entry(self.payment_fields_frame)
+        self.card_number.grid(row=0, column=1, padx=5, pady=2, sticky=tk.EW)
+
+        ttk.Label(self.payment_fields_frame, text="Держатель карты:").grid(row=1, column=0, padx=5, pady=2, sticky=tk.W)
+        self.card_holder = ttk.Entry(self.payment_fields_frame)
+        self.card_holder.grid(row=1, column=1, padx=5, pady=2, sticky=tk.EW)
+
+        ttk.Label(self.payment_fields_frame, text="Срок действия:").grid(row=2, column=0, padx=5, pady=2, sticky=tk.W)
+        self.card_expiry = ttk.Entry(self.payment_fields_frame)
+        self.card_expiry.grid(row=2, column=1, padx=5, pady=2, sticky=tk.EW)
+
+        ttk.Label(self.payment_fields_frame, text="CVV:").grid(row=3, column=0, padx=5, pady=2, sticky=tk.W)
+        self.card_cvv = ttk.Entry(self.payment_fields_frame, show="*")
+        self.card_cvv.grid(row=3, column=1, padx=5, pady=2, sticky=tk.EW)
+
+    def setup_paypal_fields(self):
+        ttk.Label(self.payment_fields_frame, text="Email PayPal:").grid(row=0, column=0, padx=5, pady=2, sticky=tk.W)
+        self.paypal_email = ttk.Entry(self.payment_fields_frame)
+        self.paypal_email.grid(row=0, column=1, padx=5, pady=2, sticky=tk.EW)
+
+    def setup_bank_transfer_fields(self):
+        ttk.Label(self.payment_fields_frame, text="Номер счета:").grid(row=0, column=0, padx=5, pady=2, sticky=tk.W)
+        self.account_number = ttk.Entry(self.payment_fields_frame)
+        self.account_number.grid(row=0, column=1, padx=5, pady=2, sticky=tk.EW)
+
+        ttk.Label(self.payment_fields_frame, text="Банк:").grid(row=1, column=0, padx=5, pady=2, sticky=tk.W)
+        self.bank_name = ttk.Entry(self.payment_fields_frame)
+        self.bank_name.grid(row=1, column=1, padx=5, pady=2, sticky=tk.EW)
+
+    @traced("gui.process_payment")
+    def process_payment(self):
+        try:
+            method = self.payment_method.get()
+
+            if method == "Кредитная карта":
+                strategy = CreditCard(
+                    card_number=self.card_number.get(),
+                    card_holder=self.card_holder.get(),
+                    expiry_date=self.card_expiry.get(),
+                    cvv=self.card_cvv.get()
+                )
+                customer = self.card_holder.get()
+            elif method == "PayPal":
+                strategy = PayPal(email=self.paypal_email.get())
+                customer = self.paypal_email.get()
+            else:
+                strategy = BankTransfer(
+                    account_number=self.account_number.get(),
+                    bank_name=self.bank_name.get()
+                )
+                customer = self.account_number.get()
+            context = Context(strategy)
+            booking = self.travel_service.booking_service.book(self.travel_package, context, self.booking_key)
+            self.order_store.place(self.travel_package, self.package_type, customer, booking.status,
+                                   order_id=booking.booking_id)
+            if booking.status == "confirmed":
+                messagebox.showinfo("Успех", "Оплата прошла успешно! \n Вперед идет локомотив!")
+            else:
+                messagebox.showerror("Ошибка", "Не удалось выполнить оплату "
+                                               "\n(проверьте корректность ввода данных)")
+
+        except ValueError as e:
+            messagebox.showerror("Ошибка", str(e))
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Ошибка при обработке платежа")
+
+
+def main():
+    configure_from_env()
+    root = tk.Tk()
+    app = TravelApp(root)
+    root.mainloop()
@@ -0,0 +1,131 @@
+import argparse
+import os
+import re
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from PIL import Image, ImageTk
+
+from .tracing import traced
+
+IMAGES_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "travel_agency" / "thumbnails"
+MAX_PHOTOS = 4
+
+IMAGE_SIZES = {
+    "Москва": (470, 600),
+    "Нижний Новгород": (470, 600),
+}
+DEFAULT_IMAGE_SIZE = (600, 400)
+THUMBNAIL_NAME = re.compile(r"(?P<city>.+)-\d+-\d+-\d+x\d+\.jpg")
+TEMPORARY_NAME = re.compile(r"\..+\.jpg\.\d+\.\d+")
+TEMPORARY_MAX_AGE = 3600
+
+
+class CityImages:
+    def __init__(self, images_dir: Path = IMAGES_DIR, cache_dir: Path = CACHE_DIR, max_photos: int = MAX_PHOTOS):
+        self.images_dir = Path(images_dir)
+        self.cache_dir = Path(cache_dir)
+        self.max_photos = max_photos
+        self.photos: OrderedDict[str, ImageTk.PhotoImage] = OrderedDict()
+
+    @traced("images.get")
+    def get(self, city: str) -> ImageTk.PhotoImage:
+        photo = self.photos.get(city)
+        if photo is not None:
+            self.photos.move_to_end(city)
+            return photo
+
+        photo = ImageTk.PhotoImage(self.load_thumbnail(city))
+        self.photos[city] = photo
+        if len(self.photos) > self.max_photos:
+            self.photos.popitem(last=False)
+        return photo
+
+    def thumbnail_path(self, city: str) -> Path | None:
+        # В имени миниатюры - время изменения и размер исходника, поэтому
+        # после замены фотографии старая миниатюра просто перестает совпадать.
+        size = IMAGE_SIZES.get(city, DEFAULT_IMAGE_SIZE)
+        try:
+            stat = (self.images_dir / f"{city}.jpg").stat()
+        except OSError:
+            return None
+        return self.cache_dir / f"{city}-{stat.st_mtime_ns}-{stat.st_size}-{size[0]}x{size[1]}.jpg"
+
+    def _build_thumbnail(self, city: str, thumbnail_path: Path) -> Image.Image:
+        size = IMAGE_SIZES.get(city, DEFAULT_IMAGE_SIZE)
+        image = Image.open(self.images_dir / f"{city}.jpg")
+        # draft позволяет декодеру JPEG сразу уменьшить изображение в 2-8 раз.
+        image.draft("RGB", size)
+        image = image.convert("RGB").resize(size)
+        # Запись через временный файл: фоновая подготовка и окно могут строить одну миниатюру.
+        temporary = thumbnail_path.with_name(f".{thumbnail_path.name}.{os.getpid()}.{id(image)}")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            image.save(temporary, format="JPEG", quality=90)
+            os.replace(temporary, thumbnail_path)
+        except OSError:
+            temporary.unlink(missing_ok=True)
+        return image
+
+    def prepare(self, cities: list[str]) -> tuple[int, int]:
+        # Строит недостающие миниатюры городов из cities и удаляет их устаревшие версии.
+        # Кеш может быть общим для нескольких копий приложения, поэтому миниатюры других
+        # городов не трогаются, а временные файлы удаляются только если их давно бросили.
+        # Возвращает число построенных и удаленных файлов.
+        current = {}
+        built = 0
+        for city in cities:
+            thumbnail_path = self.thumbnail_path(city)
+            if thumbnail_path is None:
+                continue
+            current[city] = thumbnail_path.name
+            if not thumbnail_path.exists():
+                self._build_thumbnail(city, thumbnail_path)
+                built += 1
+        removed = 0
+        try:
+            entries = list(self.cache_dir.iterdir())
+        except OSError:
+            entries = []
+        now = time.time()
+        for entry in entries:
+            match = THUMBNAIL_NAME.fullmatch(entry.name)
+            try:
+                if match:
+                    name = current.get(match["city"])
+                    if name is None or name == entry.name:
+                        continue
+                elif not TEMPORARY_NAME.fullmatch(entry.name) or now - entry.stat().st_mtime < TEMPORARY_MAX_AGE:
+                    continue
+                entry.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return built, removed
+
+    @traced("images.load_thumbnail")
+    def load_thumbnail(self, city: str) -> Image.Image:
+        thumbnail_path = self.thumbnail_path(city)
+        if thumbnail_path is None:
+            print(f"Изображение для города {city} не найдено")
+            return Image.new('RGB', (400, 300), color='black')
+        try:
+            return Image.open(thumbnail_path)
+        except OSError:
+            return self._build_thumbnail(city, thumbnail_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Подготовка миниатюр фотографий городов")
+    parser.add_argument("--images-dir", type=Path, default=IMAGES_DIR)
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR)
+    args = parser.parse_args()
+    cities = [path.stem for path in sorted(args.images_dir.glob("*.jpg"))]
+    built, removed = CityImages(args.images_dir, args.cache_dir).prepare(cities)
+    print(f"Миниатюр построено: {built}, удалено устаревших: {removed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from typing import Iterator
+
+SEASONS = ["зима", "весна", "лето", "осень"]
+PACKAGE_TYPES = ["basic", "premium"]
+
+
+def tour_keys(city: str, tour_data: dict) -> list[tuple[str, str, str]]:
+    # Премиум-пакет включает все туры города, базовый - только базовые.
+    package_types = ["premium"] if tour_data["type"] == "premium" else PACKAGE_TYPES
+    seasons = SEASONS if tour_data["season"] == "все" else [tour_data["season"]]
+    return [(city, season, package_type) for season in seasons for package_type in package_types]
+
+
+class Inventory:
+    def __init__(self, hotels_data: dict[str, list[dict]], tours_data: dict[str, list[dict]]):
+        self.hotels_data = hotels_data
+        self.tours_data = tours_data
+        self.version = 0
+        self._hotels_index: dict[tuple[str, str], list[dict]] = {}
+        self._tours_index: dict[tuple[str, str, str], list[dict]] = {}
+        self._hotels_by_name: dict[tuple[str, str], dict] = {}
+        self.rebuild()
+
+    def rebuild(self):
+        self._hotels_index = {}
+        self._tours_index = {}
+        self._hotels_by_name = {}
+        for city, city_hotels in self.hotels_data.items():
+            for hotel_data in city_hotels:
+                self._index_hotel(city, hotel_data)
+        for city, city_tours in self.tours_data.items():
+            for tour_data in city_tours:
+                self._index_tour(city, tour_data)
+        self.version += 1
+
+    def _index_hotel(self, city: str, hotel_data: dict):
+        self._hotels_index.setdefault((city, hotel_data["type"]), []).append(hotel_data)
+        self._hotels_by_name.setdefault((city, hotel_data["name"]), hotel_data)
+
+    def _index_tour(self, city: str, tour_data: dict):
+        for key in tour_keys(city, tour_data):
+            self._tours_index.setdefault(key, []).append(tour_data)
+
+    def add_hotel(self, city: str, hotel_data: dict):
+        self.hotels_data.setdefault(city, []).append(hotel_data)
+        self._index_hotel(city, hotel_data)
+        self.version += 1
+
+    def add_tour(self, city: str, tour_data: dict):
+        self.tours_data.setdefault(city, []).append(tour_data)
+        self._index_tour(city, tour_data)
+        self.version += 1
+
+    def get_hotels(self, city: str, package_type: str) -> list[dict]:
+        return self._hotels_index.get((city, package_type), [])
+
+    def get_tours(self, city: str, season: str, package_type: str) -> list[dict]:
+        return self._tours_index.get((city, season, package_type), [])
+
+    def get_cities(self) -> list[str]:
+        return list(dict.fromkeys([*self.hotels_data, *self.tours_data]))
+
+    def find_hotel(self, city: str, name: str) -> dict | None:
+        return self._hotels_by_name.get((city, name))
+
+    def iter_hotels(self) -> Iterator[tuple[str, dict]]:
+        for city, city_hotels in self.hotels_data.items():
+            for hotel_data in city_hotels:
+                yield city, hotel_data
+
+    def iter_tours(self) -> Iterator[tuple[str, dict]]:
+        for city, city_tours in self.tours_data.items():
+            for tour_data in city_tours:
+                yield city, tour_data
@@ -0,0 +1,200 @@
+import random
+from abc import ABC, abstractmethod
+from datetime import date
+
+from .fares import FareEngine
+
+
+class Ticket(ABC):
+    __slots__ = ("departure", "destination", "date_forward", "date_backward", "price", "time_forward",
+                 "time_backward")
+
+    def __init__(self):
+        today = date.today()
+        self.departure: str = ""
+        self.destination: str = ""
+        self.date_forward: date = today
+        self.date_backward: date = today
+        self.price: float = 0.0
+        self.time_forward: str = ""
+        self.time_backward: str = ""
+
+    @abstractmethod
+    def get_description(self) -> str:
+        pass
+
+    @abstractmethod
+    def set_price(self, fares: FareEngine, flight: int = 0):
+        pass
+
+    @abstractmethod
+    def set_times(self, rng: random.Random):
+        pass
+
+
+class BasicTicket(Ticket):
+    __slots__ = ()
+    price_range = (10000, 30000)
+
+    def get_description(self) -> str:
+        return (f"Авиабилет эконом-класс, вылет вперед в {self.time_forward},"
+                f" вылет назад в {self.time_backward}, цена: {self.price} руб.")
+
+    def set_price(self, fares: FareEngine, flight: int = 0):
+        self.price = fares.quote(self.departure, self.destination, self.date_forward, "basic", flight)
+
+    def set_times(self, rng: random.Random):
+        self.time_forward = (f"{rng.randint(0, 23)}:"
+                             f"{rng.randint(0, 5)}{rng.randint(0, 9)}")
+        self.time_backward = (f"{rng.randint(0, 23)}:"
+                              f"{rng.randint(0, 5)}{rng.randint(0, 9)}")
+
+
+class PremiumTicket(Ticket):
+    __slots__ = ()
+    price_range = (50000, 100000)
+
+    def get_description(self) -> str:
+        return (f"Авиабилет бизнес-класс, вылет вперед в {self.time_forward},"
+                f" вылет назад в {self.time_backward}, цена: {self.price} руб.")
+
+    def set_price(self, fares: FareEngine, flight: int = 0):
+        self.price = fares.quote(self.departure, self.destination, self.date_forward, "premium", flight)
+
+    def set_times(self, rng: random.Random):
+        self.time_forward = (f"{rng.randint(0, 23)}:"
+                             f"{rng.randint(0, 5)}{rng.randint(0, 9)}")
+        self.time_backward = (f"{rng.randint(0, 23)}:"
+                              f"{rng.randint(0, 5)}{rng.randint(0, 9)}")
+
+
+class Hotel(ABC):
+    __slots__ = ("name", "city", "check_in", "check_out", "price", "rating", "star", "rooms")
+
+    def __init__(self):
+        today = date.today()
+        self.name: str = ""
+        self.city: str = ""
+        self.check_in: date = today
+        self.check_out: date = today
+        self.price: float = 0.0
+        self.rating: float = 0.0
+        self.star: int = 0
+        self.rooms: int = 1
+
+    def get_total_price(self) -> float:
+        return self.price * (self.check_out - self.check_in).days * self.rooms
+
+    @abstractmethod
+    def get_description(self) -> str:
+        pass
+
+
+class BasicHotel(Hotel):
+    __slots__ = ()
+
+    def get_description(self) -> str:
+        nights = (self.check_out - self.check_in).days
+        rooms = f" × {self.rooms} номеров" if self.rooms > 1 else ""
+        return (f"{self.name}: {self.star}*, рейтинг: {self.rating}, цена за ночь: {self.price} руб., "
+                f"{nights} ночей{rooms}: {self.get_total_price()} руб.")
+
+
+class PremiumHotel(Hotel):
+    __slots__ = ()
+
+    def get_description(self) -> str:
+        nights = (self.check_out - self.check_in).days
+        rooms = f" × {self.rooms} номеров" if self.rooms > 1 else ""
+        return (f"{self.name}: {self.star}*, рейтинг: {self.rating}, цена за ночь: {self.price} руб., "
+                f"{nights} ночей{rooms}: {self.get_total_price()} руб.")
+
+
+class Tour(ABC):
+    __slots__ = ("name", "description", "price", "season")
+
+    def __init__(self):
+        self.name: str = ""
+        self.description: str = ""
+        self.price: float = 0.0
+        self.season: str = ""
+
+    @abstractmethod
+    def get_description(self) -> str:
+        pass
+
+
+class BasicTour(Tour):
+    __slots__ = ()
+
+    def get_description(self) -> str:
+        return f"{self.name} - {self.description}, сезон: {self.season}, цена: {self.price} руб."
+
+
+class PremiumTour(Tour):
+    __slots__ = ()
+
+    def get_description(self) -> str:
+        return f"{self.name} - {self.description}, сезон: {self.season}, цена: {self.price} руб."
+
+
+class AdditionalServices(ABC):
+    @abstractmethod
+    def get_description(self) -> str:
+        pass
+
+    @abstractmethod
+    def get_price(self) -> float:
+        pass
+
+
+class SimCard(AdditionalServices):
+    def __init__(self, city: str, selected_tariff: str):
+        self.city = city
+        self.selected_tariff = selected_tariff
+        self.tariffs = {
+            "basic": {"data": "10GB", "price": 700},
+            "premium": {"data": "50GB", "price": 2000},
+        }
+
+    def get_description(self) -> str:
+        tariff = self.tariffs[self.selected_tariff]
+        return f"SIM-карта ({self.city}): {tariff['data']} интернета (цена: {self.get_price()} руб.)"
+
+    def get_price(self) -> float:
+        return self.tariffs[self.selected_tariff]["price"]
+
+
+class BusPass(AdditionalServices):
+    def __init__(self, city: str, duration: int):
+        self.city = city
+        self.duration = duration
+        self.prices = {
+            30: 2000,
+            7: 800
+        }
+
+    def get_description(self) -> str:
+        if self.duration > 7:
+            return f"Проездной на городской транспорт ({self.city}) на 30 дней (цена: {self.get_price()} руб.)"
+        else:
+            return f"Проездной на городской транспорт ({self.city}) на 7 дней (цена: {self.get_price()} руб.)"
+
+    def get_price(self) -> float:
+        if self.duration > 7:
+            return self.prices[30]
+        else:
+            return self.prices[7]
+
+
+class GuideBook(AdditionalServices):
+    def __init__(self, city: str, language: str = "русский"):
+        self.city = city
+        self.language = language
+        self.price = 800
+
+    def get_description(self) -> str:
+        return f"Путеводитель по городу {self.city}, язык {self.language} (цена: {self.get_price()} руб.)"
+
+    def get_price(self) -> float:
+        return self.price
@@ -0,0 +1,112 @@
+import heapq
+from datetime import date
+
+from .models import Ticket, Hotel, Tour, AdditionalServices
+from .package import TravelPackage
+from .service import TravelService
+
+OBJECTIVES = ["price", "rating"]
+
+
+def stay_price(hotel: Hotel) -> float:
+    return hotel.get_total_price()
+
+
+class PackageOption:
+    __slots__ = ("price", "ticket", "hotel", "tours", "services")
+
+    def __init__(self, price: float, ticket: Ticket, hotel: Hotel, tours: list[Tour],
+                 services: list[AdditionalServices]):
+        self.price = price
+        self.ticket = ticket
+        self.hotel = hotel
+        self.tours = tours
+        self.services = services
+
+
+class PackageOptimizer:
+    def __init__(self, travel_service: TravelService):
+        self.travel_service = travel_service
+
+    def optimize(self, tickets: list[Ticket], hotels: list[Hotel], budget: float | None = None,
+                 required_tours: list[Tour] | None = None, required_services: list[AdditionalServices] | None = None,
+                 k: int = 10, objective: str = "price") -> list[PackageOption]:
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Неизвестный критерий: {objective}")
+        tours = list(required_tours or [])
+        services = list(required_services or [])
+        fixed = sum(tour.price for tour in tours) + sum(service.get_price() for service in services)
+        if not tickets or not hotels:
+            return []
+
+        tickets = sorted(tickets, key=lambda ticket: ticket.price)
+        hotel_prices = {id(hotel): stay_price(hotel) for hotel in hotels}
+        if budget is not None:
+            # Отсекаем предложения, которые не укладываются в бюджет даже в паре с самым дешевым.
+            cheapest_hotel = min(hotel_prices.values())
+            tickets = [ticket for ticket in tickets if fixed + ticket.price + cheapest_hotel <= budget]
+            if not tickets:
+                return []
+            hotels = [hotel for hotel in hotels if fixed + tickets[0].price + hotel_prices[id(hotel)] <= budget]
+            if not hotels:
+                return []
+
+        if objective == "price":
+            hotels = sorted(hotels, key=lambda hotel: hotel_prices[id(hotel)])
+
+            def key(h, t):
+                return hotel_prices[id(hotels[h])] + tickets[t].price
+        else:
+            hotels = sorted(hotels, key=lambda hotel: (-hotel.rating, hotel_prices[id(hotel)]))
+
+            def key(h, t):
+                return -hotels[h].rating, hotel_prices[id(hotels[h])] + tickets[t].price
+
+        # Ключ не убывает ни по номеру отеля, ни по номеру билета, поэтому
+        # k лучших пар находятся обходом от (0, 0) без перебора всех пар.
+        options = []
+        heap = [(key(0, 0), 0, 0)]
+        while heap and len(options) < k:
+            _, h, t = heapq.heappop(heap)
+            price = fixed + hotel_prices[id(hotels[h])] + tickets[t].price
+            within_budget = budget is None or price <= budget
+            if within_budget:
+                options.append(PackageOption(price, tickets[t], hotels[h], tours, services))
+            elif objective == "price":
+                break
+            if t == 0 and h + 1 < len(hotels):
+                heapq.heappush(heap, (key(h + 1, 0), h + 1, 0))
+            if within_budget and t + 1 < len(tickets):
+                heapq.heappush(heap, (key(h, t + 1), h, t + 1))
+        return options
+
+    def find_packages(self, departure: str, destination: str, start_date: date, end_date: date, package_type: str,
+                      budget: float | None = None, required_tours: list[str] | None = None,
+                      required_services: list[AdditionalServices] | None = None, k: int = 10,
+                      objective: str = "price") -> list[PackageOption]:
+        service = self.travel_service
+        tickets = service.generate_tickets(departure, destination, start_date, end_date, package_type)
+        hotels = service.get_available_hotels(destination, package_type, start_date, end_date)
+        tours = []
+        if required_tours:
+            available_tours = {tour.name: tour for tour in service.get_available_tours(destination, package_type,
+                                                                                       start_date)}
+            for name in required_tours:
+                if name not in available_tours:
+                    raise ValueError(f"Тур {name} недоступен")
+                tours.append(available_tours[name])
+        return self.optimize(tickets, hotels, budget, tours, required_services, k, objective)
+
+    def build_package(self, option: PackageOption, package_type: str) -> TravelPackage:
+        builder = self.travel_service.create_package_builder(package_type)
+        ticket = option.ticket
+        builder.add_ticket(ticket.departure, ticket.destination, ticket.date_forward, ticket.date_backward,
+                           ticket.price, ticket.time_forward, ticket.time_backward)
+        hotel = option.hotel
+        builder.add_hotel(hotel.name, hotel.city, hotel.check_in, hotel.check_out, hotel.price, hotel.rating,
+                          hotel.star, hotel.rooms)
+        for tour in option.tours:
+            builder.add_tour(tour.name, tour.description, tour.price, tour.season)
+        for service in option.services:
+            builder.add_service(service)
+        return builder.get_package()
@@ -0,0 +1,293 @@
+import bisect
+import json
+import os
+import queue
+import threading
+import uuid
+from concurrent.futures import Future
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+from .factories import BasicTravel, PremiumTravel
+from .models import AdditionalServices, SimCard, BusPass, GuideBook
+from .package import TravelPackage, TravelPackageBuilder
+
+DATA_DIR = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share")) / "travel_agency" / "orders"
+LOG_NAME = "orders.log"
+SNAPSHOT_NAME = "orders.snapshot"
+SNAPSHOT_EVERY = 100_000
+MAX_BATCH = 1024
+
+FACTORIES = {"basic": BasicTravel, "premium": PremiumTravel}
+SERVICE_FIELDS = {
+    SimCard: ("sim", "city", "selected_tariff"),
+    BusPass: ("bus", "city", "duration"),
+    GuideBook: ("guide", "city", "language"),
+}
+SERVICE_TYPES = {fields[0]: service_type for service_type, fields in SERVICE_FIELDS.items()}
+_decode_header = json.JSONDecoder().raw_decode
+
+
+def service_to_list(service: AdditionalServices) -> list:
+    kind, *fields = SERVICE_FIELDS[type(service)]
+    return [kind, *(getattr(service, field) for field in fields)]
+
+
+def package_to_dict(package: TravelPackage) -> dict:
+    return {
+        "tickets": [[ticket.departure, ticket.destination, ticket.date_forward.isoformat(),
+                     ticket.date_backward.isoformat(), ticket.price, str(ticket.time_forward),
+                     str(ticket.time_backward)] for ticket in package.tickets],
+        "hotels": [[hotel.name, hotel.city, hotel.check_in.isoformat(), hotel.check_out.isoformat(), hotel.price,
+                    hotel.rating, hotel.star, hotel.rooms] for hotel in package.hotels],
+        "tours": [[tour.name, tour.description, tour.price, tour.season] for tour in package.tours],
+        "services": [service_to_list(service) for service in package.services],
+    }
+
+
+def package_from_dict(data: dict, package_type: str) -> TravelPackage:
+    builder = TravelPackageBuilder(FACTORIES[package_type]())
+    for departure, destination, date_forward, date_backward, *rest in data["tickets"]:
+        builder.add_ticket(departure, destination, date.fromisoformat(date_forward), date.fromisoformat(date_backward),
+                           *rest)
+    for name, city, check_in, check_out, *rest in data["hotels"]:
+        builder.add_hotel(name, city, date.fromisoformat(check_in), date.fromisoformat(check_out), *rest)
+    for tour in data["tours"]:
+        builder.add_tour(*tour)
+    for kind, *fields in data["services"]:
+        builder.add_service(SERVICE_TYPES[kind](*fields))
+    return builder.get_package()
+
+
+class Order:
+    # Сам пакет в памяти не хранится: запоминается файл и смещение записи,
+    # пакет читается с диска при обращении.
+    __slots__ = ("order_id", "customer", "created", "status", "amount", "package_type", "source", "offset")
+
+    def __init__(self, order_id: str, customer: str, created: datetime, status: str, amount: float,
+                 package_type: str, source: Path, offset: int):
+        self.order_id = order_id
+        self.customer = customer
+        self.created = created
+        self.status = status
+        self.amount = amount
+        self.package_type = package_type
+        self.source = source
+        self.offset = offset
+
+
+class OrderStore:
+    # Журнал и снимок - строки вида "заголовок JSON \t пакет JSON".
+    # Записи от разных потоков копятся в очереди и сбрасываются на диск пачкой с одним fsync.
+    def __init__(self, path: str | Path = DATA_DIR, sync: bool = True, snapshot_every: int = SNAPSHOT_EVERY):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.path / LOG_NAME
+        self.snapshot_path = self.path / SNAPSHOT_NAME
+        self.sync = sync
+        self.snapshot_every = snapshot_every
+        self.orders: dict[str, Order] = {}
+        self.by_customer: dict[str, list[Order]] = {}
+        self.by_date: list[tuple[datetime, str]] = []
+        self.seq = 0
+        self.log_records = 0
+        self.batches = 0
+        self.lock = threading.RLock()
+        self._recover()
+        self.log = open(self.log_path, "ab")
+        self.queue: queue.Queue = queue.Queue()
+        self.writer = threading.Thread(target=self._write_loop, name="order-store", daemon=True)
+        self.writer.start()
+
+    def _recover(self):
+        snapshot_seq = 0
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, "rb") as file:
+                header = file.readline()
+                snapshot_seq = json.loads(header)["seq"]
+                offset = len(header)
+                for line in file:
+                    self._apply(line, self.snapshot_path, offset)
+                    offset += len(line)
+        self.seq = snapshot_seq
+
+        if not self.log_path.exists():
+            return
+        valid = 0
+        with open(self.log_path, "rb") as file:
+            for line in file:
+                # Недописанная при сбое последняя запись отбрасывается.
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    seq = self._apply(line, self.log_path, valid, snapshot_seq)
+                except (KeyError, TypeError, ValueError):
+                    break
+                self.seq = max(self.seq, seq)
+                self.log_records += 1
+                valid += len(line)
+        if valid < self.log_path.stat().st_size:
+            os.truncate(self.log_path, valid)
+
+    def _apply(self, line: bytes, source: Path, offset: int, after_seq: int = -1) -> int:
+        header = _decode_header(line[:line.index(b"\t")].decode("utf-8"))[0]
+        if header["seq"] <= after_seq:
+            return header["seq"]
+        if header["op"] == "status":
+            order = self.orders.get(header["id"])
+            if order is None:
+                raise ValueError(f"Заказ {header['id']} не найден")
+            order.status = header["status"]
+            return header["seq"]
+
+        order = Order(header["id"], header["customer"], datetime.fromisoformat(header["created"]), header["status"],
+                      header["amount"], header["type"], source, offset)
+        previous = self.orders.get(order.order_id)
+        self.orders[order.order_id] = order
+        if previous is not None:
+            # Запись из журнала после снимка заменяет заказ, индекс по дате не меняется.
+            customer_orders = self.by_customer[previous.customer]
+            customer_orders[customer_orders.index(previous)] = order
+            return header["seq"]
+        self.by_customer.setdefault(order.customer, []).append(order)
+        item = (order.created, order.order_id)
+        if not self.by_date or self.by_date[-1] <= item:
+            self.by_date.append(item)
+        else:
+            bisect.insort(self.by_date, item)
+        return header["seq"]
+
+    def submit(self, package: TravelPackage, package_type: str, customer: str, status: str,
+               created: datetime | None = None, order_id: str | None = None) -> Future:
+        header = {"op": "put", "id": order_id or uuid.uuid4().hex, "customer": customer,
+                  "created": (created or datetime.now()).isoformat(), "status": status,
+                  "amount": package.get_total_price(), "type": package_type}
+        body = json.dumps(package_to_dict(package), ensure_ascii=False).encode("utf-8")
+        future = Future()
+        self.queue.put((header, body, future))
+        return future
+
+    def place(self, package: TravelPackage, package_type: str, customer: str, status: str,
+              created: datetime | None = None, order_id: str | None = None) -> Order:
+        if order_id is not None:
+            order = self.get(order_id)
+            if order is not None:
+                return order if order.status == status else self.update_status(order_id, status)
+        return self.submit(package, package_type, customer, status, created, order_id).result()
+
+    def update_status(self, order_id: str, status: str) -> Order:
+        if self.get(order_id) is None:
+            raise ValueError(f"Заказ {order_id} не найден")
+        future = Future()
+        self.queue.put(({"op": "status", "id": order_id, "status": status}, b"", future))
+        return future.result()
+
+    def _write_loop(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < MAX_BATCH:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            batch = [item for item in batch if item is not None]
+            if batch:
+                self._commit(batch)
+            if stop:
+                return
+
+    def _commit(self, batch: list[tuple[dict, bytes, Future]]):
+        with self.lock:
+            try:
+                lines = []
+                for header, body, _ in batch:
+                    self.seq += 1
+                    header["seq"] = self.seq
+                    lines.append(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\t" + body + b"\n")
+                offset = self.log.tell()
+                self.log.write(b"".join(lines))
+                self.log.flush()
+                if self.sync:
+                    os.fsync(self.log.fileno())
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+                return
+
+            self.batches += 1
+            # Ошибка одной записи не должна оставить ждать остальных: каждое ожидание завершается.
+            for line, (header, _, future) in zip(lines, batch):
+                try:
+                    self._apply(line, self.log_path, offset)
+                    future.set_result(self.orders[header["id"]])
+                except Exception as e:
+                    future.set_exception(e)
+                offset += len(line)
+            self.log_records += len(batch)
+            if self.log_records >= self.snapshot_every:
+                self.compact()
+
+    def compact(self):
+        # Снимок пишется во временный файл и атомарно подменяет старый, после чего журнал очищается.
+        # Если сбой случится до очистки, записи журнала с номером не больше seq снимка пропускаются.
+        with self.lock:
+            temp_path = self.snapshot_path.with_suffix(".tmp")
+            offsets = {}
+            with open(temp_path, "wb") as snapshot:
+                snapshot.write(json.dumps({"seq": self.seq}).encode("utf-8") + b"\n")
+                sources = {}
+                try:
+                    for order in self.orders.values():
+                        source = sources.get(order.source)
+                        if source is None:
+                            source = sources[order.source] = open(order.source, "rb")
+                        source.seek(order.offset)
+                        body = source.readline()
+                        body = body[body.index(b"\t") + 1:]
+                        header = {"seq": self.seq, "op": "put", "id": order.order_id, "customer": order.customer,
+                                  "created": order.created.isoformat(), "status": order.status,
+                                  "amount": order.amount, "type": order.package_type}
+                        offsets[order.order_id] = snapshot.tell()
+                        snapshot.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\t" + body)
+                finally:
+                    for source in sources.values():
+                        source.close()
+                snapshot.flush()
+                os.fsync(snapshot.fileno())
+            os.replace(temp_path, self.snapshot_path)
+            for order_id, offset in offsets.items():
+                order = self.orders[order_id]
+                order.source = self.snapshot_path
+                order.offset = offset
+            self.log.truncate(0)
+            self.log.seek(0)
+            self.log_records = 0
+
+    def get(self, order_id: str) -> Order | None:
+        with self.lock:
+            return self.orders.get(order_id)
+
+    def get_package(self, order: Order) -> TravelPackage:
+        with self.lock:
+            with open(order.source, "rb") as file:
+                file.seek(order.offset)
+                line = file.readline()
+        return package_from_dict(json.loads(line[line.index(b"\t") + 1:]), order.package_type)
+
+    def find(self, customer: str | None = None, start: date | None = None, end: date | None = None) -> list[Order]:
+        start_at = datetime.combine(start, time.min) if start is not None else None
+        end_at = datetime.combine(end + timedelta(days=1), time.min) if end is not None else None
+        with self.lock:
+            if customer is not None:
+                return [order for order in self.by_customer.get(customer, [])
+                        if (start_at is None or order.created >= start_at)
+                        and (end_at is None or order.created < end_at)]
+            low = 0 if start_at is None else bisect.bisect_left(self.by_date, (start_at,))
+            high = len(self.by_date) if end_at is None else bisect.bisect_left(self.by_date, (end_at,))
+            return [self.orders[order_id] for _, order_id in self.by_date[low:high]]
+
+    def close(self):
+        self.queue.put(None)
+        self.writer.join()
+        self.log.close()
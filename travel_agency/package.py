@@ -0,0 +1,114 @@
+from datetime import date
+
+from .availability import RoomAvailability
+from .factories import TravelFactory
+from .models import Ticket, Hotel, Tour, AdditionalServices
+
+
+class TravelPackage:
+    def __init__(self):
+        self.tickets: list[Ticket] = []
+        self.hotels: list[Hotel] = []
+        self.tours: list[Tour] = []
+        self.services: list[AdditionalServices] = []
+        self.total_price = 0
+        self._description: str | None = None
+
+    def add_ticket(self, ticket: Ticket):
+        self.tickets.append(ticket)
+        self.total_price += ticket.price
+        self._description = None
+
+    def add_hotel(self, hotel: Hotel):
+        self.hotels.append(hotel)
+        self.total_price += hotel.get_total_price()
+        self._description = None
+
+    def add_tour(self, tour: Tour):
+        self.tours.append(tour)
+        self.total_price += tour.price
+        self._description = None
+
+    def add_service(self, service: AdditionalServices):
+        self.services.append(service)
+        self.total_price += service.get_price()
+        self._description = None
+
+    def get_total_price(self) -> float:
+        return self.total_price
+
+    def get_description(self) -> str:
+        if self._description is not None:
+            return self._description
+
+        lines = ["Ваше путешествие:\n", "Билеты:"]
+        lines.extend(f"- {ticket.get_description()}" for ticket in self.tickets)
+
+        lines.append("\nОтель:")
+        lines.extend(f"- {hotel.get_description()}" for hotel in self.hotels)
+
+        if self.tours:
+            lines.append("\nТуры:")
+            lines.extend(f"- {tour.get_description()}" for tour in self.tours)
+
+        if self.services:
+            lines.append("\nПолезные услуги:")
+            lines.extend(f"- {service.get_description()}" for service in self.services)
+
+        lines.append(f"\nОбщая стоимость: {self.get_total_price()} руб.")
+        self._description = "\n".join(lines)
+        return self._description
+
+
+class TravelPackageBuilder:
+    def __init__(self, factory: TravelFactory, availability: RoomAvailability | None = None):
+        self.factory = factory
+        self.availability = availability
+        self.reset()
+
+    def reset(self):
+        self.travel_package = TravelPackage()
+
+    def add_ticket(self, departure: str, destination: str, date_forward: date, date_backward: date,
+                   price: float, time_forward: str, time_backward: str):
+        ticket = self.factory.create_ticket()
+        ticket.departure = departure
+        ticket.destination = destination
+        ticket.date_forward = date_forward
+        ticket.date_backward = date_backward
+        ticket.price = price
+        ticket.time_forward = time_forward
+        ticket.time_backward = time_backward
+        self.travel_package.add_ticket(ticket)
+
+    def add_hotel(self, name: str, city: str, check_in: date, check_out: date, price_per_night: float,
+                  rating: float, star: int, rooms: int = 1):
+        hotel = self.factory.create_hotel()
+        hotel.name = name
+        hotel.city = city
+        hotel.check_in = check_in
+        hotel.check_out = check_out
+        hotel.price = price_per_night
+        hotel.rating = rating
+        hotel.star = star
+        hotel.rooms = rooms
+        self.travel_package.add_hotel(hotel)
+
+    def add_tour(self, name: str, description: str, price: float, season: str):
+        tour = self.factory.create_tour()
+        tour.name = name
+        tour.description = description
+        tour.price = price
+        tour.season = season
+        self.travel_package.add_tour(tour)
+
+    def add_service(self, service: AdditionalServices):
+        self.travel_package.add_service(service)
+
+    def get_package(self) -> TravelPackage:
+        package = self.travel_package
+        if self.availability is not None:
+            self.availability.reserve([(hotel.city, hotel.name, hotel.check_in, hotel.check_out, hotel.rooms)
+                                       for hotel in package.hotels])
+        self.reset()
+        return package
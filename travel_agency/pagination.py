@@ -0,0 +1,187 @@
+import base64
+import binascii
+import heapq
+import json
+from datetime import date
+from itertools import islice
+from typing import Callable, Iterator
+
+from .models import Ticket, Hotel, Tour
+from .randomness import SeededRandomSource
+from .service import TravelService
+
+PAGE_SIZE = 20
+HOTEL_ORDERS = {
+    "price": lambda hotel: (hotel["price"], hotel["name"]),
+    "rating": lambda hotel: (-hotel["rating"], hotel["name"]),
+    "star": lambda hotel: (-hotel["star"], hotel["price"], hotel["name"]),
+}
+TOUR_ORDERS = {
+    "price": lambda tour: (tour["price"], tour["name"]),
+}
+
+
+def ticket_key(ticket: Ticket) -> tuple:
+    return int(ticket.price), ticket.time_forward, ticket.time_backward
+
+
+def encode_cursor(state: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(state, ensure_ascii=False).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError("Неверный курсор")
+
+
+class Page:
+    __slots__ = ("items", "cursor")
+
+    def __init__(self, items: list, cursor: str | None):
+        self.items = items
+        self.cursor = cursor
+
+
+class PaginatedSearch:
+    # Курсор хранит ключ последнего предложения, а не номер, поэтому добавление отелей
+    # в каталог не сдвигает уже выданные страницы. Каталог города не сортируется и не
+    # кешируется целиком: записи после курсора собираются в кучу, из нее достается
+    # столько, сколько нужно странице. Все, что взято из курсора, проверяется сразу,
+    # а не при чтении первой страницы.
+    def __init__(self, travel_service: TravelService, page_size: int = PAGE_SIZE):
+        self.travel_service = travel_service
+        self.page_size = page_size
+
+    def _factory(self, package_type: str):
+        factory = self.travel_service.factories.get(package_type)
+        if factory is None:
+            raise ValueError(f"Неизвестный тип пакета: {package_type}")
+        return factory
+
+    def _ordered(self, records: list[dict], sort_key: Callable[[dict], tuple],
+                 after: tuple | None) -> Iterator[tuple[tuple, dict]]:
+        heap = [(key, i) for i, key in enumerate(map(sort_key, records)) if after is None or key > after]
+        heapq.heapify(heap)
+        return ((key, records[i]) for key, i in _drain(heap))
+
+    def _hotels(self, city: str, package_type: str, start_date: date, end_date: date, order: str, rooms: int,
+                after: tuple | None) -> Iterator[tuple[tuple, Hotel]]:
+        if order not in HOTEL_ORDERS:
+            raise ValueError(f"Неизвестный порядок сортировки: {order}")
+        if end_date <= start_date:
+            raise ValueError("Дата выезда должна быть позже даты заезда")
+        if not isinstance(rooms, int) or rooms < 1:
+            raise ValueError("Число номеров должно быть не меньше 1")
+        service = self.travel_service
+        factory = self._factory(package_type)
+        offers = self._ordered(service.inventory.get_hotels(city, package_type), HOTEL_ORDERS[order], after)
+        return ((key, service.make_hotel(factory, city, hotel_data, start_date, end_date, rooms))
+                for key, hotel_data in offers
+                if service.availability.is_available(city, hotel_data["name"], start_date, end_date, rooms))
+
+    def _tours(self, city: str, package_type: str, travel_date: date, order: str,
+               after: tuple | None) -> Iterator[tuple[tuple, Tour]]:
+        if order not in TOUR_ORDERS:
+            raise ValueError(f"Неизвестный порядок сортировки: {order}")
+        service = self.travel_service
+        factory = self._factory(package_type)
+        season = service.get_season(travel_date)
+        offers = self._ordered(service.inventory.get_tours(city, season, package_type), TOUR_ORDERS[order], after)
+        return ((key, service.make_tour(factory, tour_data)) for key, tour_data in offers)
+
+    def _ticket_seed(self, departure: str, destination: str, date_forward: date, date_backward: date,
+                     package_type: str) -> int | None:
+        # Воспроизводимый источник сервиса сам дает тот же набор билетов на каждой странице,
+        # для невоспроизводимого сид запоминается в курсоре.
+        random_source = self.travel_service.random_source
+        if random_source.reproducible:
+            return None
+        return random_source.seed_for("tickets", departure, destination, date_forward, date_backward, package_type)
+
+    def _tickets(self, departure: str, destination: str, date_forward: date, date_backward: date, package_type: str,
+                 seed: int | None, after: tuple | None) -> Iterator[tuple[tuple, Ticket]]:
+        # Рейсов на направлении немного, поэтому они генерируются целиком, тем же путем, что
+        # и в TravelService.generate_tickets: без сида страницы совпадают с его выдачей.
+        if seed is not None and not isinstance(seed, int):
+            raise ValueError("Сид должен быть целым числом")
+        service = self.travel_service
+        random_source = SeededRandomSource(seed) if seed is not None else None
+        factory = self._factory(package_type)
+        tickets = [service.make_ticket(factory, departure, destination, date_forward, date_backward, record)
+                   for record in service.ticket_records(departure, destination, date_forward, date_backward,
+                                                        package_type, random_source)]
+        offers = sorted(((ticket_key(ticket), ticket) for ticket in tickets), key=lambda offer: offer[0])
+        return iter([offer for offer in offers if after is None or offer[0] > after])
+
+    def iter_hotels(self, city: str, package_type: str, start_date: date, end_date: date, order: str = "price",
+                    rooms: int = 1) -> Iterator[Hotel]:
+        return (hotel for _, hotel in self._hotels(city, package_type, start_date, end_date, order, rooms, None))
+
+    def iter_tours(self, city: str, package_type: str, travel_date: date, order: str = "price") -> Iterator[Tour]:
+        return (tour for _, tour in self._tours(city, package_type, travel_date, order, None))
+
+    def iter_tickets(self, departure: str, destination: str, date_forward: date, date_backward: date,
+                     package_type: str, seed: int | None = None) -> Iterator[Ticket]:
+        if seed is None:
+            seed = self._ticket_seed(departure, destination, date_forward, date_backward, package_type)
+        return (ticket for _, ticket in self._tickets(departure, destination, date_forward, date_backward,
+                                                      package_type, seed, None))
+
+    def _page(self, state: dict, offers: Iterator[tuple[tuple, object]], limit: int | None) -> Page:
+        limit = limit or self.page_size
+        chunk = list(islice(offers, limit + 1))
+        cursor = None
+        if len(chunk) > limit:
+            chunk = chunk[:limit]
+            cursor = encode_cursor({**state, "after": list(chunk[-1][0]), "limit": limit})
+        return Page([offer for _, offer in chunk], cursor)
+
+    def search_hotels(self, city: str, package_type: str, start_date: date, end_date: date, order: str = "price",
+                      rooms: int = 1, limit: int | None = None) -> Page:
+        state = {"kind": "hotels", "query": [city, package_type, start_date.isoformat(), end_date.isoformat(),
+                                             order, rooms]}
+        return self._page(state, self._hotels(city, package_type, start_date, end_date, order, rooms, None), limit)
+
+    def search_tours(self, city: str, package_type: str, travel_date: date, order: str = "price",
+                     limit: int | None = None) -> Page:
+        state = {"kind": "tours", "query": [city, package_type, travel_date.isoformat(), order]}
+        return self._page(state, self._tours(city, package_type, travel_date, order, None), limit)
+
+    def search_tickets(self, departure: str, destination: str, date_forward: date, date_backward: date,
+                       package_type: str, limit: int | None = None, seed: int | None = None) -> Page:
+        if seed is None:
+            seed = self._ticket_seed(departure, destination, date_forward, date_backward, package_type)
+        state = {"kind": "tickets", "query": [departure, destination, date_forward.isoformat(),
+                                              date_backward.isoformat(), package_type, seed]}
+        return self._page(state, self._tickets(departure, destination, date_forward, date_backward, package_type,
+                                               seed, None), limit)
+
+    def next_page(self, cursor: str) -> Page:
+        state = decode_cursor(cursor)
+        try:
+            kind, query, after, limit = state["kind"], state["query"], tuple(state["after"]), state["limit"]
+            if kind == "hotels":
+                city, package_type, start_date, end_date, order, rooms = query
+                offers = self._hotels(city, package_type, date.fromisoformat(start_date),
+                                      date.fromisoformat(end_date), order, rooms, after)
+            elif kind == "tours":
+                city, package_type, travel_date, order = query
+                offers = self._tours(city, package_type, date.fromisoformat(travel_date), order, after)
+            elif kind == "tickets":
+                departure, destination, date_forward, date_backward, package_type, seed = query
+                offers = self._tickets(departure, destination, date.fromisoformat(date_forward),
+                                       date.fromisoformat(date_backward), package_type, seed, after)
+            else:
+                raise ValueError
+            if not isinstance(limit, int) or limit < 1:
+                raise ValueError
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("Неверный курсор")
+        return self._page({"kind": kind, "query": query}, offers, limit)
+
+
+def _drain(heap: list) -> Iterator:
+    while heap:
+        yield heapq.heappop(heap)
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+
+
+class PaymentStrategy(ABC):
+    @abstractmethod
+    def pay(self, amount: float) -> bool:
+        pass
+
+
+class CreditCard(PaymentStrategy):
+    def __init__(self, card_number: str, card_holder: str, expiry_date: str, cvv: str):
+        self.card_number = card_number
+        self.card_holder = card_holder
+        self.expiry_date = expiry_date
+        self.cvv = cvv
+
+    def pay(self, amount: float) -> bool:
+        if len(self.card_number) != 16 or self.card_holder == "" or self.expiry_date == "" or self.cvv == "":
+            return False
+        return True
+
+
+class PayPal(PaymentStrategy):
+    def __init__(self, email: str):
+        self.email = email
+
+    def pay(self, amount: float) -> bool:
+        if self.email.count(".") != 1 or self.email.count("@"):
+            return False
+        return True
+
+
+class Context:
+    def __init__(self, payment_strategy: PaymentStrategy):
+        self.payment_strategy = payment_strategy
+
+    def pay(self, amount):
+        return self.payment_strategy.pay(amount)
+
+
+class BankTransfer(PaymentStrategy):
+    def __init__(self, account_number: str, bank_name: str):
+        self.account_number = account_number
+        self.bank_name = bank_name
+
+    def pay(self, amount: float) -> bool:
+        if self.account_number == "" or self.bank_name == "":
+            return False
+        return True
@@ -0,0 +1,135 @@
+import heapq
+from abc import ABC, abstractmethod
+from datetime import date
+from decimal import Decimal
+
+from .models import Ticket, Hotel, Tour, AdditionalServices
+from .package import TravelPackage
+from .service import TravelService
+
+KOPECKS = 100
+
+
+def to_kopecks(amount) -> int:
+    return int((Decimal(str(amount)) * KOPECKS).to_integral_value())
+
+
+def to_rubles(kopecks: int) -> Decimal:
+    return Decimal(kopecks) / KOPECKS
+
+
+def apply_rate(kopecks: int, rate: Decimal) -> int:
+    # Точное умножение на десятичный коэффициент с округлением до копейки вверх от половины.
+    numerator, denominator = rate.as_integer_ratio()
+    return (kopecks * numerator * 2 + denominator) // (2 * denominator)
+
+
+class PackageCandidate:
+    __slots__ = ("tickets", "hotels", "tours", "services", "package_type", "travel_date")
+
+    def __init__(self, tickets: list[Ticket], hotels: list[Hotel], tours: list[Tour],
+                 services: list[AdditionalServices], package_type: str, travel_date: date):
+        self.tickets = tickets
+        self.hotels = hotels
+        self.tours = tours
+        self.services = services
+        self.package_type = package_type
+        self.travel_date = travel_date
+
+
+class PricingRule(ABC):
+    @abstractmethod
+    def apply(self, candidate: PackageCandidate, subtotal: int) -> int:
+        pass
+
+
+class SeasonSurcharge(PricingRule):
+    def __init__(self, travel_service: TravelService, surcharges: dict[str, str]):
+        self.travel_service = travel_service
+        self.rates = {season: 1 + Decimal(percent) / 100 for season, percent in surcharges.items()}
+
+    def apply(self, candidate: PackageCandidate, subtotal: int) -> int:
+        rate = self.rates.get(self.travel_service.get_season(candidate.travel_date))
+        if rate is None:
+            return subtotal
+        return apply_rate(subtotal, rate)
+
+
+class PremiumMultiplier(PricingRule):
+    def __init__(self, multiplier: str):
+        self.multiplier = Decimal(multiplier)
+
+    def apply(self, candidate: PackageCandidate, subtotal: int) -> int:
+        if candidate.package_type != "premium":
+            return subtotal
+        return apply_rate(subtotal, self.multiplier)
+
+
+class ServiceBundleDiscount(PricingRule):
+    def __init__(self, min_services: int, discount_percent: str):
+        self.min_services = min_services
+        self.rate = 1 - Decimal(discount_percent) / 100
+
+    def apply(self, candidate: PackageCandidate, subtotal: int) -> int:
+        if len(candidate.services) < self.min_services:
+            return subtotal
+        service_kopecks = sum(to_kopecks(service.get_price()) for service in candidate.services)
+        return subtotal - service_kopecks + apply_rate(service_kopecks, self.rate)
+
+
+class PricingEngine:
+    def __init__(self, rules: list[PricingRule] | None = None):
+        self.rules = rules or []
+
+    def item_price(self, item) -> int:
+        if isinstance(item, Hotel):
+            return to_kopecks(item.price) * (item.check_out - item.check_in).days * item.rooms
+        if isinstance(item, AdditionalServices):
+            return to_kopecks(item.get_price())
+        return to_kopecks(item.price)
+
+    def _apply_rules(self, candidate: PackageCandidate, subtotal: int) -> int:
+        for rule in self.rules:
+            subtotal = rule.apply(candidate, subtotal)
+        return subtotal
+
+    def price(self, candidate: PackageCandidate) -> Decimal:
+        return self.price_batch([candidate])[0]
+
+    def price_batch(self, candidates: list[PackageCandidate]) -> list[Decimal]:
+        # Одни и те же предложения встречаются во многих кандидатах,
+        # поэтому цена каждого считается один раз на батч.
+        prices: dict[int, int] = {}
+        results = []
+        for candidate in candidates:
+            subtotal = 0
+            for items in (candidate.tickets, candidate.hotels, candidate.tours, candidate.services):
+                for item in items:
+                    item_kopecks = prices.get(id(item))
+                    if item_kopecks is None:
+                        item_kopecks = prices[id(item)] = self.item_price(item)
+                    subtotal += item_kopecks
+            results.append(to_rubles(self._apply_rules(candidate, subtotal)))
+        return results
+
+    def price_package(self, package: TravelPackage, package_type: str) -> Decimal:
+        if package.hotels:
+            travel_date = package.hotels[0].check_in
+        elif package.tickets:
+            travel_date = package.tickets[0].date_forward
+        else:
+            travel_date = date.today()
+        return self.price(PackageCandidate(package.tickets, package.hotels, package.tours, package.services,
+                                           package_type, travel_date))
+
+    def cheapest_combinations(self, tickets: list[Ticket], hotels: list[Hotel], package_type: str,
+                              travel_date: date, tours: list[Tour] | None = None,
+                              services: list[AdditionalServices] | None = None,
+                              k: int = 10) -> list[tuple[Decimal, Ticket, Hotel]]:
+        tours = tours or []
+        services = services or []
+        candidates = [PackageCandidate([ticket], [hotel], tours, services, package_type, travel_date)
+                      for ticket in tickets for hotel in hotels]
+        prices = self.price_batch(candidates)
+        best = heapq.nsmallest(k, range(len(candidates)), key=prices.__getitem__)
+        return [(prices[i], candidates[i].tickets[0], candidates[i].hotels[0]) for i in best]
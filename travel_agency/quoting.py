@@ -0,0 +1,104 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .catalogue import SnapshotInventory, read_records
+from .package import TravelPackage, TravelPackageBuilder
+from .randomness import SeededRandomSource
+from .service import TravelService
+
+_service: TravelService | None = None
+
+
+class QuoteRequest:
+    __slots__ = ("departure", "destination", "start_date", "end_date", "package_type")
+
+    def __init__(self, departure: str, destination: str, start_date: date, end_date: date, package_type: str):
+        self.departure = departure
+        self.destination = destination
+        self.start_date = start_date
+        self.end_date = end_date
+        self.package_type = package_type
+
+
+class Quote:
+    __slots__ = ("index", "request", "package", "error")
+
+    def __init__(self, index: int, request: QuoteRequest, package: TravelPackage | None = None,
+                 error: str | None = None):
+        self.index = index
+        self.request = request
+        self.package = package
+        self.error = error
+
+
+def read_requests(path: str | Path) -> Iterator[QuoteRequest]:
+    for record in read_records(path):
+        yield QuoteRequest(record["departure"], record["destination"], date.fromisoformat(record["start_date"]),
+                           date.fromisoformat(record["end_date"]), record.get("package_type") or "basic")
+
+
+def quote(service: TravelService, request: QuoteRequest) -> TravelPackage:
+    if request.package_type not in service.factories:
+        raise ValueError(f"Неизвестный тип пакета: {request.package_type}")
+    if request.end_date <= request.start_date:
+        raise ValueError("Дата окончания должна быть позже даты начала")
+    tickets = service.generate_tickets(request.departure, request.destination, request.start_date, request.end_date,
+                                       request.package_type)
+    hotels = service.get_available_hotels(request.destination, request.package_type, request.start_date,
+                                          request.end_date)
+    if not hotels:
+        raise ValueError(f"Нет свободных отелей в городе {request.destination}")
+    ticket = min(tickets, key=lambda offer: offer.price)
+    hotel = min(hotels, key=lambda offer: offer.price)
+
+    # Расчет не бронирует номера, поэтому сборщик создается без учета занятости.
+    builder = TravelPackageBuilder(service.factories[request.package_type])
+    builder.add_ticket(ticket.departure, ticket.destination, ticket.date_forward, ticket.date_backward, ticket.price,
+                       ticket.time_forward, ticket.time_backward)
+    builder.add_hotel(hotel.name, hotel.city, hotel.check_in, hotel.check_out, hotel.price, hotel.rating, hotel.star)
+    return builder.get_package()
+
+
+def _init_worker(snapshot_path: str | None, seed: int):
+    # Билеты заявки зависят только от сида батча и параметров заявки, поэтому результат
+    # не зависит от того, какой процесс и в каком порядке ее обработал.
+    global _service
+    _service = TravelService(SnapshotInventory(snapshot_path) if snapshot_path else None,
+                             random_source=SeededRandomSource(seed))
+
+
+def _quote_chunk(chunk: list[tuple[int, QuoteRequest]]) -> list[Quote]:
+    quotes = []
+    for index, request in chunk:
+        try:
+            quotes.append(Quote(index, request, quote(_service, request)))
+        except (KeyError, ValueError) as e:
+            quotes.append(Quote(index, request, error=str(e)))
+    return quotes
+
+
+def _chunks(requests: Iterable[QuoteRequest], chunk_size: int) -> Iterator[list[tuple[int, QuoteRequest]]]:
+    numbered = enumerate(requests)
+    while chunk := list(islice(numbered, chunk_size)):
+        yield chunk
+
+
+def quote_batch(requests: Iterable[QuoteRequest], workers: int | None = None, chunk_size: int = 64, seed: int = 0,
+                snapshot_path: str | Path | None = None) -> Iterator[Quote]:
+    # В работе не больше двух пачек на процесс: следующие заявки читаются по мере готовности
+    # результатов, поэтому память не растет с размером входного файла.
+    workers = workers or os.cpu_count() or 1
+    snapshot = str(snapshot_path) if snapshot_path else None
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(snapshot, seed)) as executor:
+        chunks = _chunks(requests, chunk_size)
+        pending = {executor.submit(_quote_chunk, chunk) for chunk in islice(chunks, workers * 2)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for chunk in islice(chunks, len(done)):
+                pending.add(executor.submit(_quote_chunk, chunk))
+            for future in done:
+                yield from future.result()
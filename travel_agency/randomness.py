@@ -0,0 +1,60 @@
+import hashlib
+import random
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+
+
+class RandomSource(ABC):
+    # Воспроизводимый источник для одного ключа всегда выдает одну и ту же последовательность.
+    reproducible = True
+
+    @abstractmethod
+    def derive(self, *key) -> random.Random:
+        pass
+
+    def seed_for(self, *key) -> int:
+        return self.derive(*key).getrandbits(32)
+
+
+class SystemRandomSource(RandomSource):
+    # Общий генератор со случайным сидом, результаты запусков не совпадают.
+    reproducible = False
+
+    def __init__(self):
+        self.rng = random.Random()
+
+    def derive(self, *key) -> random.Random:
+        return self.rng
+
+
+class SeededRandomSource(RandomSource):
+    # Генератор запроса заводится от хеша общего сида и параметров запроса, а не от общего
+    # состояния, поэтому результат не зависит ни от порядка запросов, ни от потока или процесса.
+    def __init__(self, seed: int):
+        self.seed = seed
+
+    def derive(self, *key) -> random.Random:
+        digest = hashlib.blake2b(repr((self.seed, *key)).encode("utf-8"), digest_size=8).digest()
+        return random.Random(int.from_bytes(digest, "big"))
+
+
+class Clock(ABC):
+    @abstractmethod
+    def now(self) -> datetime:
+        pass
+
+    def today(self) -> date:
+        return self.now().date()
+
+
+class SystemClock(Clock):
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class FixedClock(Clock):
+    def __init__(self, moment: datetime):
+        self.moment = moment
+
+    def now(self) -> datetime:
+        return self.moment
@@ -0,0 +1,77 @@
+import argparse
+import hashlib
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from .catalogue import SnapshotInventory
+from .randomness import SeededRandomSource, FixedClock
+from .server import TravelHandler
+from .service import TravelService
+
+
+def read_log(path: str | Path) -> tuple[dict, Iterator[dict]]:
+    file = open(path, encoding="utf-8")
+    try:
+        header = json.loads(file.readline())
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or "seed" not in header or "now" not in header:
+        file.close()
+        raise ValueError(f"{path}: нет заголовка журнала поиска")
+
+    def searches():
+        with file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    return header, searches()
+
+
+def replay(log_path: str | Path, output: BinaryIO | None, snapshot_path: str | None = None) -> str:
+    # Сервис получает сид и время из журнала, а перед каждым запросом часы ставятся на его
+    # записанное время, поэтому повторный прогон дает побайтно тот же ответ на каждый запрос.
+    # Возвращает sha256 всего вывода, без output ответы только хешируются.
+    header, searches = read_log(log_path)
+    clock = FixedClock(datetime.fromisoformat(header["now"]))
+    service = TravelService(SnapshotInventory(snapshot_path) if snapshot_path else None,
+                            random_source=SeededRandomSource(header["seed"]), clock=clock)
+    handler = TravelHandler(service)
+    digest = hashlib.sha256()
+    for record in searches:
+        if "now" in record:
+            clock.moment = datetime.fromisoformat(record["now"])
+        status, response = handler.dispatch("POST", "/search", json.dumps(record["search"]).encode("utf-8"))
+        line = json.dumps({"status": status, "response": response}, ensure_ascii=False, sort_keys=True,
+                          default=str).encode("utf-8") + b"\n"
+        if output is not None:
+            output.write(line)
+        digest.update(line)
+    return digest.hexdigest()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Повтор записанного журнала поиска")
+    parser.add_argument("log", type=Path, help="журнал, записанный сервисом с --record")
+    parser.add_argument("--snapshot", help="бинарный снимок каталога, с которым шла запись")
+    parser.add_argument("--output", type=Path, help="куда записать ответы, по умолчанию никуда")
+    parser.add_argument("--expect", help="sha256 ответов прошлого прогона; при расхождении код выхода 1")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        with open(args.output, "wb") as output:
+            digest = replay(args.log, output, args.snapshot)
+    else:
+        digest = replay(args.log, None, args.snapshot)
+    print(digest)
+    if args.expect and args.expect != digest:
+        print(f"Ответы расходятся с прошлым прогоном: ожидался {args.expect}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
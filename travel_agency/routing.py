@@ -0,0 +1,182 @@
+import heapq
+import math
+from datetime import date, timedelta
+
+from .fares import FareEngine
+from .geo import CITY_COORDINATES, distance_km
+from .models import Hotel, Ticket
+from .service import TravelService
+
+HUBS = ["Москва", "Санкт-Петербург"]
+MAX_DIRECT_KM = 700
+CRUISE_KM_PER_MINUTE = 800 / 60
+GROUND_MINUTES = 40
+WEIGHTS = ["price", "duration"]
+
+
+class FlightGraph:
+    # Маршрут по цене выбирается по базовым тарифам FareEngine, цены самих перелетов
+    # берутся из билетов TravelService на дату поездки.
+    def __init__(self, coordinates: dict[str, tuple[float, float]], fares: FareEngine):
+        self.coordinates = coordinates
+        self.fares = fares
+        self.routes: dict[str, dict[str, float]] = {city: {} for city in coordinates}
+
+    @classmethod
+    def from_cities(cls, cities: list[str], fares: FareEngine,
+                    coordinates: dict[str, tuple[float, float]] = CITY_COORDINATES, hubs: list[str] = HUBS,
+                    max_direct_km: float = MAX_DIRECT_KM) -> "FlightGraph":
+        # Прямые рейсы есть из хабов и между близкими городами, остальные маршруты - с пересадками.
+        graph = cls({city: coordinates[city] for city in cities if city in coordinates}, fares)
+        known = list(graph.coordinates)
+        for i, origin in enumerate(known):
+            for target in known[i + 1:]:
+                km = distance_km(graph.coordinates[origin], graph.coordinates[target])
+                if origin in hubs or target in hubs or km <= max_direct_km:
+                    graph.add_route(origin, target, km)
+        return graph
+
+    def add_route(self, origin: str, target: str, km: float):
+        self.routes[origin][target] = km
+        self.routes[target][origin] = km
+
+    def edge_weight(self, city: str, next_city: str, package_type: str, weight: str) -> float:
+        if weight == "price":
+            return self.fares.base_fare(city, next_city, package_type)
+        return GROUND_MINUTES + self.routes[city][next_city] / CRUISE_KM_PER_MINUTE
+
+    def heuristic(self, city: str, target: str, package_type: str, weight: str) -> float:
+        # Оценка снизу. Базовый тариф растет с расстоянием не быстрее, чем сумма тарифов
+        # пересадок, поэтому прямой тариф не больше цены любого пути.
+        if city == target:
+            return 0.0
+        if weight == "price":
+            return self.fares.base_fare(city, target, package_type)
+        return distance_km(self.coordinates[city], self.coordinates[target]) / CRUISE_KM_PER_MINUTE
+
+    def shortest_path(self, origin: str, target: str, package_type: str = "basic",
+                      weight: str = "price") -> tuple[list[str], float]:
+        if weight not in WEIGHTS:
+            raise ValueError(f"Неизвестный критерий маршрута: {weight}")
+        for city in (origin, target):
+            if city not in self.routes:
+                raise ValueError(f"Нет рейсов в город {city}")
+
+        costs = {origin: 0.0}
+        previous: dict[str, str] = {}
+        heap = [(self.heuristic(origin, target, package_type, weight), 0.0, origin)]
+        while heap:
+            _, cost, city = heapq.heappop(heap)
+            if city == target:
+                path = [city]
+                while path[-1] != origin:
+                    path.append(previous[path[-1]])
+                return path[::-1], cost
+            if cost > costs[city]:
+                continue
+            for neighbour in self.routes[city]:
+                new_cost = cost + self.edge_weight(city, neighbour, package_type, weight)
+                if new_cost < costs.get(neighbour, math.inf):
+                    costs[neighbour] = new_cost
+                    previous[neighbour] = city
+                    heapq.heappush(heap, (new_cost + self.heuristic(neighbour, target, package_type, weight),
+                                          new_cost, neighbour))
+        raise ValueError(f"Нет маршрута из {origin} в {target}")
+
+
+class Leg:
+    __slots__ = ("origin", "destination", "path", "travel_date", "tickets", "duration", "hotel")
+
+    def __init__(self, origin: str, destination: str, path: list[str], travel_date: date, tickets: list[Ticket],
+                 duration: float, hotel: Hotel | None = None):
+        self.origin = origin
+        self.destination = destination
+        self.path = path
+        self.travel_date = travel_date
+        self.tickets = tickets
+        self.duration = duration
+        self.hotel = hotel
+
+    @property
+    def price(self) -> float:
+        return sum(ticket.price for ticket in self.tickets)
+
+    def get_description(self) -> str:
+        desc = (f"{self.travel_date}: {' → '.join(self.path)}, в пути {int(self.duration) // 60} ч "
+                f"{int(self.duration) % 60} мин, цена: {round(self.price)} руб.")
+        if self.hotel is not None:
+            desc += f"\n  {self.hotel.get_description()}"
+        return desc
+
+
+class Itinerary:
+    def __init__(self, legs: list[Leg]):
+        self.legs = legs
+
+    def get_total_price(self) -> float:
+        total_price = 0
+        for leg in self.legs:
+            total_price += leg.price
+            if leg.hotel is not None:
+                total_price += leg.hotel.get_total_price()
+        return total_price
+
+    def get_description(self) -> str:
+        lines = ["Маршрут:"]
+        lines.extend(f"- {leg.get_description()}" for leg in self.legs)
+        lines.append(f"\nОбщая стоимость: {round(self.get_total_price())} руб.")
+        return "\n".join(lines)
+
+
+class ItineraryPlanner:
+    # departure_cities - города отправления, которых нет среди направлений каталога.
+    def __init__(self, travel_service: TravelService, departure_cities: list[str] | None = None,
+                 graph: FlightGraph | None = None):
+        self.travel_service = travel_service
+        self.graph = graph or FlightGraph.from_cities(travel_service.cities + list(departure_cities or []),
+                                                      travel_service.fares)
+        self.legs_cache: dict[tuple[str, str, str, str], tuple[list[str], float]] = {}
+
+    def plan_leg(self, origin: str, destination: str, package_type: str, weight: str) -> tuple[list[str], float]:
+        key = (origin, destination, package_type, weight)
+        leg = self.legs_cache.get(key)
+        if leg is None:
+            path, _ = self.graph.shortest_path(origin, destination, package_type, weight)
+            duration = sum(self.graph.edge_weight(city, next_city, package_type, "duration")
+                           for city, next_city in zip(path, path[1:]))
+            leg = self.legs_cache[key] = (path, duration)
+        return leg
+
+    def leg_tickets(self, path: list[str], travel_date: date, return_date: date, package_type: str) -> list[Ticket]:
+        # На каждый перелет пути берется самый дешевый из рейсов, которые предлагает сервис.
+        tickets = []
+        for city, next_city in zip(path, path[1:]):
+            offers = self.travel_service.generate_tickets(city, next_city, travel_date, return_date, package_type)
+            if not offers:
+                raise ValueError(f"Нет рейсов из {city} в {next_city}")
+            tickets.append(min(offers, key=lambda offer: offer.price))
+        return tickets
+
+    def plan(self, stops: list[str], start_date: date, nights: list[int], package_type: str = "basic",
+             weight: str = "price") -> Itinerary:
+        if len(stops) < 2:
+            raise ValueError("Маршрут должен содержать хотя бы два города")
+        if len(nights) != len(stops) - 1:
+            raise ValueError("Количество ночей нужно указать для каждого города после первого")
+
+        legs = []
+        travel_date = start_date
+        return_date = start_date + timedelta(days=sum(nights))
+        for origin, destination, stay in zip(stops, stops[1:], nights):
+            path, duration = self.plan_leg(origin, destination, package_type, weight)
+            tickets = self.leg_tickets(path, travel_date, return_date, package_type)
+            hotel = None
+            if stay > 0:
+                check_out = travel_date + timedelta(days=stay)
+                hotels = self.travel_service.get_available_hotels(destination, package_type, travel_date, check_out)
+                if not hotels:
+                    raise ValueError(f"Нет свободных отелей в городе {destination}")
+                hotel = min(hotels, key=lambda offer: offer.price)
+            legs.append(Leg(origin, destination, path, travel_date, tickets, duration, hotel))
+            travel_date += timedelta(days=stay)
+        return Itinerary(legs)
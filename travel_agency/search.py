@@ -0,0 +1,36 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+
+from .service import TravelService
+
+
+class SearchPipeline:
+    def __init__(self, travel_service: TravelService, max_workers: int = 4):
+        self.travel_service = travel_service
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="search")
+        self.futures: dict[str, Future] = {}
+
+    def submit(self, departure: str, destination: str, start_date: date, end_date: date,
+               package_type: str) -> dict[str, Future]:
+        # Новый поиск делает предыдущий устаревшим.
+        self.cancel()
+        service = self.travel_service
+        duration = (end_date - start_date).days
+        self.futures = {
+            "tickets": self.executor.submit(service.generate_tickets, departure, destination, start_date, end_date,
+                                            package_type),
+            "hotels": self.executor.submit(service.get_available_hotels, destination, package_type, start_date,
+                                           end_date),
+            "tours": self.executor.submit(service.get_available_tours, destination, package_type, start_date),
+            "services": self.executor.submit(service.get_available_services, destination, duration, package_type),
+        }
+        return self.futures
+
+    def cancel(self):
+        for future in self.futures.values():
+            future.cancel()
+        self.futures = {}
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False)
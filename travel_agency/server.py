@@ -0,0 +1,403 @@
+import argparse
+import asyncio
+import gc
+import json
+import os
+import signal
+import socket
+import threading
+from datetime import date, datetime
+from pathlib import Path
+
+from .catalogue import SnapshotInventory
+from .fares import FLIGHT_FACTORS
+from .gateway import BlockingPayment, GatewayClient, GatewayError, GatewayPayment, HttpConnectionPool, read_message
+from .models import Ticket, Hotel, Tour, SimCard, BusPass, GuideBook
+from .orders import package_to_dict, package_from_dict, service_to_list
+from .package import TravelPackage
+from .payment import CreditCard, PayPal, BankTransfer, Context
+from .randomness import SeededRandomSource
+from .service import TravelService
+
+PAYMENT_METHODS = {"card": CreditCard, "paypal": PayPal, "bank": BankTransfer}
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 409: "Conflict", 500: "Internal Server Error",
+               503: "Service Unavailable"}
+MAX_BODY = 1 << 20
+
+
+def _json_default(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Значение {value!r} не сериализуется в JSON")
+
+
+def offer_to_dict(offer: Ticket | Hotel | Tour) -> dict:
+    data = {field: getattr(offer, field) for cls in type(offer).__mro__ for field in getattr(cls, "__slots__", ())}
+    data["description"] = offer.get_description()
+    return data
+
+
+def _date(payload: dict, key: str) -> date:
+    try:
+        return date.fromisoformat(payload[key])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"Поле {key} должно быть датой ГГГГ-ММ-ДД")
+
+
+def _package_type(service: TravelService, payload: dict) -> str:
+    package_type = payload.get("package_type", "basic")
+    if package_type not in service.factories:
+        raise ValueError(f"Неизвестный тип пакета: {package_type}")
+    return package_type
+
+
+class FareChanged(ValueError):
+    # Пакет с текущими ценами, который клиент может подтвердить повторным запросом.
+    def __init__(self, package: TravelPackage):
+        super().__init__("Цена билета изменилась, подтвердите новую цену")
+        self.package = package
+
+
+class SearchRecorder:
+    # Журнал для python -m travel_agency.replay: первая строка - сид и время запуска, дальше
+    # по строке на поисковый запрос вместе с показанием часов, чтобы повтор видел ту же дату,
+    # даже если запись шла через полночь. Каждый запуск начинает журнал заново. Строки дописываются
+    # одним write в режиме добавления, поэтому журнал можно вести из нескольких воркеров сразу.
+    # Брони и оплаты не пишутся: журнал ведется только при нескольких воркерах, а их поиск
+    # брони не видит (номера держит отдельный процесс), так что ответы от них не зависят.
+    def __init__(self, path: str | Path, seed: int, started: datetime):
+        open(path, "w").close()
+        self.file = open(path, "a", encoding="utf-8")
+        self.lock = threading.Lock()
+        self._write({"seed": seed, "now": started.isoformat()})
+
+    def _write(self, record: dict):
+        with self.lock:
+            self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.file.flush()
+
+    def record(self, payload: dict, now: datetime):
+        self._write({"search": payload, "now": now.isoformat()})
+
+    def close(self):
+        self.file.close()
+
+
+class TravelHandler:
+    # Обработчики быстрые и не блокируют цикл событий, поэтому вызываются прямо в нем.
+    # Если задан booking_pool, оплата пересылается единственному процессу бронирования.
+    # Если задан gateway, деньги списывает платежный шлюз: такая оплата ждет его ответа
+    # и идет в отдельном потоке, а запросы к шлюзу выполняются в цикле событий.
+    def __init__(self, service: TravelService, booking_pool: HttpConnectionPool | None = None,
+                 recorder: SearchRecorder | None = None, gateway: GatewayClient | None = None):
+        self.service = service
+        self.booking_pool = booking_pool
+        self.recorder = recorder
+        self.gateway = gateway
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self.routes = {
+            ("GET", "/health"): self.health,
+            ("POST", "/search"): self.search,
+            ("POST", "/packages"): self.build_package,
+            ("POST", "/payments"): self.pay,
+        }
+
+    def health(self, payload: dict) -> dict:
+        return {"status": "ok", "pid": os.getpid()}
+
+    def search(self, payload: dict) -> dict:
+        if self.recorder is not None:
+            self.recorder.record(payload, self.service.clock.now())
+        service = self.service
+        package_type = _package_type(service, payload)
+        start_date, end_date = _date(payload, "start_date"), _date(payload, "end_date")
+        if end_date <= start_date:
+            raise ValueError("Дата окончания должна быть позже даты начала")
+        departure, destination = payload.get("departure", ""), payload.get("destination", "")
+        if not departure or not destination:
+            raise ValueError("Укажите города отправления и назначения")
+        return {
+            "tickets": [offer_to_dict(ticket) for ticket in
+                        service.generate_tickets(departure, destination, start_date, end_date, package_type)],
+            "hotels": [offer_to_dict(hotel) for hotel in
+                       service.get_available_hotels(destination, package_type, start_date, end_date)],
+            "tours": [offer_to_dict(tour) for tour in
+                      service.get_available_tours(destination, package_type, start_date)],
+            "services": [{"service": service_to_list(item), "price": item.get_price(),
+                          "description": item.get_description()}
+                         for item in service.get_available_services(destination, (end_date - start_date).days,
+                                                                    package_type)],
+        }
+
+    def _package(self, payload: dict) -> TravelPackage:
+        package_type = _package_type(self.service, payload)
+        try:
+            package = package_from_dict(payload["package"], package_type)
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("Неверное описание пакета")
+        return self._reprice(package, package_type)
+
+    def _reprice(self, package: TravelPackage, package_type: str) -> TravelPackage:
+        # Клиент присылает пакет целиком, но цены из запроса не используются: отели и туры
+        # берутся из каталога, цена билета должна совпасть с текущим тарифом одного из рейсов.
+        # Воркеры не видят продаж процесса бронирования и котируют без надбавки за загрузку.
+        # Такой билет переоценивается по текущему тарифу того же рейса, и клиент получает
+        # FareChanged с новым пакетом, который можно оплатить повторным запросом.
+        service = self.service
+        builder = service.create_package_builder(package_type)
+        cities, dates = set(), []
+        changed = False
+        for ticket in package.tickets:
+            if ticket.date_backward <= ticket.date_forward:
+                raise ValueError("Дата обратного вылета должна быть позже даты вылета")
+            route = (ticket.departure, ticket.destination, ticket.date_forward, package_type)
+            fares = [service.fares.quote(*route, flight) for flight in range(len(FLIGHT_FACTORS))]
+            price = ticket.price
+            if price not in fares:
+                unsold = [service.fares.quote(*route, flight, sold=0) for flight in range(len(FLIGHT_FACTORS))]
+                if price not in unsold:
+                    raise ValueError(f"Цена билета {ticket.departure} - {ticket.destination} изменилась, "
+                                     f"повторите поиск")
+                price = fares[unsold.index(price)]
+                changed = True
+            builder.add_ticket(ticket.departure, ticket.destination, ticket.date_forward, ticket.date_backward,
+                               price, ticket.time_forward, ticket.time_backward)
+            cities.add(ticket.destination)
+            dates.append(ticket.date_forward)
+        for hotel in package.hotels:
+            hotel_data = service.inventory.find_hotel(hotel.city, hotel.name)
+            if hotel_data is None:
+                raise ValueError(f"Отель {hotel.name} в городе {hotel.city} не найден")
+            if not isinstance(hotel.rooms, int) or hotel.rooms < 1:
+                raise ValueError("Число номеров должно быть не меньше 1")
+            if hotel.check_out <= hotel.check_in:
+                raise ValueError("Дата выезда должна быть позже даты заезда")
+            builder.add_hotel(hotel.name, hotel.city, hotel.check_in, hotel.check_out, hotel_data["price"],
+                              hotel_data["rating"], hotel_data["star"], hotel.rooms)
+            cities.add(hotel.city)
+            dates.append(hotel.check_in)
+        # Туры ищутся так же, как при поиске: в городах пакета на сезон начала поездки.
+        season = service.get_season(min(dates)) if dates else None
+        for tour in package.tours:
+            tour_data = next((tour_data for city in sorted(cities)
+                              for tour_data in service.inventory.get_tours(city, season, package_type)
+                              if tour_data["name"] == tour.name), None)
+            if tour_data is None:
+                raise ValueError(f"Тур {tour.name} недоступен")
+            builder.add_tour(tour_data["name"], tour_data["description"], tour_data["price"], tour_data["season"])
+        for item in package.services:
+            if not self._service_offered(item, cities):
+                raise ValueError(f"Услуга недоступна: {item.get_description()}")
+            builder.add_service(item)
+        if changed:
+            raise FareChanged(builder.get_package())
+        return builder.get_package()
+
+    def _service_offered(self, item, cities: set[str]) -> bool:
+        # Цены услуг задают их классы, проверяется только, что такая услуга предлагается.
+        if item.city not in cities:
+            return False
+        if isinstance(item, SimCard):
+            return item.selected_tariff in self.service.SimCardTariffs
+        if isinstance(item, GuideBook):
+            return item.language in self.service.languages
+        if isinstance(item, BusPass):
+            return isinstance(item.duration, int) and item.duration >= 1
+        return False
+
+    def build_package(self, payload: dict) -> dict:
+        package = self._package(payload)
+        return {"package": package_to_dict(package), "total_price": package.get_total_price(),
+                "description": package.get_description()}
+
+    def pay(self, payload: dict) -> dict:
+        package = self._package(payload)
+        method = PAYMENT_METHODS.get(payload.get("method"))
+        if method is None:
+            raise ValueError(f"Неизвестный способ оплаты: {payload.get('method')}")
+        try:
+            strategy = method(**payload.get("details", {}))
+        except TypeError:
+            raise ValueError("Неверные реквизиты платежа")
+        idempotency_key = payload.get("idempotency_key")
+        if not idempotency_key:
+            raise ValueError("Нужен ключ идемпотентности")
+        if self.gateway is None:
+            payment = Context(strategy)
+        else:
+            payment = BlockingPayment(GatewayPayment(strategy, self.gateway, idempotency_key), self.loop)
+        booking = self.service.booking_service.book(package, payment, idempotency_key)
+        return {"booking_id": booking.booking_id, "status": booking.status, "amount": booking.amount}
+
+    def dispatch(self, method: str, path: str, body: bytes) -> tuple[int, dict]:
+        handler = self.routes.get((method, path.split("?", 1)[0]))
+        if handler is None:
+            return 404, {"error": "Не найдено"}
+        try:
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise ValueError("Ожидается JSON-объект")
+            return 200, handler(payload)
+        except FareChanged as e:
+            return 409, {"error": str(e), "package": package_to_dict(e.package),
+                         "total_price": e.package.get_total_price()}
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        except GatewayError as e:
+            return 503, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": f"Внутренняя ошибка: {type(e).__name__}"}
+
+    async def forward_payment(self, body: bytes) -> tuple[int, dict]:
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"error": "Ожидается JSON-объект"}
+        try:
+            return await self.booking_pool.request("POST", "/payments", payload)
+        except (OSError, EOFError, GatewayError):
+            return 503, {"error": "Сервис бронирования недоступен"}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # Соединение держится, пока клиент не закроет его или не пришлет Connection: close.
+        task = asyncio.current_task()
+        self.connections[task] = writer
+        self.loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    start_line, headers, body = await read_message(reader, MAX_BODY)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    break
+                except ValueError:
+                    status, response, keep_alive = 400, {"error": "Неверный запрос"}, False
+                else:
+                    method, path, *_ = start_line.split() + ["", ""]
+                    if self.booking_pool is not None and (method, path) == ("POST", "/payments"):
+                        status, response = await self.forward_payment(body)
+                    elif self.gateway is not None and (method, path) == ("POST", "/payments"):
+                        status, response = await asyncio.to_thread(self.dispatch, method, path, body)
+                    else:
+                        status, response = self.dispatch(method, path, body)
+                    keep_alive = headers.get("connection", "").lower() != "close"
+                payload = json.dumps(response, ensure_ascii=False, default=_json_default).encode("utf-8")
+                writer.write((f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                              f"Content-Type: application/json; charset=utf-8\r\nContent-Length: {len(payload)}\r\n"
+                              f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode("latin-1")
+                             + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            del self.connections[task]
+            writer.close()
+
+    async def close(self):
+        for writer in self.connections.values():
+            writer.close()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+        if self.booking_pool is not None:
+            await self.booking_pool.close()
+        if self.gateway is not None:
+            await self.gateway.pool.close()
+
+
+async def run_worker(sock: socket.socket, service: TravelService, booking_address: tuple[str, int] | None = None,
+                     recorder: SearchRecorder | None = None, gateway_address: tuple[str, int] | None = None):
+    booking_pool = HttpConnectionPool(*booking_address) if booking_address else None
+    gateway = GatewayClient(HttpConnectionPool(*gateway_address)) if gateway_address else None
+    handler = TravelHandler(service, booking_pool, recorder, gateway)
+    server = await asyncio.start_server(handler.handle, sock=sock, backlog=1024)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
+    async with server:
+        await stop.wait()
+        server.close()
+        await handler.close()
+
+
+def serve(host: str = "127.0.0.1", port: int = 8080, workers: int = 1, snapshot_path: str | None = None,
+          seed: int | None = None, record_path: str | None = None, gateway_address: tuple[str, int] | None = None):
+    # Каталог загружается один раз до fork, воркеры делят его страницы памяти;
+    # снимок каталога к тому же открывается через mmap. Номера бронирует отдельный процесс,
+    # чтобы занятость была общей: поиск в воркерах ее не видит, но лишнюю бронь он не подтвердит.
+    # С сидом билеты зависят только от параметров запроса, записанный журнал поиска
+    # повторяется через python -m travel_agency.replay с теми же ответами.
+    if record_path and workers == 1:
+        # В одном процессе брони меняют занятость и тарифы для следующих поисков,
+        # а журнал их не содержит, поэтому повтор разошелся бы с записью.
+        raise ValueError("Журнал поиска записывается только при двух и более воркерах")
+    if record_path and seed is None:
+        seed = int.from_bytes(os.urandom(4), "big")
+    random_source = SeededRandomSource(seed) if seed is not None else None
+    service = TravelService(SnapshotInventory(snapshot_path) if snapshot_path else None, random_source=random_source)
+    recorder = SearchRecorder(record_path, seed, service.clock.now()) if record_path else None
+    sock = socket.create_server((host, port), backlog=1024)
+    print(f"Сервис слушает http://{host}:{sock.getsockname()[1]}, воркеров: {workers}", flush=True)
+    if workers == 1:
+        asyncio.run(run_worker(sock, service, recorder=recorder, gateway_address=gateway_address))
+        return
+
+    booking_sock = socket.create_server(("127.0.0.1", 0))
+    booking_address = booking_sock.getsockname()
+    gc.freeze()
+    children = [_fork_worker(booking_sock, service, gateway_address=gateway_address)]
+    booking_sock.close()
+    children.extend(_fork_worker(sock, service, booking_address, recorder) for _ in range(workers))
+    sock.close()
+
+    def stop(signum, frame):
+        for child in children:
+            try:
+                os.kill(child, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for child in children:
+        os.waitpid(child, 0)
+
+
+def _fork_worker(sock: socket.socket, service: TravelService, booking_address: tuple[str, int] | None = None,
+                 recorder: SearchRecorder | None = None, gateway_address: tuple[str, int] | None = None) -> int:
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            asyncio.run(run_worker(sock, service, booking_address, recorder, gateway_address))
+        except BaseException:
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP/JSON сервис поиска и бронирования путешествий")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--snapshot", help="бинарный снимок каталога")
+    parser.add_argument("--seed", type=int, help="сид генерации предложений для воспроизводимых прогонов")
+    parser.add_argument("--record", help="записывать поисковые запросы в журнал для повтора")
+    parser.add_argument("--gateway", help="адрес платежного шлюза host:port, без него реквизиты только проверяются")
+    args = parser.parse_args()
+    if args.record and args.workers == 1:
+        parser.error("--record требует --workers 2 и больше: в одном процессе брони влияют на поиск")
+    gateway_address = None
+    if args.gateway:
+        host, _, port = args.gateway.rpartition(":")
+        if not host or not port.isdigit():
+            parser.error("--gateway ожидает адрес вида host:port")
+        gateway_address = (host, int(port))
+    serve(args.host, args.port, args.workers, args.snapshot, args.seed, args.record, gateway_address)
+
+
+if __name__ == "__main__":
+    main()
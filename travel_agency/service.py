@@ -0,0 +1,320 @@
+from datetime import date
+from typing import List
+
+from .availability import RoomAvailability, DEFAULT_ROOMS
+from .batch import TicketBatch, generate_ticket_batch
+from .booking import BookingService
+from .cache import SearchCache
+from .factories import TravelFactory, BasicTravel, PremiumTravel
+from .fares import FareEngine
+from .fulltext import SearchIndex, SearchHit
+from .inventory import Inventory
+from .models import Ticket, Hotel, Tour, AdditionalServices, SimCard, BusPass, GuideBook
+from .package import TravelPackageBuilder
+from .randomness import RandomSource, SystemRandomSource, Clock, SystemClock
+from .tracing import traced
+
+CITIES = ["Нижний Новгород", "Санкт-Петербург", "Москва", "Анапа", "Кострома", "Владимир",
+          "Великий Устюг", "Вологда", "Архангельск"]
+
+HOTELS_DATA = {
+    "Архангельск": [
+        {"name": "Пур-Наволок", "type": "basic", "price": 3500, "rating": 3.8, "star": 3},
+        {"name": "Двина", "type": "premium", "price": 8000, "rating": 4.5, "star": 4}
+    ],
+    "Вологда": [
+        {"name": "Спасская", "type": "basic", "price": 3000, "rating": 4.0, "star": 3},
+        {"name": "Атриум", "type": "premium", "price": 7500, "rating": 4.7, "star": 4}
+    ],
+    "Великий Устюг": [
+        {"name": "Сухона", "type": "basic", "price": 2800, "rating": 3.9, "star": 2},
+        {"name": "Вотчина Деда Мороза", "type": "premium", "price": 10000, "rating": 4.8, "star": 4}
+    ],
+    "Владимир": [
+        {"name": "Заря", "type": "basic", "price": 3200, "rating": 3.7, "star": 3},
+        {"name": "Русская деревня", "type": "premium", "price": 8500, "rating": 4.6, "star": 4}
+    ],
+    "Кострома": [
+        {"name": "Волга", "type": "basic", "price": 3500, "rating": 4.1, "star": 3},
+        {"name": "Аристократ", "type": "premium", "price": 9000, "rating": 4.7, "star": 4}
+    ],
+    "Анапа": [
+        {"name": "Алые паруса", "type": "basic", "price": 4000, "rating": 4.2, "star": 3},
+        {"name": "Малая бухта", "type": "premium", "price": 15000, "rating": 4.9, "star": 5}
+    ],
+    "Москва": [
+        {"name": "Ибис", "type": "basic", "price": 5000, "rating": 4.0, "star": 3},
+        {"name": "Ritz-Carlton", "type": "premium", "price": 25000, "rating": 4.9, "star": 5},
+        {"name": "Метрополь", "type": "premium", "price": 30000, "rating": 4.8, "star": 5}
+    ],
+    "Санкт-Петербург": [
+        {"name": "Станция L1", "type": "basic", "price": 4500, "rating": 4.1, "star": 3},
+        {"name": "Коринтия", "type": "premium", "price": 20000, "rating": 4.9, "star": 5},
+        {"name": "Астория", "type": "premium", "price": 28000, "rating": 4.8, "star": 5}
+    ],
+    "Нижний Новгород": [
+        {"name": "Азимут", "type": "basic", "price": 3800, "rating": 3.9, "star": 3},
+        {"name": "Sheraton", "type": "premium", "price": 12000, "rating": 4.7, "star": 5}
+    ]
+}
+
+TOURS_DATA = {
+    "Архангельск": [
+        {"name": "Музей деревянного зодчества", "description": "Экскурсия в музей Малые Корелы", "price": 1500,
+         "season": "все", "type": "basic"},
+        {"name": "Северодвинск", "description": "Тур в город корабелов", "price": 3500,
+         "season": "лето", "type": "premium"}
+    ],
+    "Вологда": [
+        {"name": "Вологодский кремль", "description": "Обзорная экскурсия по кремлю", "price": 1200,
+         "season": "все", "type": "basic"},
+        {"name": "Музей кружева", "description": "Экскурсия в музей вологодского кружева", "price": 1800,
+         "season": "все", "type": "premium"}
+    ],
+    "Великий Устюг": [
+        {"name": "Резиденция Деда Мороза", "description": "Посещение вотчины Деда Мороза", "price": 2500,
+         "season": "зима", "type": "basic"},
+        {"name": "Обзорная экскурсия", "description": "Тур по историческому центру", "price": 2000,
+         "season": "все", "type": "basic"}
+    ],
+    "Владимир": [
+        {"name": "Золотые ворота", "description": "Экскурсия к памятнику ЮНЕСКО", "price": 1500,
+         "season": "все", "type": "basic"},
+        {"name": "Боголюбово", "description": "Поездка в церковь Покрова на Нерли", "price": 3000,
+         "season": "лето", "type": "premium"}
+    ],
+    "Кострома": [
+        {"name": "Ипатьевский монастырь", "description": "Экскурсия в исторический монастырь", "price": 1800,
+         "season": "все", "type": "basic"},
+        {"name": "Музей сыра", "description": "Дегустация костромских сыров", "price": 2500,
+         "season": "все", "type": "premium"}
+    ],
+    "Анапа": [
+        {"name": "Археологический музей", "description": "Экскурсия по античным находкам", "price": 1200,
+         "season": "все", "type": "basic"},
+        {"name": "Морская прогулка", "description": "Прогулка на катере вдоль побережья", "price": 3500,
+         "season": "лето", "type": "premium"}
+    ],
+    "Москва": [
+        {"name": "Красная площадь", "description": "Обзорная экскурсия", "price": 2000,
+         "season": "все", "type": "basic"},
+        {"name": "Третьяковская галерея", "description": "Экскурсия с искусствоведом", "price": 5000,
+         "season": "все", "type": "premium"},
+        {"name": "Москва-Сити", "description": "Тур по небоскребам с подъемом", "price": 6000,
+         "season": "все", "type": "premium"}
+    ],
+    "Санкт-Петербург": [
+        {"name": "Эрмитаж", "description": "Экскурсия по главному музею", "price": 3000,
+         "season": "все", "type": "basic"},
+        {"name": "Петергоф", "description": "Тур в летнюю резиденцию", "price": 4500,
+         "season": "лето", "type": "premium"},
+        {"name": "Белые ночи", "description": "Ночная экскурсия по разводным мостам", "price": 5000,
+         "season": "лето", "type": "premium"}
+    ],
+    "Нижний Новгород": [
+        {"name": "Нижегородский кремль", "description": "Обзорная экскурсия", "price": 1800,
+         "season": "все", "type": "basic"},
+        {"name": "Горьковские места", "description": "Литературный тур", "price": 2500,
+         "season": "все", "type": "premium"}
+    ]
+}
+
+
+class TravelService:
+    def __init__(self, inventory: Inventory | None = None, cache_size: int = 1024, cache_ttl: float = 60.0,
+                 fare_validity: float | None = None, random_source: RandomSource | None = None,
+                 clock: Clock | None = None):
+        self.factories = {
+            "basic": BasicTravel(),
+            "premium": PremiumTravel()
+        }
+
+        if inventory is None:
+            self.cities = list(CITIES)
+            inventory = Inventory({city: list(hotels) for city, hotels in HOTELS_DATA.items()},
+                                  {city: list(tours) for city, tours in TOURS_DATA.items()})
+        else:
+            self.cities = inventory.get_cities()
+        self.inventory = inventory
+        # Со SeededRandomSource и FixedClock поиск воспроизводим: одинаковый запрос дает те же билеты.
+        self.random_source = random_source or SystemRandomSource()
+        self.clock = clock or SystemClock()
+        self.availability = RoomAvailability(self.clock.today(), capacity_of=self.get_hotel_rooms)
+        self.fares = FareEngine(self.factories, self.get_season, today=self.clock.today)
+        self.booking_service = BookingService(self.availability, on_confirmed=self.fares.record_package)
+        self.search_cache = SearchCache(cache_size, cache_ttl)
+        # Полнотекстовый индекс строится при первом поиске и дальше пополняется вместе с каталогом.
+        self.search_index: SearchIndex | None = None
+        # Сгенерированные билеты кешируются только в пределах окна действия тарифа.
+        self.fare_validity = fare_validity
+
+        self.SimCardTariffs = ["basic", "premium"]
+        self.languages = ["русский", "английский"]
+
+    def get_season(self, travel_date: date) -> str:
+        month = travel_date.month
+        if month in [12, 1, 2]:
+            return "зима"
+        elif month in [3, 4, 5]:
+            return "весна"
+        elif month in [6, 7, 8]:
+            return "лето"
+        else:
+            return "осень"
+
+    @traced("service.generate_tickets")
+    def generate_tickets(self, departure: str, destination: str, date_forward: date, date_backward: date,
+                         package_type: str) -> List[Ticket]:
+        # В кеше лежат неизменяемые записи (время туда, время обратно, цена),
+        # билеты на каждый вызов создаются заново, и вызывающий может их менять.
+        if not self.fare_validity:
+            records = self.ticket_records(departure, destination, date_forward, date_backward, package_type)
+        else:
+            window = int(self.search_cache.clock() // self.fare_validity)
+            key = ("tickets", departure, destination, date_forward, date_backward, package_type, window)
+            records = self.search_cache.get_or_compute(
+                key, lambda: self.ticket_records(departure, destination, date_forward, date_backward, package_type),
+                self.fare_validity)
+        factory = self.factories[package_type]
+        return [self.make_ticket(factory, departure, destination, date_forward, date_backward, record)
+                for record in records]
+
+    def ticket_records(self, departure: str, destination: str, date_forward: date, date_backward: date,
+                       package_type: str,
+                       random_source: RandomSource | None = None) -> tuple[tuple[str, str, float], ...]:
+        records = []
+        factory = self.factories[package_type]
+        rng = (random_source or self.random_source).derive("tickets", departure, destination, date_forward,
+                                                           date_backward, package_type)
+        # Время и цену считают методы модели, для этого хватает одного черновика на все рейсы.
+        ticket = factory.create_ticket()
+        ticket.departure = departure
+        ticket.destination = destination
+        ticket.date_forward = date_forward
+        ticket.date_backward = date_backward
+
+        for i in range(factory.get_number_of_flights(rng)):
+            ticket.set_times(rng)
+            ticket.set_price(self.fares, i)
+
+            records.append((ticket.time_forward, ticket.time_backward, ticket.price))
+
+        return tuple(records)
+
+    def make_ticket(self, factory: TravelFactory, departure: str, destination: str, date_forward: date,
+                    date_backward: date, record: tuple[str, str, float]) -> Ticket:
+        ticket = factory.create_ticket()
+        ticket.departure = departure
+        ticket.destination = destination
+        ticket.date_forward = date_forward
+        ticket.date_backward = date_backward
+        ticket.time_forward, ticket.time_backward, ticket.price = record
+
+        return ticket
+
+    @traced("service.generate_ticket_batch")
+    def generate_ticket_batch(self, queries: list[tuple[str, str, date, date]], package_type: str,
+                              seed: int | None = None) -> TicketBatch:
+        if seed is None:
+            seed = self.random_source.seed_for("ticket_batch", package_type, *queries)
+        return generate_ticket_batch(self.factories[package_type], queries, seed, self.fares, package_type)
+
+    def get_hotel_rooms(self, city: str, name: str) -> int | None:
+        hotel_data = self.inventory.find_hotel(city, name)
+        if hotel_data is None:
+            return None
+        return hotel_data.get("rooms", DEFAULT_ROOMS)
+
+    def add_hotel(self, city: str, hotel_data: dict):
+        self.inventory.add_hotel(city, hotel_data)
+        self.availability.add_hotel(city, hotel_data["name"], hotel_data.get("rooms", DEFAULT_ROOMS))
+        if self.search_index is not None:
+            self.search_index.add_hotel(city, hotel_data)
+
+    def add_tour(self, city: str, tour_data: dict):
+        self.inventory.add_tour(city, tour_data)
+        if self.search_index is not None:
+            self.search_index.add_tour(city, tour_data)
+
+    def get_search_index(self) -> SearchIndex:
+        if self.search_index is None:
+            self.search_index = SearchIndex.from_inventory(self.inventory)
+        return self.search_index
+
+    @traced("service.search_catalogue")
+    def search_catalogue(self, query: str, limit: int = 20, kinds: list[str] | None = None,
+                         city: str | None = None, prefix: bool = False) -> list[SearchHit]:
+        return self.get_search_index().search(query, limit, kinds, city, prefix)
+
+    @traced("service.get_available_hotels")
+    def get_available_hotels(self, city: str, package_type: str, start_date: date, end_date: date,
+                             rooms: int = 1) -> List[Hotel]:
+        # Кешируются записи каталога, а не модели: каждый вызов получает свои объекты Hotel.
+        key = ("hotels", city, package_type, start_date, end_date, rooms, self.inventory.version,
+               self.availability.city_version(city))
+        records = self.search_cache.get_or_compute(
+            key, lambda: self._find_hotels(city, package_type, start_date, end_date, rooms))
+        factory = self.factories[package_type]
+        return [self.make_hotel(factory, city, hotel_data, start_date, end_date, rooms) for hotel_data in records]
+
+    def _find_hotels(self, city: str, package_type: str, start_date: date, end_date: date,
+                     rooms: int) -> tuple[dict, ...]:
+        city_hotels = self.inventory.get_hotels(city, package_type)
+        free = set(self.availability.filter_available(city, [hotel_data["name"] for hotel_data in city_hotels],
+                                                      start_date, end_date, rooms))
+        return tuple(hotel_data for hotel_data in city_hotels if hotel_data["name"] in free)
+
+    def make_hotel(self, factory: TravelFactory, city: str, hotel_data: dict, start_date: date, end_date: date,
+                   rooms: int = 1) -> Hotel:
+        hotel = factory.create_hotel()
+
+        hotel.name = hotel_data["name"]
+        hotel.city = city
+        hotel.price = hotel_data["price"]
+        hotel.rating = hotel_data["rating"]
+        hotel.star = hotel_data["star"]
+        hotel.check_in = start_date
+        hotel.check_out = end_date
+        hotel.rooms = rooms
+
+        return hotel
+
+    @traced("service.get_available_tours")
+    def get_available_tours(self, city: str, package_type: str, travel_date: date) -> List[Tour]:
+        season = self.get_season(travel_date)
+        key = ("tours", city, package_type, season, self.inventory.version)
+        records = self.search_cache.get_or_compute(
+            key, lambda: tuple(self.inventory.get_tours(city, season, package_type)))
+        factory = self.factories[package_type]
+        return [self.make_tour(factory, tour_data) for tour_data in records]
+
+    def make_tour(self, factory: TravelFactory, tour_data: dict) -> Tour:
+        tour = factory.create_tour()
+        tour.name = tour_data["name"]
+        tour.description = tour_data["description"]
+        tour.price = tour_data["price"]
+        tour.season = tour_data["season"]
+
+        return tour
+
+    @traced("service.get_available_services")
+    def get_available_services(self, city: str, duration: int, package_type: str) -> List[AdditionalServices]:
+        services = []
+
+        sim_card = SimCard(city, package_type)
+        services.append(sim_card)
+
+        transport_pass = BusPass(city, duration)
+        services.append(transport_pass)
+
+        for lang in self.languages:
+            guide_book = GuideBook(city, lang)
+            services.append(guide_book)
+
+        return services
+
+    def create_package_builder(self, package_type: str, reserve: bool = False) -> TravelPackageBuilder:
+        # Номера держит BookingService при подтверждении брони; reserve=True - для сборки
+        # пакета в обход него, иначе номер будет занят дважды.
+        factory = self.factories.get(package_type)
+        return TravelPackageBuilder(factory, self.availability if reserve else None)
@@ -0,0 +1,239 @@
+import bisect
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf"))
+RECENT_SPANS = 1000
+PROFILE_INTERVAL = 0.005
+
+
+class SpanStats:
+    __slots__ = ("count", "errors", "total", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+
+class Span:
+    __slots__ = ("tracer", "name", "parent", "start")
+
+    def __init__(self, tracer: "Tracer", name: str):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        stack = self.tracer.stack()
+        self.parent = stack[-1].name if stack else None
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        elapsed = time.perf_counter() - self.start
+        self.tracer.stack().pop()
+        self.tracer.record(self.name, elapsed, exc_type is not None, self.parent)
+        return False
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    # Выключенный трассировщик стоит одной проверки флага на вызов.
+    def __init__(self):
+        self.enabled = False
+        self.stats: dict[str, SpanStats] = {}
+        self.recent: deque = deque(maxlen=RECENT_SPANS)
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.profiler: SamplingProfiler | None = None
+        self.server = None
+
+    def stack(self) -> list[Span]:
+        stack = getattr(self.local, "stack", None)
+        if stack is None:
+            stack = self.local.stack = []
+        return stack
+
+    def span(self, name: str) -> Span | _NullSpan:
+        return Span(self, name) if self.enabled else NULL_SPAN
+
+    def record(self, name: str, elapsed: float, error: bool = False, parent: str | None = None):
+        if not self.enabled:
+            return
+        with self.lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = SpanStats()
+            stats.count += 1
+            stats.errors += error
+            stats.total += elapsed
+            stats.buckets[bisect.bisect_left(BUCKETS, elapsed)] += 1
+            self.recent.append((name, parent, threading.current_thread().name, elapsed))
+
+    def reset(self):
+        with self.lock:
+            self.stats.clear()
+            self.recent.clear()
+
+    def to_json(self) -> dict:
+        with self.lock:
+            return {
+                "spans": {name: {"count": stats.count, "errors": stats.errors, "total_seconds": stats.total,
+                                 "buckets": {str(le): count for le, count in zip(BUCKETS, stats.buckets)}}
+                          for name, stats in self.stats.items()},
+                "recent": [{"name": name, "parent": parent, "thread": thread, "seconds": elapsed}
+                           for name, parent, thread, elapsed in self.recent],
+            }
+
+    def to_prometheus(self) -> str:
+        lines = ["# HELP travel_agency_span_seconds Длительность операций сервиса и интерфейса.",
+                 "# TYPE travel_agency_span_seconds histogram"]
+        errors = ["# HELP travel_agency_span_errors_total Операции, завершившиеся исключением.",
+                  "# TYPE travel_agency_span_errors_total counter"]
+        with self.lock:
+            for name, stats in sorted(self.stats.items()):
+                cumulative = 0
+                for le, count in zip(BUCKETS, stats.buckets):
+                    cumulative += count
+                    bound = "+Inf" if le == float("inf") else repr(le)
+                    lines.append(f'travel_agency_span_seconds_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'travel_agency_span_seconds_sum{{span="{name}"}} {stats.total}')
+                lines.append(f'travel_agency_span_seconds_count{{span="{name}"}} {stats.count}')
+                errors.append(f'travel_agency_span_errors_total{{span="{name}"}} {stats.errors}')
+        return "\n".join(lines + errors) + "\n"
+
+    def start_profiler(self, interval: float = PROFILE_INTERVAL):
+        if self.profiler is None:
+            self.profiler = SamplingProfiler(interval)
+            self.profiler.start()
+
+    def stop_profiler(self):
+        if self.profiler is not None:
+            self.profiler.stop()
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> int:
+        # /metrics - формат Prometheus, /metrics.json - JSON, /profile - стеки профилировщика.
+        # http.server импортируется здесь: он заметно замедляет импорт ядра, а нужен только экспорту.
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        tracer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body, content_type = tracer.to_prometheus(), "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body, content_type = json.dumps(tracer.to_json(), ensure_ascii=False), "application/json"
+                elif self.path == "/profile" and tracer.profiler is not None:
+                    body, content_type = tracer.profiler.collapsed(), "text/plain"
+                else:
+                    self.send_error(404)
+                    return
+                payload = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self.server.serve_forever, name="metrics", daemon=True).start()
+        return self.server.server_address[1]
+
+    def shutdown(self):
+        self.stop_profiler()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+class SamplingProfiler:
+    # Раз в interval секунд снимает стеки всех потоков, кроме своего.
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        self.interval = interval
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self.running = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def start(self):
+        self.running.set()
+        self.thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running.clear()
+        if self.thread is not None:
+            self.thread.join()
+
+    def _run(self):
+        own = threading.get_ident()
+        while self.running.is_set():
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                self.samples[tuple(reversed(stack))] += 1
+            time.sleep(self.interval)
+
+    def top(self, n: int = 20) -> list[tuple[str, int]]:
+        own_time = Counter()
+        for stack, count in list(self.samples.items()):
+            own_time[stack[-1]] += count
+        return own_time.most_common(n)
+
+    def collapsed(self) -> str:
+        # Формат свернутых стеков, понятный flamegraph.pl и speedscope.
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in list(self.samples.items()))
+
+
+tracer = Tracer()
+
+
+def traced(name: str):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with Span(tracer, name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def configure_from_env():
+    # TRAVEL_AGENCY_TRACE=1 включает трассировку, TRAVEL_AGENCY_PROFILE=1 - профилировщик,
+    # TRAVEL_AGENCY_METRICS_PORT открывает страницу с метриками.
+    if os.environ.get("TRAVEL_AGENCY_TRACE") == "1":
+        tracer.enabled = True
+    if os.environ.get("TRAVEL_AGENCY_PROFILE") == "1":
+        tracer.start_profiler()
+    port = os.environ.get("TRAVEL_AGENCY_METRICS_PORT")
+    if port:
+        tracer.enabled = True
+        tracer.serve(int(port))
@@ -0,0 +1,148 @@
+import tkinter as tk
+from tkinter import ttk
+
+VISIBLE_ROWS = 5
+
+
+class OfferList(ttk.Frame):
+    # Список предложений с фиксированным набором строк: при прокрутке,
+    # сортировке и фильтрации меняется только текст строк, виджеты не создаются.
+    def __init__(self, master, describe, multiple: bool = False, rows: int = VISIBLE_ROWS,
+                 sort_keys: dict | None = None, filters: dict | None = None):
+        super().__init__(master)
+        self.describe = describe
+        self.multiple = multiple
+        self.items = []
+        self.texts = {}
+        self.view = []
+        self.offset = 0
+        self.sort_key = None
+        self.filter = None
+        self.selected_index = tk.IntVar(value=-1)
+        self.selected = set()
+
+        controls = ttk.Frame(self)
+        controls.grid(row=0, column=0, columnspan=2, sticky=tk.W)
+        if sort_keys:
+            self.sort_keys = sort_keys
+            ttk.Label(controls, text="Сортировка:").pack(side=tk.LEFT, padx=5)
+            self.sort_combo = ttk.Combobox(controls, values=list(sort_keys), state='readonly', width=14)
+            self.sort_combo.pack(side=tk.LEFT)
+            self.sort_combo.bind("<<ComboboxSelected>>", self.on_sort)
+        if filters:
+            self.filters = filters
+            ttk.Label(controls, text="Фильтр:").pack(side=tk.LEFT, padx=5)
+            self.filter_combo = ttk.Combobox(controls, values=list(filters), state='readonly', width=14)
+            self.filter_combo.current(0)
+            self.filter_combo.pack(side=tk.LEFT)
+            self.filter_combo.bind("<<ComboboxSelected>>", self.on_filter)
+
+        self.rows = []
+        self.row_vars = []
+        for r in range(rows):
+            if multiple:
+                var = tk.IntVar(value=0)
+                row = ttk.Checkbutton(self, variable=var, command=lambda r=r: self.toggle(r))
+                self.row_vars.append(var)
+            else:
+                row = ttk.Radiobutton(self, variable=self.selected_index)
+            row.grid(row=r + 1, column=0, sticky=tk.W)
+            row.grid_remove()
+            row.bind("<MouseWheel>", self.on_wheel)
+            row.bind("<Button-4>", self.on_wheel)
+            row.bind("<Button-5>", self.on_wheel)
+            self.rows.append(row)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_scroll)
+        self.scrollbar.grid(row=1, column=1, rowspan=rows, sticky=tk.NS)
+        self.columnconfigure(0, weight=1)
+        self.bind("<MouseWheel>", self.on_wheel)
+        self.bind("<Button-4>", self.on_wheel)
+        self.bind("<Button-5>", self.on_wheel)
+
+    def set_items(self, items: list):
+        self.items = items
+        self.texts = {}
+        self.selected_index.set(-1)
+        self.selected = set()
+        self.update_view()
+
+    def get_selected(self) -> int:
+        return self.selected_index.get()
+
+    def get_selected_items(self) -> list:
+        return [self.items[i] for i in sorted(self.selected)]
+
+    def update_view(self):
+        self.view = [i for i in range(len(self.items)) if self.filter is None or self.filter(self.items[i])]
+        if self.sort_key is not None:
+            key, reverse = self.sort_key
+            self.view.sort(key=lambda i: key(self.items[i]), reverse=reverse)
+        # Скрытые фильтром предложения снимаются с выбора, иначе они попали бы в пакет незаметно.
+        visible = set(self.view)
+        self.selected &= visible
+        if self.selected_index.get() not in visible:
+            self.selected_index.set(-1)
+        self.offset = 0
+        self.render()
+
+    def text(self, index: int) -> str:
+        text = self.texts.get(index)
+        if text is None:
+            text = self.texts[index] = self.describe(self.items[index])
+        return text
+
+    def render(self):
+        for r, row in enumerate(self.rows):
+            position = self.offset + r
+            if position >= len(self.view):
+                row.grid_remove()
+                continue
+            index = self.view[position]
+            if self.multiple:
+                self.row_vars[r].set(1 if index in self.selected else 0)
+                row.configure(text=self.text(index))
+            else:
+                row.configure(text=self.text(index), value=index)
+            row.grid()
+
+        if self.view:
+            self.scrollbar.set(self.offset / len(self.view),
+                               min(1.0, (self.offset + len(self.rows)) / len(self.view)))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, offset: int):
+        offset = max(0, min(offset, len(self.view) - len(self.rows)))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def toggle(self, r: int):
+        index = self.view[self.offset + r]
+        if self.row_vars[r].get():
+            self.selected.add(index)
+        else:
+            self.selected.discard(index)
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(round(float(amount) * len(self.view)))
+        elif unit == "pages":
+            self.scroll_to(self.offset + int(amount) * len(self.rows))
+        else:
+            self.scroll_to(self.offset + int(amount))
+
+    def on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.offset - 1)
+        else:
+            self.scroll_to(self.offset + 1)
+
+    def on_sort(self, event):
+        self.sort_key = self.sort_keys[self.sort_combo.get()]
+        self.update_view()
+
+    def on_filter(self, event):
+        self.filter = self.filters[self.filter_combo.get()]
+        self.update_view()